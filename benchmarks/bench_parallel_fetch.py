@@ -0,0 +1,84 @@
+# benchmarks/bench_parallel_fetch.py
+"""
+Tek sorgu ile paralel dilimli çekmeyi karşılaştırır.
+
+Örnek (yerel PostgreSQL):
+    python benchmarks/bench_parallel_fetch.py --host localhost --database test \\
+        --user postgres --password gizli --table public.islemler \\
+        --baslangic 2024-01-01 --bitis 2024-12-31 --parca 2 4 8
+
+Örnek (yerel SQLite; veri için generate_bench_data.py):
+    python benchmarks/bench_parallel_fetch.py --type sqlite --path /tmp/bench.db \
+        --table ISLEMLER --baslangic 2024-01-01 --bitis 2024-06-30
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.database import (  # noqa: E402
+    get_engine, dispose_all_engines, run_database_query, run_parallel_range_query
+)
+
+
+def olc(etiket, fn, tekrar):
+    sureler = []
+    satir = 0
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        df = fn()
+        sureler.append(time.perf_counter() - t0)
+        satir = len(df)
+        del df
+    en_iyi = min(sureler)
+    print(f"{etiket:<22} {satir:>10} satır  en iyi: {en_iyi:7.2f} sn  ortalama: {sum(sureler) / len(sureler):7.2f} sn")
+    return en_iyi
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paralel dilimli çekme karşılaştırması")
+    parser.add_argument("--type", default="postgres", choices=["postgres", "sql", "sqlite", "duckdb"])
+    parser.add_argument("--path", help="SQLite/DuckDB veritabanı dosyası")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", default="5432")
+    parser.add_argument("--database")
+    parser.add_argument("--user", default="postgres")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--table", required=True)
+    parser.add_argument("--tarih-sutunu", default="TARIH", help="Tarih aralığının uygulandığı sütun")
+    parser.add_argument("--baslangic", required=True, help="yyyy-MM-dd")
+    parser.add_argument("--bitis", required=True, help="yyyy-MM-dd")
+    parser.add_argument("--parca", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--tekrar", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.type in ('sqlite', 'duckdb'):
+        if not args.path:
+            parser.error(f"--type {args.type} için --path gerekli")
+        config = {'type': args.type, 'path': args.path}
+    else:
+        if not args.database:
+            parser.error(f"--type {args.type} için --database gerekli")
+        config = {
+            'type': args.type, 'host': args.host, 'port': args.port,
+            'database': args.database, 'user': args.user, 'password': args.password,
+        }
+    get_engine(config)  # Bağlantı kurulumu ölçüme dahil edilmesin
+
+    try:
+        tek = olc("Tek sorgu", lambda: run_database_query(
+            config, args.table, args.baslangic, args.bitis,
+            date_column_name=args.tarih_sutunu), args.tekrar)
+        for parca in args.parca:
+            sure = olc(f"Paralel ({parca} dilim)", lambda: run_parallel_range_query(
+                config, args.table, args.baslangic, args.bitis, parca_sayisi=parca,
+                date_column_name=args.tarih_sutunu), args.tekrar)
+            print(f"{'':<22} hızlanma: {tek / sure:5.2f}x")
+    finally:
+        dispose_all_engines()
+
+
+if __name__ == '__main__':
+    main()
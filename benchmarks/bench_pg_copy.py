@@ -0,0 +1,75 @@
+# benchmarks/bench_pg_copy.py
+"""
+PostgreSQL'de normal satır çekme ile COPY ... TO STDOUT toplu çekmeyi karşılaştırır.
+
+Örnek (yerel PostgreSQL):
+    python benchmarks/bench_pg_copy.py --host localhost --database test \\
+        --user postgres --password gizli --table public.islemler \\
+        --baslangic 2024-01-01 --bitis 2024-12-31
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.database import get_engine, dispose_all_engines, run_database_query  # noqa: E402
+from src.core.arrow_fetch import ARROW_VAR, run_arrow_query  # noqa: E402
+from src.core.pg_copy import run_copy_query, copy_available  # noqa: E402
+
+
+def olc(etiket, fn, tekrar):
+    sureler = []
+    satir = 0
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        df = fn()
+        sureler.append(time.perf_counter() - t0)
+        satir = len(df)
+        del df
+    en_iyi = min(sureler)
+    print(f"{etiket:<22} {satir:>10} satır  en iyi: {en_iyi:7.2f} sn  ortalama: {sum(sureler) / len(sureler):7.2f} sn")
+    return en_iyi
+
+
+def main():
+    parser = argparse.ArgumentParser(description="COPY ile toplu çekme karşılaştırması")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", default="5432")
+    parser.add_argument("--database", required=True)
+    parser.add_argument("--user", default="postgres")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--table", required=True)
+    parser.add_argument("--tarih-sutunu", default="TARIH", help="Tarih aralığının uygulandığı sütun")
+    parser.add_argument("--baslangic", required=True, help="yyyy-MM-dd")
+    parser.add_argument("--bitis", required=True, help="yyyy-MM-dd")
+    parser.add_argument("--tekrar", type=int, default=3)
+    args = parser.parse_args()
+
+    config = {
+        'type': 'postgres', 'host': args.host, 'port': args.port,
+        'database': args.database, 'user': args.user, 'password': args.password,
+    }
+    get_engine(config)  # Bağlantı kurulumu ölçüme dahil edilmesin
+
+    def aralik(fn, **kwargs):
+        return lambda: fn(config, args.table, args.baslangic, args.bitis,
+                          date_column_name=args.tarih_sutunu, **kwargs)
+
+    try:
+        normal = olc("Normal sorgu", aralik(run_database_query), args.tekrar)
+        sure = olc("COPY (NumPy)", aralik(run_copy_query), args.tekrar)
+        if not copy_available(config):
+            print("UYARI: COPY kullanılamadı; ölçüm normal sorguya düşmüş olabilir.")
+        print(f"{'':<22} hızlanma: {normal / sure:5.2f}x")
+        if ARROW_VAR:
+            arrow = olc("Arrow sorgu", aralik(run_arrow_query), args.tekrar)
+            sure = olc("COPY (Arrow)", aralik(run_copy_query, arrow=True), args.tekrar)
+            print(f"{'':<22} hızlanma: {arrow / sure:5.2f}x (Arrow sorguya göre)")
+    finally:
+        dispose_all_engines()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# benchmarks/bench_startup.py
+"""
+Uygulama açılış süresini ölçer: her ölçüm yeni bir Python sürecinde yapılır.
+
+    içe aktarma  : 'src.ui.main_window' modülünün yüklenme süresi
+    ilk çizim    : süreç başlangıcından pencerenin ilk kez çizilmesine kadar geçen süre
+    hazır        : ertelenmiş kurulumun (pandas, veri modelleri) bitmesine kadar geçen süre
+
+Ayrıca '-X importtime' çıktısından en pahalı modüller listelenir.
+
+Örnek:
+    python benchmarks/bench_startup.py --tekrar 5
+    python benchmarks/bench_startup.py --gercek-ekran   # offscreen yerine gerçek pencere
+"""
+import os
+import sys
+import time
+import json
+import argparse
+import statistics
+import subprocess
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Çocuk süreçte çalışan ölçüm kodu; sonuçları tek satır JSON olarak yazar
+OLCUM_KODU = r"""
+import json, time
+t_baslangic = time.time()
+from PyQt6.QtCore import QObject, QEvent, QTimer
+from PyQt6.QtWidgets import QApplication
+app = QApplication([])
+t0 = time.perf_counter()
+from src.ui.main_window import MainWindow
+t_import = time.perf_counter() - t0
+sonuc = {'import': t_import}
+
+class IlkCizim(QObject):
+    def eventFilter(self, nesne, olay):
+        if olay.type() == QEvent.Type.Paint and 'paint' not in sonuc:
+            sonuc['paint'] = time.time() - BASLANGIC
+        return False
+
+filtre = IlkCizim()
+app.installEventFilter(filtre)
+window = MainWindow()
+window.show()
+
+def bekle():
+    if 'paint' in sonuc and window._kurulum_tamam:
+        sonuc['ready'] = time.time() - BASLANGIC
+        print("SONUC " + json.dumps(sonuc), flush=True)
+        window.close()
+        app.quit()
+    else:
+        QTimer.singleShot(1, bekle)
+
+QTimer.singleShot(0, bekle)
+app.exec()
+"""
+
+
+def olc(gercek_ekran):
+    ortam = dict(os.environ)
+    if not gercek_ekran:
+        ortam['QT_QPA_PLATFORM'] = 'offscreen'
+    baslangic = time.time()
+    kod = f"BASLANGIC = {baslangic!r}\n" + OLCUM_KODU
+    cikti = subprocess.run([sys.executable, "-c", kod], cwd=KOK, env=ortam,
+                           capture_output=True, text=True, timeout=120)
+    for satir in cikti.stdout.splitlines():
+        if satir.startswith("SONUC "):
+            return json.loads(satir[6:])
+    raise RuntimeError(f"Ölçüm başarısız:\n{cikti.stdout}\n{cikti.stderr}")
+
+
+def en_pahali_moduller(adet):
+    """'-X importtime' çıktısından kümülatif süresi en yüksek üst düzey modüller."""
+    cikti = subprocess.run([sys.executable, "-X", "importtime", "-c", "import src.ui.main_window"],
+                           cwd=KOK, capture_output=True, text=True, timeout=120)
+    moduller = []
+    for satir in cikti.stderr.splitlines():
+        # Biçim: "import time: kendi | kümülatif | modül" (mikrosaniye); girinti iç içeliği gösterir
+        if not satir.startswith("import time:") or "cumulative" in satir:
+            continue
+        _, toplam, ad = satir.split("|", 2)
+        moduller.append((int(toplam), ad.rstrip()))
+    return sorted(moduller, reverse=True)[:adet]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Açılış süresi ölçümü")
+    parser.add_argument("--tekrar", type=int, default=5)
+    parser.add_argument("--gercek-ekran", action="store_true", help="offscreen yerine gerçek ekranı kullan")
+    parser.add_argument("--modul", type=int, default=12, help="Listelenecek pahalı modül sayısı")
+    args = parser.parse_args()
+
+    sonuclar = [olc(args.gercek_ekran) for _ in range(args.tekrar)]
+    for anahtar, etiket in (('import', "İçe aktarma"), ('paint', "İlk çizim"), ('ready', "Hazır")):
+        degerler = [s[anahtar] for s in sonuclar]
+        print(f"{etiket:<14} en iyi: {min(degerler) * 1000:8.1f} ms  ortanca: {statistics.median(degerler) * 1000:8.1f} ms")
+
+    print(f"\nEn pahalı {args.modul} modül (kümülatif, main_window içe aktarılırken):")
+    for toplam, ad in en_pahali_moduller(args.modul):
+        print(f"{toplam / 1000:8.1f} ms  {ad}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+# benchmarks/generate_bench_data.py
+"""
+Performans ölçümleri için yerel bir SQLite veya DuckDB veritabanında gerçekçi,
+çok milyon satırlı bir işlem tablosu üretir (TARIH sütunu indeksli).
+
+Günlük satır sayısı hafta içi/hafta sonu ve ay sonu yoğunluğuna göre değişir; metin
+sütunları farklı kardinalitelerdedir (az çeşitli kodlar, çok çeşitli açıklamalar),
+tutarlar çarpık (log-normal) dağılımlıdır ve bazı sütunlarda NULL değerler bulunur.
+
+Örnek:
+    python benchmarks/generate_bench_data.py --path /tmp/bench.db --satir 5000000
+    python benchmarks/generate_bench_data.py --type duckdb --path /tmp/bench.duckdb \\
+        --satir 20000000 --baslangic 2023-01-01 --gun 730
+"""
+import os
+import sys
+import time
+import sqlite3
+import argparse
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+SUBELER = [f"SB{i:03d}" for i in range(1, 61)]
+ISLEM_TURLERI = ["SATIS", "IADE", "HAVALE", "EFT", "TAHSILAT", "ODEME", "VIRMAN", "KOMISYON"]
+ISLEM_AGIRLIKLARI = [0.42, 0.05, 0.14, 0.12, 0.11, 0.09, 0.05, 0.02]
+PARA_BIRIMLERI = ["TRY", "USD", "EUR", "GBP"]
+PARA_AGIRLIKLARI = [0.86, 0.08, 0.05, 0.01]
+KANALLAR = ["SUBE", "INTERNET", "MOBIL", "ATM", "CAGRI_MERKEZI"]
+KANAL_AGIRLIKLARI = [0.18, 0.22, 0.48, 0.09, 0.03]
+ACIKLAMA_KALIPLARI = ["Fatura ödemesi", "Kira", "Maaş", "Market alışverişi", "Akaryakıt",
+                      "Online alışveriş", "Kredi kartı borcu", "Sigorta primi", "Aidat", "Bağış"]
+
+TABLO_SEMASI = {
+    'sqlite': """
+        CREATE TABLE "{tablo}" (
+            "ID" INTEGER PRIMARY KEY,
+            "TARIH" TIMESTAMP NOT NULL,
+            "SUBE_KODU" VARCHAR(5) NOT NULL,
+            "MUSTERI_NO" INTEGER NOT NULL,
+            "ISLEM_TURU" VARCHAR(10) NOT NULL,
+            "KANAL" VARCHAR(15),
+            "TUTAR" NUMERIC(14, 2) NOT NULL,
+            "PARA_BIRIMI" CHAR(3) NOT NULL,
+            "ACIKLAMA" VARCHAR(60),
+            "ONAYLANDI" BOOLEAN NOT NULL
+        )
+    """,
+    'duckdb': """
+        CREATE TABLE "{tablo}" (
+            "ID" BIGINT PRIMARY KEY,
+            "TARIH" TIMESTAMP NOT NULL,
+            "SUBE_KODU" VARCHAR NOT NULL,
+            "MUSTERI_NO" INTEGER NOT NULL,
+            "ISLEM_TURU" VARCHAR NOT NULL,
+            "KANAL" VARCHAR,
+            "TUTAR" DECIMAL(14, 2) NOT NULL,
+            "PARA_BIRIMI" VARCHAR NOT NULL,
+            "ACIKLAMA" VARCHAR,
+            "ONAYLANDI" BOOLEAN NOT NULL
+        )
+    """,
+}
+
+
+def gunluk_satir_sayilari(rng, baslangic, gun_sayisi, satir_sayisi):
+    """Toplam satırı günlere dağıtır: hafta sonu daha sakin, ay sonu daha yoğun."""
+    agirliklar = np.empty(gun_sayisi)
+    for i in range(gun_sayisi):
+        gun = baslangic + timedelta(days=i)
+        agirlik = 0.45 if gun.weekday() >= 5 else 1.0
+        if (gun + timedelta(days=1)).month != gun.month or gun.day == 15:
+            agirlik *= 1.8  # Maaş ve fatura günleri
+        agirliklar[i] = agirlik
+    return rng.multinomial(satir_sayisi, agirliklar / agirliklar.sum())
+
+
+def uret_parca(rng, gunler, sayilar, ilk_id):
+    """Verilen günler için sıralı zaman damgalı bir DataFrame parçası üretir."""
+    n = int(sayilar.sum())
+    gun_baslangici = np.repeat(np.array(gunler, dtype='datetime64[s]'), sayilar)
+    # Gün içi yoğunluk: mesai saatlerinde tepe yapan normal dağılım (saniye)
+    saniye = np.clip(rng.normal(14 * 3600, 4 * 3600, n), 0, 86_399).astype('int64')
+    tarih = gun_baslangici + saniye.astype('timedelta64[s]')
+    sira = np.lexsort((saniye, gun_baslangici))
+    tarih = tarih[sira]
+
+    musteri = (rng.pareto(1.2, n) * 1000).astype('int64') % 2_000_000 + 100_000
+    tutar = np.round(rng.lognormal(5.5, 1.4, n), 2)
+    islem = rng.choice(len(ISLEM_TURLERI), n, p=ISLEM_AGIRLIKLARI)
+    tutar[np.asarray(ISLEM_TURLERI)[islem] == "IADE"] *= -1
+
+    kanal = np.asarray(KANALLAR, dtype=object)[rng.choice(len(KANALLAR), n, p=KANAL_AGIRLIKLARI)]
+    kanal[rng.random(n) < 0.02] = None
+    aciklama = np.char.add(
+        np.asarray(ACIKLAMA_KALIPLARI)[rng.integers(0, len(ACIKLAMA_KALIPLARI), n)],
+        np.char.add(" #", rng.integers(1, 50_000, n).astype(str))
+    ).astype(object)
+    aciklama[rng.random(n) < 0.1] = None
+
+    return pd.DataFrame({
+        'ID': np.arange(ilk_id, ilk_id + n, dtype='int64'),
+        'TARIH': tarih,
+        'SUBE_KODU': np.asarray(SUBELER)[rng.integers(0, len(SUBELER), n)],
+        'MUSTERI_NO': musteri,
+        'ISLEM_TURU': np.asarray(ISLEM_TURLERI)[islem],
+        'KANAL': kanal,
+        'TUTAR': tutar,
+        'PARA_BIRIMI': np.asarray(PARA_BIRIMLERI)[rng.choice(len(PARA_BIRIMLERI), n, p=PARA_AGIRLIKLARI)],
+        'ACIKLAMA': aciklama,
+        'ONAYLANDI': rng.random(n) < 0.97,
+    })
+
+
+def parcalar(rng, baslangic, gun_sayisi, satir_sayisi, parca_boyutu):
+    """Günleri ardışık gruplar halinde yaklaşık 'parca_boyutu' satırlık parçalara böler."""
+    sayilar = gunluk_satir_sayilari(rng, baslangic, gun_sayisi, satir_sayisi)
+    ilk_id = 1
+    gunler, gun_sayilari = [], []
+    for i, sayi in enumerate(sayilar):
+        gunler.append(baslangic + timedelta(days=i))
+        gun_sayilari.append(sayi)
+        if sum(gun_sayilari) >= parca_boyutu or i == gun_sayisi - 1:
+            df = uret_parca(rng, gunler, np.asarray(gun_sayilari), ilk_id)
+            ilk_id += len(df)
+            yield df
+            gunler, gun_sayilari = [], []
+
+
+def yaz_sqlite(path, tablo, kaynak):
+    conn = sqlite3.connect(path)
+    try:
+        # Toplu yükleme: günlük kaydı ve fsync kapalı (dosya yalnızca ölçüm verisi)
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute(TABLO_SEMASI['sqlite'].format(tablo=tablo))
+        yer_tutucu = ", ".join("?" * 10)
+        for df in kaynak:
+            df['TARIH'] = df['TARIH'].dt.strftime('%Y-%m-%d %H:%M:%S')
+            df['ONAYLANDI'] = df['ONAYLANDI'].astype('int8')
+            conn.executemany(
+                f'INSERT INTO "{tablo}" VALUES ({yer_tutucu})',
+                df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+            )
+            yield len(df)
+        conn.execute(f'CREATE INDEX "IX_{tablo}_TARIH" ON "{tablo}" ("TARIH")')
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def yaz_duckdb(path, tablo, kaynak):
+    try:
+        import duckdb
+    except ImportError:
+        sys.exit("HATA: 'duckdb' paketi bulunamadı (pip install duckdb duckdb-engine).")
+    conn = duckdb.connect(path)
+    try:
+        conn.execute(TABLO_SEMASI['duckdb'].format(tablo=tablo))
+        for df in kaynak:
+            conn.register("parca", df)
+            conn.execute(f'INSERT INTO "{tablo}" SELECT * FROM parca')
+            conn.unregister("parca")
+            yield len(df)
+        conn.execute(f'CREATE INDEX "IX_{tablo}_TARIH" ON "{tablo}" ("TARIH")')
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel ölçüm veritabanı üreteci")
+    parser.add_argument("--type", default="sqlite", choices=["sqlite", "duckdb"])
+    parser.add_argument("--path", required=True, help="Oluşturulacak veritabanı dosyası")
+    parser.add_argument("--table", default="ISLEMLER")
+    parser.add_argument("--satir", type=int, default=5_000_000, help="Toplam satır sayısı")
+    parser.add_argument("--baslangic", default="2024-01-01", help="İlk gün (yyyy-MM-dd)")
+    parser.add_argument("--gun", type=int, default=365, help="Gün sayısı")
+    parser.add_argument("--parca", type=int, default=500_000, help="Bir seferde üretilen satır sayısı")
+    parser.add_argument("--tohum", type=int, default=42, help="Rastgele sayı tohumu (tekrarlanabilir veri)")
+    parser.add_argument("--uzerine-yaz", action="store_true", help="Dosya varsa silip yeniden oluştur")
+    args = parser.parse_args()
+
+    if os.path.exists(args.path):
+        if not args.uzerine_yaz:
+            sys.exit(f"HATA: '{args.path}' zaten var. Üzerine yazmak için --uzerine-yaz kullanın.")
+        os.remove(args.path)
+
+    rng = np.random.default_rng(args.tohum)
+    kaynak = parcalar(rng, date.fromisoformat(args.baslangic), args.gun, args.satir, args.parca)
+    yazici = yaz_sqlite if args.type == 'sqlite' else yaz_duckdb
+
+    t0 = time.perf_counter()
+    toplam = 0
+    for yazilan in yazici(args.path, args.table, kaynak):
+        toplam += yazilan
+        print(f"\r{toplam:>12,} / {args.satir:,} satır yazıldı", end="", flush=True)
+    print(f"\nTamamlandı: {args.path} ({os.path.getsize(args.path) / 1024 ** 2:,.1f} MB, "
+          f"{time.perf_counter() - t0:.1f} sn). Tablo: {args.table}, tarih sütunu: TARIH")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,11 +2,10 @@
 import sys
 from PyQt6.QtWidgets import QApplication
 from src.ui.main_window import MainWindow  # Yeni yerinden import et
-from src.core.utils import register_pdf_fonts # (utils.py'ye taşıyacağız)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
-    register_pdf_fonts()  # Register fonts for PDF generation
+    # PDF fontları ilk PDF dışa aktarımında kaydedilir; ağır modüller pencere göründükten sonra yüklenir
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
@@ -1,4 +1,11 @@
 # This makes the src directory a Python package
-from . import core
-from . import ui
-from . import threading
\ No newline at end of file
+# Alt paketler ilk erişimde yüklenir (PEP 562); 'import src' tek başına hiçbir şey yüklemez.
+import importlib
+
+_ALT_PAKETLER = ('core', 'ui', 'threading')
+
+
+def __getattr__(name):
+    if name in _ALT_PAKETLER:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
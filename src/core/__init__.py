@@ -1,4 +1,45 @@
 # This makes the core directory a Python package
-from .utils import register_pdf_fonts
-from .database import get_database_tables, run_database_query, load_excel_file
-from .file_exporter import get_yeni_kayit_yolu, task_run_excel, task_run_pdf
\ No newline at end of file
+# Alt modüller ilk kullanıldıklarında yüklenir (PEP 562): 'from src.core import X' yalnızca
+# X'in bulunduğu modülü içe aktarır; pandas/SQLAlchemy gibi ağır bağımlılıklar açılışı yavaşlatmaz.
+import importlib
+
+_ALT_MODULLER = {
+    'utils': ('register_pdf_fonts',),
+    'database': (
+        'get_database_tables', 'get_table_columns', 'run_database_query', 'stream_database_query',
+        'load_excel_file', 'run_parallel_range_query', 'explain_query', 'get_engine', 'dispose_engine',
+        'dispose_all_engines', 'config_key', 'date_column_candidates', 'default_date_column',
+        'VARSAYILAN_TARIH_SUTUNU',
+    ),
+    'query_cache': ('result_cache', 'cached_database_query', 'cached_stream_query', 'store_query_result'),
+    'arrow_fetch': ('run_arrow_query', 'ARROW_VAR'),
+    'pg_copy': ('run_copy_query',),
+    'fanout': ('run_fanout_query', 'union_results', 'make_target', 'BAGLANTI_BASINA_SINIR'),
+    'schema_cache': ('schema_catalog', 'refresh_database_tables', 'cached_table_columns', 'cached_table_info'),
+    'file_exporter': ('get_yeni_kayit_yolu', 'task_run_excel', 'task_run_pdf', 'scan_saved_reports'),
+    'browse': ('get_primary_key', 'fetch_keyset_page', 'keyset_order_columns', 'GOZATMA_SAYFA_BOYUTU'),
+    'report_cache': ('report_cache', 'get_cached_report', 'store_report', 'prefetch_reports'),
+    'mirror': ('local_mirror', 'sync_mirror', 'remove_mirror', 'AYNALANABILIR_TURLER'),
+    'preflight': ('estimate_result_size', 'choose_strategy', 'BUYUK_SONUC_SINIRI'),
+    'aggregation': ('run_aggregate_query', 'AGGREGATE_FUNCTIONS', 'TIME_BUCKETS'),
+    'sorting': ('compute_sort_order',),
+    'data_processor': ('optimized',),
+}
+
+# Dışa açılan ad -> tanımlandığı alt modül
+_ADLAR = {ad: modul for modul, adlar in _ALT_MODULLER.items() for ad in adlar}
+
+__all__ = sorted(_ADLAR)
+
+
+def __getattr__(name):
+    modul = _ADLAR.get(name)
+    if modul is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    deger = getattr(importlib.import_module(f".{modul}", __name__), name)
+    globals()[name] = deger  # Sonraki erişimler doğrudan modül sözlüğünden okunur
+    return deger
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ADLAR))
@@ -0,0 +1,123 @@
+# src/core/aggregation.py
+
+from .database import (
+    read_sql_timed, quote_identifier, format_table_name, range_predicate, VARSAYILAN_TARIH_SUTUNU
+)
+
+# Kullanıcının seçebileceği toplama fonksiyonları
+AGGREGATE_FUNCTIONS = ("SUM", "COUNT", "AVG", "MIN", "MAX")
+
+# Zaman dilimleri: anahtar -> arayüzde gösterilen ad
+TIME_BUCKETS = {
+    None: "Yok",
+    'hour': "Saat",
+    'day': "Gün",
+    'month': "Ay",
+}
+
+# Tarih sütun adına eklenen kısa ek (ör. TARIH_GUN)
+_BUCKET_SUFFIX = {'hour': "SAAT", 'day': "GUN", 'month': "AY"}
+
+
+def bucket_expression(db_type, column_sql, bucket):
+    """Tarih sütununu verilen zaman dilimine (saat/gün/ay) indiren, veritabanına özgü ifade."""
+    if db_type in ('postgres', 'duckdb'):
+        return f"date_trunc('{bucket}', {column_sql})"
+    if db_type == 'sqlite':
+        if bucket == 'hour':
+            return f"strftime('%Y-%m-%d %H:00:00', {column_sql})"
+        if bucket == 'day':
+            return f"date({column_sql})"
+        return f"strftime('%Y-%m-01', {column_sql})"
+    if db_type == 'sql':
+        if bucket == 'hour':
+            return f"DATEADD(hour, DATEDIFF(hour, 0, {column_sql}), 0)"
+        if bucket == 'day':
+            return f"CAST({column_sql} AS date)"
+        return f"DATEFROMPARTS(YEAR({column_sql}), MONTH({column_sql}), 1)"
+    if db_type == 'access':
+        gun = f"DateSerial(Year({column_sql}), Month({column_sql}), Day({column_sql}))"
+        if bucket == 'hour':
+            return f"{gun} + TimeSerial(Hour({column_sql}), 0, 0)"
+        if bucket == 'day':
+            return gun
+        return f"DateSerial(Year({column_sql}), Month({column_sql}), 1)"
+    raise ValueError(f"Desteklenmeyen veritabanı türü: {db_type}")
+
+
+def aggregate_expression(db_type, function, column):
+    """Toplama ifadesi: COUNT(*), SUM("Tutar") vb."""
+    function = function.upper()
+    if function not in AGGREGATE_FUNCTIONS:
+        raise ValueError(f"Desteklenmeyen toplama fonksiyonu: {function}")
+    if column == '*':
+        if function != "COUNT":
+            raise ValueError(f"'*' yalnızca COUNT ile kullanılabilir ({function}).")
+        return "COUNT(*)"
+    column_sql = quote_identifier(db_type, column)
+    if function == "AVG" and db_type == 'sql':
+        # SQL Server tamsayı sütunların ortalamasını tamsayıya yuvarlar
+        column_sql = f"CAST({column_sql} AS float)"
+    return f"{function}({column_sql})"
+
+
+def aggregate_alias(function, column):
+    return f"{function.upper()}_{'TUMU' if column == '*' else column}"
+
+
+def build_aggregate_query(db_type, target_table, baslangic_tarihi, bitis_tarihi,
+                          group_by=None, bucket=None, aggregates=None,
+                          date_column_name=VARSAYILAN_TARIH_SUTUNU):
+    """
+    Gruplama sorgusunun (sql, params) ikilisini üretir.
+    Gruplama veritabanında yapılır; ağ üzerinden yalnızca özet satırlar gelir.
+    SQL Server ve Access GROUP BY içinde takma ad kabul etmediği için ifadeler tekrarlanır.
+    """
+    group_by = list(group_by or [])
+    aggregates = list(aggregates or [("COUNT", "*")])
+    if bucket is not None and bucket not in _BUCKET_SUFFIX:
+        raise ValueError(f"Desteklenmeyen zaman dilimi: {bucket}")
+
+    select_parts = []
+    group_exprs = []
+
+    if bucket:
+        expr = bucket_expression(db_type, quote_identifier(db_type, date_column_name), bucket)
+        alias = quote_identifier(db_type, f"{date_column_name}_{_BUCKET_SUFFIX[bucket]}")
+        select_parts.append(f"{expr} AS {alias}")
+        group_exprs.append(expr)
+
+    for column in group_by:
+        column_sql = quote_identifier(db_type, column)
+        select_parts.append(column_sql)
+        group_exprs.append(column_sql)
+
+    for function, column in aggregates:
+        expr = aggregate_expression(db_type, function, column)
+        select_parts.append(f"{expr} AS {quote_identifier(db_type, aggregate_alias(function, column))}")
+
+    where_sql, params = range_predicate(db_type, date_column_name, baslangic_tarihi, bitis_tarihi)
+    sql_query = (
+        f"SELECT {', '.join(select_parts)} "
+        f"FROM {format_table_name(db_type, target_table)} "
+        f"WHERE {where_sql}"
+    )
+    if group_exprs:
+        sql_query += f" GROUP BY {', '.join(group_exprs)} ORDER BY {', '.join(group_exprs)}"
+    return sql_query, params
+
+
+def run_aggregate_query(config, target_table, baslangic_tarihi, bitis_tarihi,
+                        group_by=None, bucket=None, aggregates=None,
+                        date_column_name=VARSAYILAN_TARIH_SUTUNU):
+    """(Worker Görevi) Özet (gruplama) sorgusunu veritabanında çalıştırır."""
+    print(f"Çalışan iş parçacığı: Özet sorgusu başlatıldı. Tablo: {target_table}")
+
+    sql_query, params = build_aggregate_query(
+        config.get('type'), target_table, baslangic_tarihi, bitis_tarihi,
+        group_by=group_by, bucket=bucket, aggregates=aggregates, date_column_name=date_column_name
+    )
+    df = read_sql_timed(config, sql_query, params, label=f"{target_table} (özet)")
+
+    print(f"Çalışan iş parçacığı: Özet sorgusu bitti. {len(df)} satır bulundu.")
+    return df
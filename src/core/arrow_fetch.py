@@ -0,0 +1,180 @@
+# src/core/arrow_fetch.py
+
+import re
+
+import pandas as pd
+from sqlalchemy import text
+
+from .database import (
+    get_engine, config_key, build_range_query, VARSAYILAN_TARIH_SUTUNU, AKIS_PARCA_BOYUTU
+)
+from .diagnostics import QueryTimer, record_query
+from .schema_cache import cached_table_info
+
+# Arrow sütunları, Parquet önbelleği ve Arrow tabanlı çekme için pyarrow gerekir
+try:
+    import pyarrow as pa
+    ARROW_VAR = True
+except ImportError:
+    pa = None
+    ARROW_VAR = False
+    print("UYARI: 'pyarrow' kütüphanesi bulunamadı. Arrow tabanlı çekme kapalı, "
+          "sorgu önbelleği diske pickle olarak yazılacak.")
+
+_ONDALIK = re.compile(r"^(?:NUMERIC|DECIMAL)\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)")
+
+# Tip adının ilk sözcüğü (parantez ve ekler hariç) ile eşleştirilir; önek eşleştirmesi
+# INTERVAL / INT4RANGE gibi tipleri yanlışlıkla tamsayı sayardı
+_TAMSAYI_TIPLERI = {"BIGINT", "INTEGER", "INT", "SMALLINT", "TINYINT", "MEDIUMINT", "INT2", "INT4", "INT8",
+                    "SERIAL", "BIGSERIAL", "SMALLSERIAL", "SERIAL4", "SERIAL8"}
+_KAYAN_TIPLER = {"FLOAT", "REAL", "DOUBLE", "FLOAT4", "FLOAT8"}
+_MANTIKSAL_TIPLER = {"BOOLEAN", "BOOL"}
+_ZAMAN_TIPLERI = {"DATETIME", "DATETIME2", "SMALLDATETIME", "TIMESTAMP"}
+_METIN_TIPLERI = {"VARCHAR", "NVARCHAR", "CHAR", "NCHAR", "TEXT", "NTEXT", "CHARACTER", "STRING", "UUID",
+                  "UNIQUEIDENTIFIER"}
+
+
+def arrow_type(type_name):
+    """
+    Yansıtılan (reflected) SQL tip adına karşılık gelen Arrow tipini döndürür.
+    Tanınmayan tiplerde None döner; o sütunun tipi değerlerden çıkarılır.
+    """
+    t = str(type_name).upper().strip()
+    taban = re.split(r"[\s(]", t, maxsplit=1)[0]
+    if taban in _TAMSAYI_TIPLERI:
+        return pa.int64()
+    if taban in _KAYAN_TIPLER:
+        return pa.float64()
+    # SQL Server BIT mantıksaldır; BIT(n) / BIT VARYING (PostgreSQL) bit dizisidir
+    if taban in _MANTIKSAL_TIPLER or t == "BIT":
+        return pa.bool_()
+    eslesme = _ONDALIK.match(t)
+    if eslesme and int(eslesme.group(1)) <= 38:
+        return pa.decimal128(int(eslesme.group(1)), int(eslesme.group(2)))
+    if taban in ("MONEY", "SMALLMONEY"):
+        return pa.decimal128(19, 4)
+    if (taban == "TIMESTAMP" and "WITH TIME ZONE" in t) or taban in ("DATETIMEOFFSET", "TIMESTAMPTZ"):
+        return pa.timestamp('us', tz='UTC')
+    if taban in _ZAMAN_TIPLERI:
+        return pa.timestamp('us')
+    if t == "DATE":
+        return pa.date32()
+    if taban in _METIN_TIPLERI:
+        return pa.string()
+    return None
+
+
+def _column_array(values, tip):
+    """
+    Bir sütunun Python değerlerinden Arrow dizisi oluşturur.
+    Bildirilen tip tutmazsa (ör. sürücü farklı tip döndürdüyse) tip değerlerden çıkarılır ve
+    bildirilen tipe dönüştürülmeye çalışılır (ör. SQLite'ın metin tarihleri, 0/1 mantıksal değerleri);
+    o da olmazsa değerler metne çevrilir.
+    """
+    if tip is not None:
+        try:
+            return pa.array(values, type=tip)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            pass
+    try:
+        dizi = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+    if tip is not None:
+        try:
+            return dizi.cast(tip)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+    return dizi
+
+
+def column_type_names(config, target_table, names):
+    """
+    Sonuç sütunlarının SQL tip adlarını tablo yapısından (katalogdan) okur.
+    Bulunamayan sütunlar için boş metin döner.
+    """
+    try:
+        info = cached_table_info(config, target_table)
+    except Exception as e:
+        print(f"UYARI: Tablo yapısı okunamadı, tipler değerlerden çıkarılacak: {e}")
+        return [""] * len(names)
+    tipler = {c['name']: c['type'] for c in info['columns']}
+    tipler_kucuk = {ad.lower(): tip for ad, tip in tipler.items()}
+    return [tipler.get(ad, tipler_kucuk.get(str(ad).lower(), "")) for ad in names]
+
+
+def _column_types(config, target_table, names):
+    """Sonuç sütunları için Arrow tiplerini döndürür (tanınmayanlar None)."""
+    return [arrow_type(tip) for tip in column_type_names(config, target_table, names)]
+
+
+def run_arrow_query(config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+                    date_column_name=VARSAYILAN_TARIH_SUTUNU, batch_size=AKIS_PARCA_BOYUTU):
+    """
+    (Worker Görevi) Tarih aralığı sorgusunu Arrow tabanlı çalıştırır.
+    Satırlar parça parça okunup tablo yapısındaki SQL tiplerine göre Arrow dizilerine çevrilir;
+    sonuç sütunları pd.ArrowDtype'tır (metin, ondalık ve tarih değerleri Python nesnesi olarak tutulmaz).
+    """
+    print(f"Çalışan iş parçacığı: Arrow sorgusu başlatıldı. Tablo: {target_table}")
+
+    sql_query, params = build_range_query(
+        config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name
+    )
+    timer = QueryTimer()
+    parcalar = []
+    with timer.phase('engine'):
+        engine = get_engine(config)
+        conn = engine.connect()
+    with conn:
+        with timer.phase('execute'):
+            result = conn.execute(text(sql_query), params)
+        names = list(result.keys())
+        tipler = _column_types(config, target_table, names)
+
+        asama = 'first_row'
+        while True:
+            with timer.phase(asama):
+                rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            with timer.phase('dataframe'):
+                sutunlar = list(zip(*rows))
+                del rows
+                parcalar.append(pa.table(
+                    [_column_array(list(degerler), tip) for degerler, tip in zip(sutunlar, tipler)],
+                    names=names
+                ))
+            asama = 'fetch'
+
+    with timer.phase('dataframe'):
+        if parcalar:
+            # Tipi değerlerden çıkarılan sütunlar parçadan parçaya farklı olabilir (ör. tamamı boş parça)
+            tablo = pa.concat_tables(parcalar, promote_options="permissive")
+        else:
+            tablo = pa.table({ad: pa.array([], type=tip or pa.null()) for ad, tip in zip(names, tipler)})
+        df = tablo.to_pandas(types_mapper=pd.ArrowDtype)
+
+    record_query(f"{target_table} (arrow)", config.get('type'), config_key(config)[:12],
+                 sql_query, params, len(df), timer)
+    print(f"Çalışan iş parçacığı: Arrow sorgusu bitti. {len(df)} satır bulundu.")
+    return df
+
+
+def is_arrow_frame(df):
+    return len(df.columns) > 0 and all(isinstance(t, pd.ArrowDtype) for t in df.dtypes)
+
+
+def to_backend(df, arrow):
+    """
+    DataFrame'i istenen sütun tipine çevirir: arrow=True -> pd.ArrowDtype, False -> NumPy tipleri.
+    Önbellekten gelen parçalarla yeni çekilen parçaların birleştirilebilmesi için kullanılır.
+    """
+    if not ARROW_VAR or len(df.columns) == 0:
+        return df
+    if arrow:
+        if is_arrow_frame(df):
+            return df
+        return pa.Table.from_pandas(df, preserve_index=False).to_pandas(types_mapper=pd.ArrowDtype)
+    if not any(isinstance(t, pd.ArrowDtype) for t in df.dtypes):
+        return df
+    return pa.Table.from_pandas(df, preserve_index=False).to_pandas(ignore_metadata=True)
@@ -0,0 +1,156 @@
+# src/core/browse.py
+
+import pandas as pd
+
+from .database import (
+    read_sql_timed, quote_identifier, format_table_name, range_predicate, VARSAYILAN_TARIH_SUTUNU
+)
+from .schema_cache import cached_table_info
+
+# Gözatma modunda bir sayfadaki satır sayısı
+GOZATMA_SAYFA_BOYUTU = 2_000
+
+
+def get_primary_key(config, target_table):
+    """(Worker Görevi) Tablonun birincil anahtar sütunlarını döndürür."""
+    columns = cached_table_info(config, target_table)['primary_key']
+    if not columns:
+        raise ValueError(
+            f"'{target_table}' tablosunda birincil anahtar bulunamadı. "
+            "Sayfalı gözatma için satırları tekil olarak sıralayan bir anahtar gereklidir."
+        )
+    return columns
+
+
+def keyset_order_columns(primary_key, sort_column=None, date_column_name=VARSAYILAN_TARIH_SUTUNU):
+    """
+    Sayfalama sırasını belirleyen sütunlar: (sıralama sütunu veya tarih sütunu) + birincil anahtar.
+    Birincil anahtar sırayı tekil kıldığı için imleç (cursor) hiçbir satırı atlamaz.
+    """
+    order = [sort_column or date_column_name]
+    order += [c for c in primary_key if c not in order]
+    return order
+
+
+def _to_python(value):
+    """numpy/pandas skalerlerini veritabanı sürücülerinin tanıdığı Python tiplerine çevirir (boşlar None)."""
+    if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+def row_key(df, order_columns, row=-1):
+    """Sayfadaki bir satırın (varsayılan: son satır) imleç anahtarını döndürür."""
+    record = df.iloc[row]
+    return tuple(_to_python(record[c]) for c in order_columns)
+
+
+def _null_flag(db_type, column):
+    """Sütun NULL ise 1, değilse 0 veren ifade (NULL'ları her iki yönde de sona almak için)."""
+    sutun = quote_identifier(db_type, column)
+    if db_type == 'access':
+        return f"IIF({sutun} IS NULL, 1, 0)"
+    return f"(CASE WHEN {sutun} IS NULL THEN 1 ELSE 0 END)"
+
+
+def _sort_keys(db_type, order_columns, nullable_columns, after_key=None):
+    """
+    Sıralama anahtarları [(sql_ifadesi, azalan_mı_ters, değer), ...]. Boş olabilen her sütunun
+    önüne, her zaman artan sıralanan bir NULL bayrağı eklenir: NULL satırlar sona gelir ve
+    imleç onları da gezer. 'after_key' verilmezse değerler None'dır.
+    """
+    keys = []
+    for i, column in enumerate(order_columns):
+        value = after_key[i] if after_key is not None else None
+        if column in nullable_columns:
+            keys.append((_null_flag(db_type, column), True, int(value is None)))
+        keys.append((quote_identifier(db_type, column), False, value))
+    return keys
+
+
+def _keyset_predicate(keys, descending, add_param):
+    """
+    (a, b, c) > (x, y, z) karşılaştırmasını tüm veritabanlarında çalışan açık biçimde yazar:
+    a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+    İmleçteki değeri NULL olan anahtarda eşitlik 'IS NULL' olur; o anahtar için '>' dalı
+    yazılmaz (NULL bloğu yalnızca sonraki anahtarlarla sıralıdır).
+    """
+    ors = []
+    for i, (expr, always_asc, value) in enumerate(keys):
+        if value is None:
+            continue
+        op = ">" if always_asc or not descending else "<"
+        parts = [
+            f"{keys[j][0]} IS NULL" if keys[j][2] is None else f"{keys[j][0]} = {add_param(keys[j][2])}"
+            for j in range(i)
+        ]
+        parts.append(f"{expr} {op} {add_param(value)}")
+        ors.append("(" + " AND ".join(parts) + ")")
+    return "(" + " OR ".join(ors) + ")" if ors else "(1 = 0)"
+
+
+def build_keyset_query(db_type, target_table, baslangic_tarihi, bitis_tarihi, order_columns,
+                       descending=False, after_key=None, page_size=GOZATMA_SAYFA_BOYUTU,
+                       columns=None, date_column_name=VARSAYILAN_TARIH_SUTUNU):
+    """
+    Bir sonraki sayfayı OFFSET kullanmadan getiren sorgunun (sql, params) ikilisini üretir.
+    Sunucu yalnızca imlecin sonrasındaki 'page_size' satırı okur; sayfa numarası
+    ne kadar büyük olursa olsun maliyet aynıdır.
+    """
+    where_sql, params = range_predicate(db_type, date_column_name, baslangic_tarihi, bitis_tarihi)
+
+    def add_param(value):
+        name = f"k{len(params)}"
+        params[name] = value
+        return f":{name}"
+
+    # Sıra = (sıralama sütunu veya tarih sütunu) + birincil anahtar (bkz. keyset_order_columns).
+    # Tarih sütunu aralık koşulu, anahtar sütunları tanımı gereği boş olamaz; yalnızca
+    # kullanıcının seçtiği sıralama sütunu NULL içerebilir
+    nullable_columns = [c for c in order_columns[:1] if c != date_column_name]
+    keys = _sort_keys(db_type, order_columns, nullable_columns, after_key)
+
+    conditions = [where_sql]
+    if after_key is not None:
+        conditions.append(_keyset_predicate(keys, descending, add_param))
+
+    if columns:
+        select_columns = list(columns) + [c for c in order_columns if c not in columns]
+        select_list = ", ".join(quote_identifier(db_type, c) for c in select_columns)
+    else:
+        select_list = "*"
+
+    direction = "DESC" if descending else "ASC"
+    order_sql = ", ".join(f"{expr} {'ASC' if always_asc else direction}" for expr, always_asc, _ in keys)
+    page_size = int(page_size)
+
+    if db_type == 'postgres':
+        top, limit = "", f" LIMIT {page_size}"
+    elif db_type == 'sql':
+        top, limit = f"TOP ({page_size}) ", ""
+    elif db_type == 'access':
+        top, limit = f"TOP {page_size} ", ""
+    else:
+        top, limit = "", f" LIMIT {page_size}"
+
+    sql_query = (
+        f"SELECT {top}{select_list} FROM {format_table_name(db_type, target_table)} "
+        f"WHERE {' AND '.join(conditions)} ORDER BY {order_sql}{limit}"
+    )
+    return sql_query, params
+
+
+def fetch_keyset_page(config, target_table, baslangic_tarihi, bitis_tarihi, order_columns,
+                      descending=False, after_key=None, page_size=GOZATMA_SAYFA_BOYUTU, columns=None,
+                      date_column_name=VARSAYILAN_TARIH_SUTUNU):
+    """(Worker Görevi) Gözatma modunda imleçten (after_key) sonraki bir sayfayı çeker."""
+    sql_query, params = build_keyset_query(
+        config.get('type'), target_table, baslangic_tarihi, bitis_tarihi, order_columns,
+        descending=descending, after_key=after_key, page_size=page_size, columns=columns,
+        date_column_name=date_column_name
+    )
+    return read_sql_timed(config, sql_query, params, label=f"{target_table} (sayfa)")
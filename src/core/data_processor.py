@@ -1,21 +1,110 @@
-from sqlalchemy import create_engine, inspect
+import re
+import functools
+
+import numpy as np
 import pandas as pd
 
-try:
-    import python_calamine
-    EXCEL_ENGINE = "calamine"
-    print("Hızlı Excel motoru (python-calamine) bulundu.")
-except ImportError:
-    EXCEL_ENGINE = "openpyxl" # Calamine yoksa varsayılana dön
-    print("UYARI: 'python-calamine' kütüphanesi bulunamadı. pip install python-calamine")
-    print("Hızlı Excel okuma için varsayılan (yavaş) motor 'openpyxl' kullanılacak.")
 
+# --- BELLEK OPTİMİZASYONU ---
+# Benzersiz değer oranı bu değerin altındaki metin sütunları 'category' yapılır
+KATEGORI_ORANI = 0.5
+
+# Tarih gibi görünen metinler: 2024-01-31, 2024-01-31 13:45:00, 31.01.2024, 31/01/2024 13:45
+_ISO_TARIH = re.compile(r"^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?$")
+_TR_TARIH = re.compile(r"^\d{2}[./]\d{2}[./]\d{4}( \d{2}:\d{2}(:\d{2})?)?$")
+
+
+def _downcast_numeric(series):
+    """Tamsayıları en küçük uygun tipe indirir; ondalıkları yalnızca kayıpsızsa float32 yapar."""
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return pd.to_numeric(series, downcast='integer')
+    if pd.api.types.is_float_dtype(series.dtype) and series.dtype != np.float32:
+        kucuk = series.astype(np.float32)
+        # float32 ~7 basamak taşır; tutar gibi değerlerde hassasiyet kaybına izin verme
+        if np.array_equal(kucuk.to_numpy(dtype=np.float64), series.to_numpy(), equal_nan=True):
+            return kucuk
+    return series
+
+
+def _parse_dates(series, dolu):
+    """Tüm değerleri tarih biçimindeki metin sütununu datetime64'e çevirir; olmazsa None döner."""
+    ornek = dolu.iloc[:100]
+    if ornek.str.match(_ISO_TARIH).all():
+        tarihler = pd.to_datetime(series, errors='coerce', format='ISO8601')
+    elif ornek.str.match(_TR_TARIH).all():
+        tarihler = pd.to_datetime(series, errors='coerce', dayfirst=True, format='mixed')
+    else:
+        return None
+    # Çevrilemeyen tek bir değer bile varsa sütun olduğu gibi kalır
+    if tarihler.notna().sum() != len(dolu):
+        return None
+    return tarihler
+
+
+def _optimize_object(series, kategori_orani):
+    """Metin sütununu tarihe veya kategoriye çevirir; uygun değilse olduğu gibi döndürür."""
+    dolu = series.dropna()
+    if dolu.empty or pd.api.types.infer_dtype(dolu, skipna=True) != 'string':
+        return series  # Karışık tipler (ör. datetime.date, Decimal) dokunulmadan kalır
+
+    tarihler = _parse_dates(series, dolu)
+    if tarihler is not None:
+        return tarihler
+
+    if dolu.nunique() <= kategori_orani * len(series):
+        return series.astype('category')
+    return series
+
+
+def optimize_dataframe(df, kategori_orani=KATEGORI_ORANI):
+    """
+    (Worker Görevi) DataFrame'in bellek kullanımını küçültür:
+    sayısal sütunları küçük tiplere indirir, tekrar eden metinleri 'category' yapar,
+    tarih biçimindeki metin sütunlarını datetime64'e çevirir.
+    (df, rapor) döndürür; rapor {'once', 'sonra', 'sutunlar': {sütun: (eski_tip, yeni_tip)}}.
+    """
+    once = int(df.memory_usage(index=True, deep=True).sum())
+    yeni = {}
+    degisen = {}
+    for sutun in df.columns:
+        series = df[sutun]
+        if isinstance(series.dtype, pd.ArrowDtype) or pd.api.types.is_bool_dtype(series.dtype):
+            continue  # Arrow sütunları zaten sıkı tutulur
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            sonuc = _downcast_numeric(series)
+        elif series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+            sonuc = _optimize_object(series, kategori_orani)
+        else:
+            continue
+        if sonuc.dtype != series.dtype:
+            yeni[sutun] = sonuc
+            degisen[str(sutun)] = (str(series.dtype), str(sonuc.dtype))
+
+    if yeni:
+        df = df.copy(deep=False)  # Çağıranın DataFrame'i değişmesin; veriler kopyalanmaz
+        for sutun, series in yeni.items():
+            df[sutun] = series
+    sonra = int(df.memory_usage(index=True, deep=True).sum())
+
+    rapor = {'once': once, 'sonra': sonra, 'sutunlar': degisen}
+    print(f"Çalışan iş parçacığı: Bellek optimizasyonu {once / 1024**2:.1f} MB -> {sonra / 1024**2:.1f} MB "
+          f"({len(degisen)} sütun dönüştürüldü).")
+    return df, rapor
 
 
-# --- YENİ GÖREV: EXCEL OKUMA (Calamine ile) ---
-def _task_run_excel_load(self, tam_yol):
-    """(Worker) Excel okuma işi (Calamine motoruyla)"""
-    print(f"Çalışan iş parçacığı: Excel okuma başlatıldı -> {tam_yol}")
-    df = pd.read_excel(tam_yol, engine=EXCEL_ENGINE)
-    print(f"Çalışan iş parçacığı: Excel okuma bitti. {len(df)} satır bulundu.")
-    return df
+def optimized(task):
+    """
+    Bir worker görevini, döndürdüğü DataFrame'i optimize_dataframe'den geçirecek şekilde sarar.
+    Rapor sonucun attrs['bellek_raporu'] alanına yazılır.
+    """
+    @functools.wraps(task)
+    def gorev(*args, **kwargs):
+        df = task(*args, **kwargs)
+        if df is None:  # Görev iptal edildi
+            return df
+        df, rapor = optimize_dataframe(df)
+        # Sonuç önbellekteki ortak nesne olabilir; attrs yalnızca bu kopyaya yazılır
+        df = df.copy(deep=False)
+        df.attrs['bellek_raporu'] = rapor
+        return df
+    return gorev
@@ -1,24 +1,107 @@
 # src/core/database.py
 
+import os
 import urllib.parse
-from sqlalchemy import create_engine, inspect
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from sqlalchemy import create_engine, inspect, text
 import pandas as pd
 
-# Calamine motorunu kontrol et
-try:
-    import python_calamine
-    EXCEL_ENGINE = "calamine"
-    print("Hızlı Excel motoru (python-calamine) bulundu.")
-except ImportError:
-    EXCEL_ENGINE = "openpyxl"
-    print("UYARI: 'python-calamine' kütüphanesi bulunamadı. Hızlı Excel okuma için 'openpyxl' kullanılacak.")
+from .diagnostics import QueryTimer, record_query, publish
+
+# Excel okuma motoru: ilk Excel okumasında bir kez belirlenir (açılışta denetlenmez)
+_excel_motoru = None
+_excel_motoru_kilidi = threading.Lock()
+
+
+def excel_engine():
+    """Calamine kuruluysa hızlı 'calamine' motorunu, değilse 'openpyxl'i döndürür (bir kez denetlenir)."""
+    global _excel_motoru
+    with _excel_motoru_kilidi:
+        if _excel_motoru is None:
+            try:
+                import python_calamine
+                _excel_motoru = "calamine"
+                print("Hızlı Excel motoru (python-calamine) bulundu.")
+            except ImportError:
+                _excel_motoru = "openpyxl"
+                print("UYARI: 'python-calamine' kütüphanesi bulunamadı. Hızlı Excel okuma için 'openpyxl' kullanılacak.")
+        return _excel_motoru
+
+# --- Motor (Engine) Havuzu Ayarları ---
+# Bu anahtarlar 'config' içinde verilirse varsayılanların yerine geçer.
+# Bağlantı kimliğinin (anahtarın) parçası DEĞİLDİR.
+VARSAYILAN_HAVUZ_AYARLARI = {
+    'pool_size': 5,          # Havuzda açık tutulacak bağlantı sayısı
+    'max_overflow': 10,      # Yoğunlukta açılabilecek ek bağlantı sayısı
+    'pool_pre_ping': True,   # Kopmuş bağlantıları kullanmadan önce yakala
+    'pool_recycle': 1800,    # Saniye; sunucu tarafı zaman aşımlarından önce yenile
+}
+
+# Tarih aralığı sorgularında, tablo için başka bir sütun seçilmemişse kullanılan sütun
+VARSAYILAN_TARIH_SUTUNU = "TARIH"
+
+# Akış (streaming) modunda ilk parça küçük tutulur ki ilk satırlar hemen gösterilsin
+AKIS_ILK_PARCA = 1_000
+AKIS_PARCA_BOYUTU = 50_000
+
+# Normalize edilmiş config anahtarı -> SQLAlchemy engine
+_engine_registry = {}
+_engine_registry_lock = threading.Lock()
+# Bağlantı başına oluşturma kilidi: farklı sunuculara bağlanmak birbirini beklemez
+_engine_creation_locks = {}
+
+
+def normalize_config(config):
+    """
+    Bağlantı ayarlarını karşılaştırılabilir hale getirir.
+    Havuz ayarları ve boş değerler atılır, metinler kırpılır.
+    """
+    normal = {}
+    for key, value in (config or {}).items():
+        if key in VARSAYILAN_HAVUZ_AYARLARI or value in (None, ""):
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if key in ('type', 'host'):
+                value = value.lower()
+        normal[key] = value
+    return normal
+
+
+def config_key(config):
+    """Normalize edilmiş bağlantı ayarlarının özetini (hash) döndürür."""
+    normal = normalize_config(config)
+    raw = json.dumps(normal, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _pool_options(config):
+    """'config' içindeki havuz ayarlarını varsayılanlarla birleştirir."""
+    options = dict(VARSAYILAN_HAVUZ_AYARLARI)
+    for key in VARSAYILAN_HAVUZ_AYARLARI:
+        if config.get(key) is not None:
+            options[key] = config[key]
+    return options
+
+
+def connection_capacity(config):
+    """Bağlantı havuzunun aynı anda açabileceği en fazla bağlantı sayısı."""
+    pool_options = _pool_options(config)
+    return pool_options['pool_size'] + max(pool_options['max_overflow'], 0)
+
 
 def create_db_engine(config):
     """
     Gelen 'config' sözlüğüne göre doğru SQLAlchemy motorunu (engine) oluşturur.
     Her veritabanı türü kendi 'try-except' bloğu içinde güvenli bir şekilde ele alınır.
+    NOT: Sorgular için doğrudan bunu değil, havuzlanmış motoru veren get_engine'i kullanın.
     """
     db_type = config.get('type')
+    pool_options = _pool_options(config)
     
     try:
         if db_type == "access":
@@ -31,7 +114,9 @@ def create_db_engine(config):
                 rf"Dbq={db_path};"
             )
             quoted_connection_string = urllib.parse.quote_plus(connection_string)
-            engine = create_engine(f"access+pyodbc:///?odbc_connect={quoted_connection_string}")
+            engine = create_engine(
+                f"access+pyodbc:///?odbc_connect={quoted_connection_string}", **pool_options
+            )
         
         elif db_type == "sql":
             driver = "ODBC Driver 17 for SQL Server"
@@ -48,7 +133,7 @@ def create_db_engine(config):
                 "&encrypt=yes"                  
                 "&trust_server_certificate=yes" 
             )
-            engine = create_engine(engine_url)
+            engine = create_engine(engine_url, **pool_options)
             
         elif db_type == "postgres":
             # PostgreSQL User/Pass mantığı
@@ -56,7 +141,27 @@ def create_db_engine(config):
                 f"postgresql+psycopg2://{config.get('user')}:{config.get('password')}@"
                 f"{config.get('host')}:{config.get('port')}/{config.get('database')}"
             )
-            engine = create_engine(engine_url)
+            engine = create_engine(engine_url, **pool_options)
+
+        elif db_type == "sqlite":
+            db_path = config.get('path')
+            if not db_path or not os.path.isfile(db_path):
+                # sqlite3 olmayan dosyayı sessizce boş veritabanı olarak oluşturur; bunu engelle
+                raise ValueError(f"SQLite veritabanı dosyası bulunamadı: {db_path}")
+            # Havuzdaki bağlantılar farklı iş parçacıklarında (Worker) kullanılır
+            engine = create_engine(
+                f"sqlite:///{db_path}", connect_args={'check_same_thread': False}, **pool_options
+            )
+
+        elif db_type == "duckdb":
+            # duckdb ve duckdb_engine paketleri gerekir (pip install duckdb duckdb-engine)
+            db_path = config.get('path')
+            if not db_path or not os.path.isfile(db_path):
+                raise ValueError(f"DuckDB veritabanı dosyası bulunamadı: {db_path}")
+            # Salt okunur: başka bir süreç (ör. veri üreteci) dosyayı açık tutsa da okunabilsin
+            engine = create_engine(
+                f"duckdb:///{db_path}", connect_args={'read_only': True}, **pool_options
+            )
 
         else:
             raise ValueError(f"Desteklenmeyen veritabanı türü: {db_type}")
@@ -73,84 +178,545 @@ def create_db_engine(config):
         # Hatanın ana arayüzde gösterilmesi için orijinal hatayı (e) yükselt
         raise e
 
+def get_engine(config):
+    """
+    Aynı bağlantı ayarları için paylaşılan (havuzlanmış) motoru döndürür.
+    İlk çağrıda motor oluşturulup test edilir; sonraki çağrılar bağlantı
+    kurma ve el sıkışma maliyetini atlar. Worker'lar arasında güvenle paylaşılır.
+    Motor oluşturma (bağlantı testi) yalnızca aynı bağlantı ayarlarını bekletir.
+    """
+    key = config_key(config)
+    with _engine_registry_lock:
+        engine = _engine_registry.get(key)
+        if engine is not None:
+            return engine
+        creation_lock = _engine_creation_locks.setdefault(key, threading.Lock())
+    with creation_lock:
+        with _engine_registry_lock:
+            engine = _engine_registry.get(key)
+        if engine is None:
+            engine = create_db_engine(config)
+            with _engine_registry_lock:
+                _engine_registry[key] = engine
+    return engine
+
+def dispose_engine(config):
+    """Verilen bağlantı ayarlarına ait motoru (varsa) havuzdan çıkarıp kapatır."""
+    if not config:
+        return
+    with _engine_registry_lock:
+        engine = _engine_registry.pop(config_key(config), None)
+    if engine is not None:
+        engine.dispose()
+        print(f"'{config.get('type')}' bağlantı havuzu kapatıldı.")
+
+def dispose_all_engines():
+    """Uygulama kapanırken tüm bağlantı havuzlarını kapatır."""
+    with _engine_registry_lock:
+        engines = list(_engine_registry.values())
+        _engine_registry.clear()
+    for engine in engines:
+        engine.dispose()
+
+# Listelenmeyecek sistem şemaları (PostgreSQL ve SQL Server)
+SISTEM_SEMALARI = (
+    'pg_catalog', 'information_schema', # PostgreSQL
+    'guest', 'INFORMATION_SCHEMA', 'sys', # SQL Server
+    'db_owner', 'db_accessadmin', 'db_securityadmin', 'db_ddladmin', 
+    'db_backupoperator', 'db_datareader', 'db_datawriter', 
+    'db_denydatareader', 'db_denydatawriter'
+)
+
+# Tüm kullanıcı tablolarını şema, yaklaşık satır sayısı ve boyutla birlikte tek sorguda okur.
+# Satır sayıları istatistiklerden gelir (COUNT(*) çalıştırılmaz).
+# PostgreSQL'de bölümler (partition) ayrı tablo olarak listelenmez; bölümlenmiş tablonun
+# satır sayısı ve boyutu yaprak bölümlerinin toplamıdır.
+_KATALOG_SORGULARI = {
+    'postgres': """
+        SELECT n.nspname AS schema_name, c.relname AS table_name,
+               CASE WHEN c.relkind = 'p' THEN
+                        (SELECT SUM(GREATEST(pc.reltuples, 0))::bigint
+                         FROM pg_partition_tree(c.oid) pt
+                         JOIN pg_catalog.pg_class pc ON pc.oid = pt.relid
+                         WHERE pt.isleaf)
+                    WHEN c.reltuples < 0 THEN NULL
+                    ELSE c.reltuples::bigint END AS row_count,
+               CASE WHEN c.relkind = 'p' THEN
+                        (SELECT SUM(pg_total_relation_size(pt.relid))::bigint
+                         FROM pg_partition_tree(c.oid) pt WHERE pt.isleaf)
+                    ELSE pg_total_relation_size(c.oid) END AS total_bytes
+        FROM pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relkind IN ('r', 'p') AND NOT c.relispartition
+          AND n.nspname <> 'information_schema' AND left(n.nspname, 3) <> 'pg_'
+        ORDER BY n.nspname, c.relname
+    """,
+    'sql': """
+        SELECT s.name AS schema_name, t.name AS table_name,
+               (SELECT SUM(p.rows) FROM sys.partitions p
+                WHERE p.object_id = t.object_id AND p.index_id IN (0, 1)) AS row_count,
+               (SELECT CAST(SUM(a.total_pages) AS bigint) * 8192
+                FROM sys.partitions p
+                JOIN sys.allocation_units a ON a.container_id = p.partition_id
+                WHERE p.object_id = t.object_id) AS total_bytes
+        FROM sys.tables t
+        JOIN sys.schemas s ON s.schema_id = t.schema_id
+        WHERE t.is_ms_shipped = 0
+        ORDER BY s.name, t.name
+    """,
+    # SQLite satır sayısı istatistiği tutmaz; tek şema vardır
+    'sqlite': """
+        SELECT NULL AS schema_name, name AS table_name, NULL AS row_count, NULL AS total_bytes
+        FROM sqlite_master
+        WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+        ORDER BY name
+    """,
+    'duckdb': """
+        SELECT schema_name, table_name, estimated_size AS row_count, NULL AS total_bytes
+        FROM duckdb_tables()
+        WHERE NOT internal AND database_name = current_database()
+        ORDER BY schema_name, table_name
+    """,
+}
+
+
+def _table_entry(schema_name, table_name, row_count=None, total_bytes=None):
+    """Tablo listesindeki tek bir kayıt. 'name' sorgularda kullanılan 'şema.tablo' adıdır."""
+    return {
+        'name': f"{schema_name}.{table_name}" if schema_name else table_name,
+        'schema': schema_name,
+        'table': table_name,
+        'rows': int(row_count) if row_count is not None else None,
+        'bytes': int(total_bytes) if total_bytes is not None else None,
+    }
+
+
+def _inspector_tables(engine, db_type):
+    """Katalog sorgusu olmayan veritabanları için inspector ile listeleme (şema başına bir sorgu)."""
+    inspector = inspect(engine)
+    if db_type == 'access':
+        # Access'in sistem tablolarını filtrele
+        return [_table_entry(None, name) for name in inspector.get_table_names()
+                if not name.startswith("MSys")]
+
+    all_tables = []
+    for schema_name in inspector.get_schema_names():
+        if schema_name not in SISTEM_SEMALARI and not schema_name.startswith('pg_'):
+            for table_name in inspector.get_table_names(schema=schema_name):
+                all_tables.append(_table_entry(schema_name, table_name))
+    return all_tables
+
+
 def get_database_tables(config):
-    """(Worker Görevi) Veritabanına bağlanır ve tablo isimlerini döndürür."""
+    """
+    (Worker Görevi) Veritabanına bağlanır ve kullanıcı tablolarını döndürür.
+    Her tablo {'name', 'schema', 'table', 'rows', 'bytes'} sözlüğüdür; satır sayısı ve
+    boyut yaklaşık değerlerdir ve bilinmiyorsa None olur.
+    PostgreSQL, SQL Server, SQLite ve DuckDB'de liste tek bir katalog sorgusuyla okunur.
+    """
     print(f"Çalışan iş parçacığı: Tablo listesi çekiliyor -> {config.get('type')}")
     
-    engine = create_db_engine(config)
-    inspector = inspect(engine)
-    
-    all_tables = []
+    engine = get_engine(config)
     db_type = config.get('type')
-    
-    if db_type == 'access':
-        # --- ACCESS MANTIĞI (Basit) ---
-        table_names = inspector.get_table_names()
-        # Access'in sistem tablolarını filtrele
-        user_tables = [name for name in table_names if not name.startswith("MSys")]
-        all_tables = user_tables
+    katalog_sorgusu = _KATALOG_SORGULARI.get(db_type)
+
+    if katalog_sorgusu is None:
+        all_tables = _inspector_tables(engine, db_type)
     else:
-        # --- SQL SERVER / POSTGRESQL MANTIĞI (Şemalı) ---
-        schema_names = inspector.get_schema_names()
-        
-        system_schemas = [
-            'pg_catalog', 'information_schema', # PostgreSQL
-            'guest', 'INFORMATION_SCHEMA', 'sys', # SQL Server
-            'db_owner', 'db_accessadmin', 'db_securityadmin', 'db_ddladmin', 
-            'db_backupoperator', 'db_datareader', 'db_datawriter', 
-            'db_denydatareader', 'db_denydatawriter'
+        with engine.connect() as connection:
+            rows = connection.exec_driver_sql(katalog_sorgusu).fetchall()
+        all_tables = [
+            _table_entry(schema_name, table_name, row_count, total_bytes)
+            for schema_name, table_name, row_count, total_bytes in rows
+            if schema_name not in SISTEM_SEMALARI
         ]
-        
-        for schema_name in schema_names:
-            if schema_name not in system_schemas and not schema_name.startswith('pg_'):
-                tables_in_schema = inspector.get_table_names(schema=schema_name)
-                for table_name in tables_in_schema:
-                    # Tablo adını "şema.tablo" formatında ekle
-                    all_tables.append(f"{schema_name}.{table_name}")
-
-    print(f"Çalışan iş parçacığı: Bulunan tablolar: {all_tables}")
+
+    print(f"Çalışan iş parçacığı: {len(all_tables)} tablo bulundu.")
     return all_tables, engine
 
-def run_database_query(config, target_table, baslangic_tarihi, bitis_tarihi):
-    """(Worker Görevi) Veritabanında tarih aralığı sorgusu çalıştırır."""
-    
-    print(f"Çalışan iş parçacığı: Sorgulama başlatıldı. Tablo: {target_table}")
-    
-    engine = create_db_engine(config)
+def next_day(tarih):
+    """'yyyy-MM-dd' tarihinden bir sonraki günü aynı formatta döndürür."""
+    return (date.fromisoformat(str(tarih)[:10]) + timedelta(days=1)).isoformat()
+
+def split_table_name(target_table):
+    """'şema.tablo' biçimindeki adı (şema, tablo) olarak ayırır; şema yoksa None döner."""
+    if '.' in target_table:
+        schema_name, table_name = target_table.split('.', 1)
+        return schema_name, table_name
+    return None, target_table
+
+def quote_identifier(db_type, name):
+    """Tablo/sütun adını veritabanı türüne uygun şekilde tırnak içine alır."""
+    if db_type == 'access':
+        return "[" + str(name).replace("]", "]]") + "]"
+    return '"' + str(name).replace('"', '""') + '"'
+
+def format_table_name(db_type, target_table):
+    """Tablo adını (varsa şemasıyla) SQL'de kullanılacak biçime getirir."""
+    if db_type == 'access':
+        return quote_identifier(db_type, target_table)
+    schema_name, table_name = split_table_name(target_table)
+    if schema_name:
+        return f"{quote_identifier(db_type, schema_name)}.{quote_identifier(db_type, table_name)}"
+    return quote_identifier(db_type, table_name)
+
+def _select_list(db_type, columns, date_column_name):
+    """SELECT listesini üretir. Sütun seçilmemişse '*'; tarih sütunu her zaman dahil edilir."""
+    if not columns:
+        return "*"
+    columns = list(columns)
+    if date_column_name not in columns:
+        columns.insert(0, date_column_name)
+    return ", ".join(quote_identifier(db_type, c) for c in columns)
+
+def range_bounds(baslangic_tarihi, bitis_tarihi):
+    """
+    'yyyy-MM-dd' gün aralığını yarı açık [başlangıç 00:00, bitiş+1 gün 00:00) sınırlarına çevirir.
+    Sınırlar datetime nesneleridir; sürücü bunları tarih/saat parametresi olarak gönderir,
+    sunucu sütunu metne çevirmek zorunda kalmaz ve indeks kullanılabilir.
+    """
+    bas = date.fromisoformat(str(baslangic_tarihi)[:10])
+    bit_haric = date.fromisoformat(next_day(bitis_tarihi))
+    return datetime.combine(bas, datetime.min.time()), datetime.combine(bit_haric, datetime.min.time())
+
+def range_predicate(db_type, date_column_name, baslangic_tarihi, bitis_tarihi):
+    """
+    Yarı açık tarih aralığı koşulunu (where_sql, params) olarak döndürür.
+    Koşul sütunun kendisine uygulanır (fonksiyon/dönüşüm yok), böylece tarih sütunundaki
+    indeks aralık taramasıyla (index seek) kullanılabilir. Parametreler SQLAlchemy text()
+    biçimindedir (:ad); sürücünün kendi parametre stiline SQLAlchemy çevirir.
+    """
+    formatted_date_column = quote_identifier(db_type, date_column_name)
+    baslangic, bitis_haric = range_bounds(baslangic_tarihi, bitis_tarihi)
+    if db_type == 'sqlite':
+        # SQLite tarihleri metin olarak saklar; 'yyyy-MM-dd' sınırı hem yalnız tarih hem de
+        # 'yyyy-MM-dd HH:MM:SS' / ISO 'T' biçimli değerlerle metin sırasında doğru karşılaştırılır
+        baslangic, bitis_haric = baslangic.date().isoformat(), bitis_haric.date().isoformat()
+    where_sql = f"{formatted_date_column} >= :baslangic AND {formatted_date_column} < :bitis"
+    return where_sql, {"baslangic": baslangic, "bitis": bitis_haric}
+
+def build_range_query(config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+                       date_column_name=VARSAYILAN_TARIH_SUTUNU):
+    """
+    Tarih aralığı sorgusunun SQL metnini ve parametrelerini (sql, params) döndürür.
+    Aralık yarı açıktır (>= başlangıç AND < bitiş+1 gün): bitiş günü saatli kayıtlarıyla
+    birlikte tamamen dahil edilir ve günlük parçalar birbiriyle çakışmaz.
+    'columns' verilirse SELECT * yerine yalnızca bu sütunlar çekilir.
+    """
     db_type = config.get('type')
+
+    formatted_table_name = format_table_name(db_type, target_table)
+    formatted_date_column = quote_identifier(db_type, date_column_name)
+    select_list = _select_list(db_type, columns, date_column_name)
+    where_sql, params = range_predicate(db_type, date_column_name, baslangic_tarihi, bitis_tarihi)
+
+    # Access: [Tablo] [Sütun]; PostgreSQL/SQL Server: "şema"."tablo" "Sütun"
+    sql_query = f"SELECT {select_list} FROM {formatted_table_name} WHERE {where_sql} ORDER BY {formatted_date_column}"
+    return sql_query, params
+
+def _inspector_target(config, target_table):
+    """Inspector çağrıları için (şema, tablo) ikilisi; Access'te şema yoktur."""
+    if config.get('type') == 'access':
+        return None, target_table
+    return split_table_name(target_table)
+
+def get_table_info(config, target_table):
+    """
+    (Worker Görevi) Tablonun sütunlarını, birincil anahtarını ve indekslerini okur.
+    Dönüş: {'columns': [{'name', 'type'}], 'primary_key': [...], 'indexes': [{'name', 'columns', 'unique'}]}
+    """
+    print(f"Çalışan iş parçacığı: Tablo yapısı okunuyor -> {target_table}")
+    engine = get_engine(config)
+    inspector = inspect(engine)
+    schema_name, table_name = _inspector_target(config, target_table)
+
+    columns = inspector.get_columns(table_name, schema=schema_name)
+
+    # Bazı sürücüler (ör. Access) anahtar/indeks bilgisini desteklemez
+    try:
+        pk = inspector.get_pk_constraint(table_name, schema=schema_name) or {}
+    except NotImplementedError:
+        pk = {}
+    try:
+        indexes = inspector.get_indexes(table_name, schema=schema_name)
+    except NotImplementedError:
+        indexes = []
+
+    return {
+        'columns': [{'name': c['name'], 'type': str(c['type'])} for c in columns],
+        'primary_key': list(pk.get('constrained_columns') or []),
+        'indexes': [
+            {
+                'name': ix.get('name'),
+                'columns': [c for c in ix.get('column_names') or [] if c is not None],
+                'unique': bool(ix.get('unique')),
+            }
+            for ix in indexes
+        ],
+    }
+
+def get_table_columns(config, target_table):
+    """(Worker Görevi) Tablonun sütunlarını [{'name': ..., 'type': ...}, ...] olarak döndürür."""
+    print(f"Çalışan iş parçacığı: Sütunlar okunuyor -> {target_table}")
+    engine = get_engine(config)
+    inspector = inspect(engine)
+    schema_name, table_name = _inspector_target(config, target_table)
+    columns = inspector.get_columns(table_name, schema=schema_name)
+    return [{'name': c['name'], 'type': str(c['type'])} for c in columns]
+
+def is_date_type(type_name):
+    """Yansıtılan (reflected) tip adı tarih veya tarih-saat mi? (Yalnız saat tipleri hariç.)"""
+    type_name = str(type_name).upper()
+    return 'DATE' in type_name or type_name.startswith('TIMESTAMP')
+
+def date_column_candidates(table_info):
+    """
+    Tarih aralığı sorgusunda kullanılabilecek sütunları sıralı olarak döndürür:
+    önce bir indeksin (veya birincil anahtarın) ilk sütunu olan tarih sütunları, sonra
+    diğer tarih sütunları. Her öğe {'name', 'type', 'indexed'} sözlüğüdür.
+    Tabloda tarih tipli sütun yoksa (ör. metin olarak saklanan tarihler) tüm sütunlar döner.
+    """
+    indexed = {ix['columns'][0] for ix in table_info.get('indexes', []) if ix.get('columns')}
+    if table_info.get('primary_key'):
+        indexed.add(table_info['primary_key'][0])
+
+    columns = table_info.get('columns', [])
+    candidates = [c for c in columns if is_date_type(c['type'])] or list(columns)
+    candidates = [dict(c, indexed=c['name'] in indexed) for c in candidates]
+    # sorted() kararlıdır: aynı gruptaki sütunlar tablo sırasını korur
+    return sorted(candidates, key=lambda c: not c['indexed'])
+
+def default_date_column(table_info):
+    """Tablo için varsayılan tarih sütunu: 'TARIH' varsa o, yoksa ilk (tercihen indeksli) aday."""
+    names = [c['name'] for c in table_info.get('columns', [])]
+    if VARSAYILAN_TARIH_SUTUNU in names:
+        return VARSAYILAN_TARIH_SUTUNU
+    candidates = date_column_candidates(table_info)
+    return candidates[0]['name'] if candidates else VARSAYILAN_TARIH_SUTUNU
+
+def read_sql_timed(config, sql_query, params=None, label=None, progress_callback=None):
+    """
+    text() sorgusunu çalıştırıp DataFrame döndürür; bağlantı alma, çalıştırma, ilk satır,
+    aktarım ve DataFrame oluşturma sürelerini ölçüp tanılama kaydı olarak yayınlar.
+    'progress_callback' verilirse satırlar parça parça okunur ve o ana kadar okunan
+    satır sayısı her parçadan sonra bildirilir.
+    """
+    timer = QueryTimer()
+    with timer.phase('engine'):
+        engine = get_engine(config)
+        conn = engine.connect()
+    with conn:
+        with timer.phase('execute'):
+            result = conn.execute(text(sql_query), params or {})
+        columns = list(result.keys())
+        with timer.phase('first_row'):
+            rows = result.fetchmany(1)
+        with timer.phase('fetch'):
+            if progress_callback is None:
+                rows += result.fetchall()
+            else:
+                progress_callback(len(rows))
+                while parca := result.fetchmany(AKIS_PARCA_BOYUTU):
+                    rows += parca
+                    progress_callback(len(rows))
+    with timer.phase('dataframe'):
+        df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+    del rows
+
+    record_query(label, config.get('type'), config_key(config)[:12], sql_query, params, len(df), timer)
+    return df
+
+def run_database_query(config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+                       date_column_name=VARSAYILAN_TARIH_SUTUNU, progress_callback=None):
+    """
+    (Worker Görevi) Veritabanında tarih aralığı sorgusu çalıştırır.
+    'progress_callback' okunan satır sayısını parça parça alır (bkz. read_sql_timed).
+    Tablonun güncel bir yerel aynası varsa sorgu aynadan yanıtlanır (bkz. mirror.py).
+    """
     
-    # [TARIH] sütun adını hala sabit olarak varsayıyoruz. 
-    # BU BİR SONRAKİ ADIMDA DÜZELTİLMELİ.
-    date_column_name = "TARIH" 
+    print(f"Çalışan iş parçacığı: Sorgulama başlatıldı. Tablo: {target_table}")
+
+    from .mirror import answer_from_mirror  # mirror.py bu modülü içe aktarır (döngüsel içe aktarma)
+    df = answer_from_mirror(config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name)
+    if df is not None:
+        print(f"Çalışan iş parçacığı: Sorgulama bitti. {len(df)} satır bulundu (yerel ayna).")
+        return df
     
-    if db_type == 'access':
-        # Access: [Tablo] [Sütun] ve ? parametre stili
-        formatted_table_name = f"[{target_table}]"
-        formatted_date_column = f"[{date_column_name}]"
-        sql_query = f"SELECT * FROM {formatted_table_name} WHERE {formatted_date_column} BETWEEN ? AND ? ORDER BY {formatted_date_column}"
-        params = (baslangic_tarihi, bitis_tarihi)
-    else:
-        # PostgreSQL/SQL Server: "şema"."tablo" "Sütun" ve %(param)s stili
-        if '.' in target_table:
-            schema_name, table_name = target_table.split('.', 1)
-            formatted_table_name = f'"{schema_name}"."{table_name}"'
-        else:
-            formatted_table_name = f'"{target_table}"'
-            
-        formatted_date_column = f'"{date_column_name}"'
-        sql_query = f"SELECT * FROM {formatted_table_name} WHERE {formatted_date_column} BETWEEN %(baslangic)s AND %(bitis)s ORDER BY {formatted_date_column}"
-        params = {"baslangic": baslangic_tarihi, "bitis": bitis_tarihi}
-        
-    df = pd.read_sql(sql_query, engine, params=params)
+    sql_query, params = build_range_query(
+        config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name
+    )
+    df = read_sql_timed(config, sql_query, params, label=target_table, progress_callback=progress_callback)
     
     print(f"Çalışan iş parçacığı: Sorgulama bitti. {len(df)} satır bulundu.")
     return df
 
+def explain_query(config, sql_query, params=None):
+    """
+    (Worker Görevi) Sorgunun yürütme planını metin olarak döndürür.
+    PostgreSQL: EXPLAIN (ANALYZE, BUFFERS) — sorgu gerçekten çalıştırılır, gerçek süreler gelir.
+    SQL Server: SHOWPLAN_XML — sorgu çalıştırılmaz, tahmini plan XML olarak gelir.
+    SQLite: EXPLAIN QUERY PLAN (tahmini); DuckDB: EXPLAIN ANALYZE (gerçek süreler).
+    """
+    db_type = config.get('type')
+    engine = get_engine(config)
+    with engine.connect() as conn:
+        if db_type == 'postgres':
+            result = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql_query}"), params or {})
+            plan = "\n".join(row[0] for row in result)
+        elif db_type == 'sql':
+            # SET SHOWPLAN_XML kendi başına bir komut grubunda (batch) olmalıdır
+            conn.exec_driver_sql("SET SHOWPLAN_XML ON")
+            try:
+                result = conn.execute(text(sql_query), params or {})
+                plan = "".join(row[0] for row in result)
+            finally:
+                conn.exec_driver_sql("SET SHOWPLAN_XML OFF")
+        elif db_type == 'sqlite':
+            result = conn.execute(text(f"EXPLAIN QUERY PLAN {sql_query}"), params or {})
+            plan = "\n".join(str(row[-1]) for row in result)
+        elif db_type == 'duckdb':
+            result = conn.execute(text(f"EXPLAIN ANALYZE {sql_query}"), params or {})
+            plan = "\n".join(str(row[-1]) for row in result)
+        else:
+            raise ValueError(f"'{db_type}' veritabanı için sorgu planı alınamıyor.")
+
+    publish({
+        'kind': 'explain',
+        'time': datetime.now().isoformat(timespec='seconds'),
+        'db_type': db_type,
+        'connection': config_key(config)[:12],
+        'sql': sql_query,
+        'params': params,
+        'plan': plan,
+    })
+    return plan
+
+def stream_database_query(config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+                          chunksize=AKIS_PARCA_BOYUTU, partial_callback=None,
+                          date_column_name=VARSAYILAN_TARIH_SUTUNU, is_cancelled=None):
+    """
+    (Worker Görevi) Tarih aralığı sorgusunu sunucu taraflı imleçle (stream_results)
+    parça parça okur ve her parçayı DataFrame olarak 'partial_callback'e verir.
+    Worker tüm sonucu bellekte tutmaz; toplam satır sayısını döndürür.
+    'is_cancelled' True dönerse kalan parçalar okunmaz (imleç kapatılır).
+    """
+    print(f"Çalışan iş parçacığı: Akışlı sorgulama başlatıldı. Tablo: {target_table}")
+
+    sql_query, params = build_range_query(
+        config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name
+    )
+
+    timer = QueryTimer()
+    toplam = 0
+    with timer.phase('engine'):
+        engine = get_engine(config)
+        conn = engine.connect()
+    with conn:
+        conn = conn.execution_options(stream_results=True, max_row_buffer=chunksize)
+        with timer.phase('execute'):
+            result = conn.execute(text(sql_query), params)
+        columns = list(result.keys())
+
+        # İlk parça küçük: ilk satırlar ekrana hemen gelsin
+        parca_boyutu = min(AKIS_ILK_PARCA, chunksize)
+        asama = 'first_row'
+        while True:
+            if is_cancelled and is_cancelled():
+                print("Çalışan iş parçacığı: Akışlı sorgulama iptal edildi.")
+                break
+            with timer.phase(asama):
+                rows = result.fetchmany(parca_boyutu)
+            if not rows:
+                break
+            with timer.phase('dataframe'):
+                parca = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+            toplam += len(parca)
+            if partial_callback:
+                partial_callback(parca)
+            parca_boyutu = chunksize
+            asama = 'fetch'
+
+    record_query(f"{target_table} (akış)", config.get('type'), config_key(config)[:12],
+                 sql_query, params, toplam, timer)
+    print(f"Çalışan iş parçacığı: Akışlı sorgulama bitti. {toplam} satır okundu.")
+    return toplam
+
+def split_date_range(baslangic_tarihi, bitis_tarihi, parca_sayisi):
+    """
+    [başlangıç, bitiş] gün aralığını en fazla 'parca_sayisi' ardışık dilime böler.
+    [(ilk_gün, son_gün), ...] listesi ('yyyy-MM-dd') döndürür; dilimler çakışmaz.
+    """
+    bas = date.fromisoformat(str(baslangic_tarihi)[:10])
+    bit = date.fromisoformat(str(bitis_tarihi)[:10])
+    gun_sayisi = (bit - bas).days + 1
+    if gun_sayisi <= 0:
+        return []
+    parca_sayisi = max(1, min(parca_sayisi, gun_sayisi))
+
+    dilimler = []
+    ilk = bas
+    for i in range(parca_sayisi):
+        # Kalan günleri kalan dilimlere eşit dağıt
+        uzunluk = (gun_sayisi - (ilk - bas).days) // (parca_sayisi - i)
+        son = ilk + timedelta(days=uzunluk - 1)
+        dilimler.append((ilk.isoformat(), son.isoformat()))
+        ilk = son + timedelta(days=1)
+    return dilimler
+
+def run_parallel_range_query(config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+                             parca_sayisi=4, max_paralel=None, date_column_name=VARSAYILAN_TARIH_SUTUNU,
+                             query_func=None):
+    """
+    (Worker Görevi) Tarih aralığını 'parca_sayisi' ardışık dilime böler, dilimleri havuzdaki
+    bağlantılar üzerinden eşzamanlı çeker ve tarih sırasıyla birleştirir.
+    Eşzamanlılık 'max_paralel' ve bağlantı havuzunun kapasitesiyle sınırlıdır.
+    Access (dosya tabanlı) kaynaklarda tek sorguya düşer.
+    'query_func' her dilimi çeken fonksiyondur (varsayılan: run_database_query).
+    """
+    query_func = query_func or run_database_query
+    dilimler = split_date_range(baslangic_tarihi, bitis_tarihi, parca_sayisi)
+    if config.get('type') == 'access' or len(dilimler) <= 1:
+        return query_func(
+            config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name
+        )
+
+    max_paralel = max(1, min(max_paralel or len(dilimler), len(dilimler), connection_capacity(config)))
+
+    get_engine(config)  # Motoru iş parçacıklarından önce bir kez oluştur
+    print(f"Çalışan iş parçacığı: {len(dilimler)} dilim, en fazla {max_paralel} eşzamanlı sorgu ile çekiliyor.")
+
+    with ThreadPoolExecutor(max_workers=max_paralel) as executor:
+        # map() sonuçları dilim sırasıyla döndürür: birleştirme tarih sırasını korur
+        sonuclar = list(executor.map(
+            lambda dilim: query_func(
+                config, target_table, dilim[0], dilim[1], columns, date_column_name
+            ),
+            dilimler
+        ))
+
+    dolu = [df for df in sonuclar if not df.empty]
+    if not dolu:
+        return sonuclar[0]
+    return pd.concat(dolu, ignore_index=True)
+
 def load_excel_file(tam_yol):
-    """(Worker Görevi) Excel okuma işi"""
-    print(f"Çalışan iş parçacığı: Excel okuma başlatıldı -> {tam_yol}")
-    df = pd.read_excel(tam_yol, engine=EXCEL_ENGINE)
-    print(f"Çalışan iş parçacığı: Excel okuma bitti. {len(df)} satır bulundu.")
+    """
+    (Worker Görevi) Excel okuma işi.
+    Rapor daha önce okunduysa veya bu uygulamayla kaydedildiyse sütunlu kopyası
+    (bkz. report_cache.py) okunur; dosya değiştiyse yeniden ayrıştırılır.
+    Aynı dosya başka bir iş parçacığında okunuyorsa o okuma beklenir.
+    """
+    from .report_cache import get_cached_report, store_report, report_load_lock  # report_cache bu modülü içe aktarır
+
+    with report_load_lock(tam_yol):
+        df = get_cached_report(tam_yol)
+        if df is not None:
+            print(f"Çalışan iş parçacığı: Rapor önbellekten okundu. {len(df)} satır -> {tam_yol}")
+            return df
+        print(f"Çalışan iş parçacığı: Excel okuma başlatıldı -> {tam_yol}")
+        df = pd.read_excel(tam_yol, engine=excel_engine())
+        print(f"Çalışan iş parçacığı: Excel okuma bitti. {len(df)} satır bulundu.")
+        store_report(tam_yol, df)
     return df
 
 
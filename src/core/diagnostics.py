@@ -0,0 +1,98 @@
+# src/core/diagnostics.py
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+TANILAMA_GUNLUGU = os.path.join(os.path.expanduser("~"), ".admintabletool", "sorgu_tanilama.jsonl")
+GUNLUK_SINIRI = 10 * 1024 * 1024  # Bu boyutu aşan günlük '.1' uzantısıyla yedeklenir
+
+# Ölçülen aşamalar (sırasıyla): bağlantı alma, sunucuda çalıştırma, ilk satır,
+# kalan satırların aktarımı, DataFrame oluşturma
+QUERY_PHASES = ('engine', 'execute', 'first_row', 'fetch', 'dataframe')
+
+_gunluk_kilidi = threading.Lock()
+_dinleyiciler = []
+
+
+class QueryTimer:
+    """Bir sorgunun aşamalarının sürelerini toplar. Aynı aşama birden çok kez ölçülürse süreler eklenir."""
+
+    def __init__(self):
+        self.durations = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0.0) + time.perf_counter() - t0
+
+    def total(self):
+        return time.perf_counter() - self._start
+
+    def as_dict(self):
+        """Aşama sürelerini milisaniye olarak döndürür."""
+        return {name: round(self.durations[name] * 1000, 2) for name in QUERY_PHASES if name in self.durations}
+
+
+def add_listener(callback):
+    """Her yeni tanılama kaydında çağrılacak fonksiyonu ekler (çalışan iş parçacığından çağrılır)."""
+    _dinleyiciler.append(callback)
+
+
+def remove_listener(callback):
+    if callback in _dinleyiciler:
+        _dinleyiciler.remove(callback)
+
+
+def _write_log(kayit):
+    """Kaydı JSONL günlüğüne bir satır olarak ekler."""
+    try:
+        os.makedirs(os.path.dirname(TANILAMA_GUNLUGU), exist_ok=True)
+        with _gunluk_kilidi:
+            try:
+                if os.path.getsize(TANILAMA_GUNLUGU) > GUNLUK_SINIRI:
+                    os.replace(TANILAMA_GUNLUGU, TANILAMA_GUNLUGU + ".1")
+            except OSError:
+                pass
+            with open(TANILAMA_GUNLUGU, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(kayit, ensure_ascii=False, default=str) + "\n")
+    except OSError as e:
+        print(f"UYARI: Tanılama günlüğü yazılamadı: {e}")
+
+
+def publish(kayit):
+    """Kaydı günlüğe yazar ve dinleyicilere iletir."""
+    _write_log(kayit)
+    for callback in list(_dinleyiciler):
+        try:
+            callback(kayit)
+        except Exception as e:
+            print(f"UYARI: Tanılama dinleyicisi hata verdi: {e}")
+
+
+def record_query(label, db_type, connection, sql_query, params, rows, timer):
+    """
+    Tamamlanan bir sorgunun tanılama kaydını oluşturur ve yayınlar.
+    'connection' bağlantının kısa kimliğidir (parola gibi ayarlar günlüğe yazılmaz).
+    """
+    kayit = {
+        'kind': 'query',
+        'time': datetime.now().isoformat(timespec='seconds'),
+        'label': label,
+        'db_type': db_type,
+        'connection': connection,
+        'sql': sql_query,
+        'params': params,
+        'rows': rows,
+        'phases_ms': timer.as_dict(),
+        'total_ms': round(timer.total() * 1000, 2),
+    }
+    publish(kayit)
+    return kayit
@@ -0,0 +1,164 @@
+# src/core/fanout.py
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .database import (
+    config_key, connection_capacity, run_database_query, default_date_column, VARSAYILAN_TARIH_SUTUNU
+)
+from .schema_cache import cached_table_info
+
+# Aynı bağlantıya (sunucuya) aynı anda gönderilecek en fazla sorgu sayısı
+BAGLANTI_BASINA_SINIR = 4
+# Toplam eşzamanlı hedef sayısı (farklı bağlantılar dahil)
+MAKS_ESZAMANLI_HEDEF = 16
+# Birleşik sonuçta her satırın geldiği hedefi gösteren sütun
+KAYNAK_SUTUNU = "KAYNAK"
+
+
+def target_label(config, target_table):
+    """
+    Hedefin kısa, okunabilir adı: 'kullanıcı@sunucu:port/veritabanı:tablo' veya 'dosya:tablo'.
+    Ad tek başına benzersiz olmayabilir (farklı klasörlerde aynı adlı dosyalar); bkz. unique_labels.
+    """
+    if config.get('path'):
+        kaynak = os.path.basename(config['path'])
+    else:
+        sunucu = config.get('host') or ''
+        if config.get('port'):
+            sunucu = f"{sunucu}:{config['port']}"
+        if config.get('user'):
+            sunucu = f"{config['user']}@{sunucu}"
+        kaynak = f"{sunucu}/{config.get('database') or ''}"
+    return f"{kaynak}:{target_table}"
+
+
+def unique_labels(etiketler):
+    """Tekrarlanan etiketlere sırayla ' #2', ' #3' ... ekler; sıra korunur."""
+    kullanilan = set()
+    sonuc = []
+    for etiket in etiketler:
+        aday, sayac = etiket, 1
+        while aday in kullanilan:
+            sayac += 1
+            aday = f"{etiket} #{sayac}"
+        kullanilan.add(aday)
+        sonuc.append(aday)
+    return sonuc
+
+
+def make_target(config, target_table, date_column_name=None, columns=None, label=None):
+    """
+    Çoklu sorgu hedefi: {'config', 'table', 'date_column', 'columns', 'label'}.
+    'date_column' None ise tablo yapısından varsayılan tarih sütunu seçilir.
+    """
+    return {
+        'config': dict(config),
+        'table': target_table,
+        'date_column': date_column_name,
+        'columns': list(columns) if columns else None,
+        'label': label or target_label(config, target_table),
+    }
+
+
+def _connection_limit(config, max_per_connection):
+    """Bağlantı başına eşzamanlılık: istenen sınır, havuz kapasitesi; Access dosyasında 1."""
+    if config.get('type') == 'access':
+        return 1
+    return max(1, min(max_per_connection or BAGLANTI_BASINA_SINIR, connection_capacity(config)))
+
+
+def run_fanout_query(targets, baslangic_tarihi, bitis_tarihi, max_per_connection=None,
+                     query_func=None, partial_callback=None):
+    """
+    (Worker Görevi) Aynı tarih aralığını birden çok hedeften (tablo/bağlantı) eşzamanlı çeker.
+    Her bağlantının kendi semaforu vardır: bir sunucuya en fazla 'max_per_connection' sorgu
+    gider, farklı sunucular birbirini beklemez; toplam süre en yavaş hedefe yaklaşır.
+    Her hedef bittiğinde sonucu 'partial_callback'e verilir. Hedef sırasıyla
+    [{'label', 'table', 'df', 'error', 'seconds'}, ...] döndürür; hatalı hedefler sorguyu
+    durdurmaz, yalnızca tüm hedefler başarısızsa hata yükseltilir.
+    'query_func' (config, tablo, başlangıç, bitiş, columns, date_column_name=...) imzalı olmalıdır
+    (varsayılan: run_database_query).
+    """
+    query_func = query_func or run_database_query
+    if not targets:
+        return []
+    # Etiketler sonuç sekmelerinde ve birleşik sonucun kaynak sütununda ayırt edici olmalı
+    targets = [dict(hedef, label=etiket) for hedef, etiket in
+               zip(targets, unique_labels([hedef['label'] for hedef in targets]))]
+
+    semaforlar = {}
+    for hedef in targets:
+        key = config_key(hedef['config'])
+        if key not in semaforlar:
+            semaforlar[key] = threading.BoundedSemaphore(
+                _connection_limit(hedef['config'], max_per_connection)
+            )
+
+    print(f"Çalışan iş parçacığı: {len(targets)} hedef, {len(semaforlar)} bağlantı üzerinden çekiliyor.")
+
+    def cek(hedef):
+        config = hedef['config']
+        sonuc = {'label': hedef['label'], 'table': hedef['table'], 'df': None, 'error': None, 'seconds': 0.0}
+        with semaforlar[config_key(config)]:
+            t0 = time.perf_counter()
+            try:
+                tarih_sutunu = hedef.get('date_column') or default_date_column(
+                    cached_table_info(config, hedef['table'])
+                )
+                sonuc['df'] = query_func(
+                    config, hedef['table'], baslangic_tarihi, bitis_tarihi, hedef.get('columns'),
+                    date_column_name=tarih_sutunu
+                )
+            except Exception as e:
+                print(f"Çalışan iş parçacığı: Hedef başarısız -> {hedef['label']}: {e}")
+                sonuc['error'] = str(e)
+            sonuc['seconds'] = time.perf_counter() - t0
+        if partial_callback:
+            partial_callback(sonuc)
+        return sonuc
+
+    with ThreadPoolExecutor(max_workers=min(len(targets), MAKS_ESZAMANLI_HEDEF)) as executor:
+        sonuclar = list(executor.map(cek, targets))
+
+    if all(s['error'] for s in sonuclar):
+        raise RuntimeError("Hiçbir hedeften veri alınamadı:\n" + "\n".join(
+            f"{s['label']}: {s['error']}" for s in sonuclar
+        ))
+    return sonuclar
+
+
+def union_results(sonuclar, kaynak_sutunu=KAYNAK_SUTUNU):
+    """
+    Başarılı hedeflerin sonuçlarını alt alta birleştirir; ilk sütun satırın kaynağıdır.
+    Kaynak sütunu kategoriktir (hedef adı satır başına bir kez saklanmaz).
+    Farklı yapıdaki tablolarda eksik sütunlar boş kalır. Tablolarda aynı adlı bir sütun
+    zaten varsa kaynak sütununun adına '_' eklenir.
+    """
+    basarili = [s for s in sonuclar if s.get('df') is not None]
+    etiketler = unique_labels([s['label'] for s in basarili])
+    mevcut_sutunlar = {str(c) for s in basarili for c in s['df'].columns}
+    while kaynak_sutunu in mevcut_sutunlar:
+        kaynak_sutunu += "_"
+    parcalar = []
+    for kod, sonuc in enumerate(basarili):
+        df = sonuc['df']
+        if df.empty:
+            continue
+        df = df.copy(deep=False)
+        # Tüm parçalar aynı kategori listesini kullanır: concat sonucu kategorik kalır
+        df.insert(0, kaynak_sutunu, pd.Categorical.from_codes(
+            np.full(len(df), kod, dtype='int32'), categories=etiketler
+        ))
+        parcalar.append(df)
+
+    if not parcalar:
+        return pd.DataFrame({kaynak_sutunu: pd.Categorical([], categories=etiketler)})
+    if len(parcalar) == 1:
+        return parcalar[0]
+    return pd.concat(parcalar, ignore_index=True)
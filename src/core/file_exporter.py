@@ -2,12 +2,9 @@
 
 import os
 from datetime import datetime
-import pandas as pd
 
-# PDF ile ilgili tüm importları buraya taşıyoruz
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
-from reportlab.lib.pagesizes import landscape, A4
-from reportlab.lib import colors
+from .utils import register_pdf_fonts
+
 
 def get_yeni_kayit_yolu(format, start_date_obj, end_date_obj, target_table):
     """
@@ -48,28 +45,61 @@ def get_yeni_kayit_yolu(format, start_date_obj, end_date_obj, target_table):
         print(f"Kayıt yolu oluşturulurken hata: {e}")
         return None # Hata durumunda None döndür
 
+def scan_saved_reports(ana_klasor):
+    """
+    (Worker Görevi) Kayıtlı Excel raporlarının klasörlerini tarar.
+    'YIL\\GUN_AY' klasörlerinden .xlsx içerenleri tarihe göre sıralı
+    [('GUN_AY_YIL', klasör_yolu), ...] listesi olarak döndürür.
+    """
+    print(f"Çalışan iş parçacığı: Kayıtlı raporlar taranıyor -> {ana_klasor}")
+    rapor_klasorleri = {}
+    if not os.path.exists(ana_klasor):
+        return []
+    for yil_klasor in os.listdir(ana_klasor):
+        yil_yolu = os.path.join(ana_klasor, yil_klasor)
+        if os.path.isdir(yil_yolu) and yil_klasor.isdigit():
+            for gun_ay_klasor in os.listdir(yil_yolu):
+                gun_ay_yolu = os.path.join(yil_yolu, gun_ay_klasor)
+                if os.path.isdir(gun_ay_yolu) and '_' in gun_ay_klasor:
+                    if any(f.endswith('.xlsx') for f in os.listdir(gun_ay_yolu)):
+                        combo_text = f"{gun_ay_klasor}_{yil_klasor}"
+                        rapor_klasorleri[combo_text] = gun_ay_yolu
+    try:
+        sorted_keys = sorted(rapor_klasorleri.keys(), key=lambda d: datetime.strptime(d, '%d_%m_%Y'))
+    except Exception:
+        sorted_keys = sorted(rapor_klasorleri.keys())
+    print(f"Çalışan iş parçacığı: {len(sorted_keys)} rapor klasörü bulundu.")
+    return [(key, rapor_klasorleri[key]) for key in sorted_keys]
+
 def task_run_excel(kayit_yolu, df_to_save):
     """(Worker Görevi) ARKA PLANDA çalışacak Excel kaydetme işi."""
     print(f"Çalışan iş parçacığı: Excel kaydetme başlatıldı -> {kayit_yolu}")
     df_to_save.to_excel(kayit_yolu, index=False)
+    # Rapor ilk açılışta Excel'den ayrıştırılmasın: sütunlu kopyası şimdiden yazılır
+    from .report_cache import store_report
+    store_report(kayit_yolu, df_to_save)
     print("Çalışan iş parçacığı: Excel kaydetme bitti.")
     return kayit_yolu
 
 def task_run_pdf(kayit_yolu, df_to_save):
     """(Worker Görevi) ARKA PLANDA çalışacak PDF kaydetme işi."""
     print(f"Çalışan iş parçacığı: PDF kaydetme başlatıldı -> {kayit_yolu}")
+    # reportlab ve fontlar ilk PDF dışa aktarımında yüklenir
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
+    from reportlab.lib.pagesizes import landscape, A4
+    from reportlab.lib import colors
+    font, kalin_font = register_pdf_fonts()
 
     doc = SimpleDocTemplate(kayit_yolu, pagesize=landscape(A4))
     data = [list(df_to_save.columns)] + df_to_save.values.tolist()
     table = Table(data)
 
-    # Fontların ana uygulamada (register_pdf_fonts) yüklendiğini varsayar
     style = TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Arial_Bold'),
-        ('FONTNAME', (0, 1), (-1, -1), 'Arial'),
+        ('FONTNAME', (0, 0), (-1, 0), kalin_font),
+        ('FONTNAME', (0, 1), (-1, -1), font),
         ('FONTSIZE', (0, 0), (-1, -1), 8),
         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
         ('GRID', (0, 0), (-1, -1), 1, colors.black)
@@ -0,0 +1,386 @@
+# src/core/mirror.py
+
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+
+import pandas as pd
+
+from .database import (
+    config_key, dispose_engine, format_table_name, quote_identifier, range_bounds, read_sql_timed,
+    run_database_query, stream_database_query, VARSAYILAN_TARIH_SUTUNU
+)
+from .schema_cache import cached_table_info
+
+AYNA_KLASORU = os.path.join(os.path.expanduser("~"), ".admintabletool", "ayna")
+AYNA_TAZELIK = 15 * 60      # Saniye; son eşitlemeden bu kadar süre geçmişse sorgular kaynağa gider
+AYNA_SURUMU = 1             # Dosya biçimi değiştiğinde artırılır; eski aynalar yeniden oluşturulur
+
+# Yerel aynası tutulabilen (yavaş/paylaşılan) kaynaklar; SQLite/DuckDB zaten yereldir
+AYNALANABILIR_TURLER = ('access', 'sql', 'postgres')
+
+# Ayna dosyasının içindeki tablolar
+AYNA_TABLOSU = "veri"
+_BILGI_TABLOSU = "_ayna_bilgi"
+
+# Tarih aralığı sınırları: tüm tablo (tarihi boş satırlar aralık sorgularında zaten dönmez)
+_ILK_GUN = "1900-01-01"
+_SON_GUN = "9999-12-30"
+
+# Satır sürümü sütunu olarak tanınan adlar (güncellenen eski satırları yakalamak için)
+_SURUM_SUTUNU_ADLARI = (
+    "ROWVERSION", "ROW_VERSION", "UPDATED_AT", "MODIFIED_AT", "LAST_MODIFIED",
+    "GUNCELLEME_TARIHI", "DEGISIKLIK_TARIHI",
+)
+
+
+def default_version_column(config, table_info):
+    """
+    Artımlı eşitlemede güncellenen satırları bulmak için sürüm sütunu: SQL Server'da
+    rowversion (yansıtılan tipi TIMESTAMP), diğerlerinde bilinen 'güncellenme zamanı' adları.
+    Birincil anahtar yoksa güncellemeler uygulanamayacağı için None döner.
+    """
+    if not table_info.get('primary_key'):
+        return None
+    for column in table_info.get('columns', []):
+        tip = str(column['type']).upper()
+        if config.get('type') == 'sql' and tip in ("TIMESTAMP", "ROWVERSION"):
+            return column['name']
+    for column in table_info.get('columns', []):
+        if column['name'].upper() in _SURUM_SUTUNU_ADLARI:
+            return column['name']
+    return None
+
+
+def _to_sqlite_rows(df):
+    """DataFrame'i SQLite'a yazılacak satırlara çevirir: tarihler ISO metin, boşlar NULL."""
+    df = df.copy(deep=False)
+    for ad in df.columns:
+        seri = df[ad]
+        if pd.api.types.is_datetime64_any_dtype(seri.dtype):
+            # 'yyyy-MM-dd HH:MM:SS' metin sırası tarih sırasıyla aynıdır (aralık sorguları için)
+            df[ad] = seri.dt.strftime('%Y-%m-%d %H:%M:%S.%f').where(seri.notna(), None)
+        elif pd.api.types.is_bool_dtype(seri.dtype):
+            df[ad] = seri.astype('int8')
+    return df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+
+
+def _restore_dtypes(df, dtypes):
+    """Aynadan okunan sütunları kaynaktaki tiplerine döndürür (SQLite tarihleri metin saklar)."""
+    for ad, dtype in dtypes.items():
+        if ad not in df.columns:
+            continue
+        if dtype.startswith('datetime64'):
+            tarih = pd.to_datetime(df[ad], errors='coerce', format='ISO8601')
+            tz = getattr(pd.api.types.pandas_dtype(dtype), 'tz', None)
+            df[ad] = tarih.dt.tz_localize(tz) if tz is not None else tarih
+        elif dtype == 'bool' and not df[ad].isna().any():
+            df[ad] = df[ad].astype(bool)
+    return df
+
+
+class LocalMirror:
+    """
+    Kaynak tabloların yerel SQLite kopyaları (ayna).
+    Her (bağlantı, tablo) için ayrı bir dosya vardır; dosyada veri tablosu, tarih sütunu
+    indeksi ve eşitleme bilgisi (tarih sütunu, başlangıç günü, son eşitleme zamanı, sütun tipleri)
+    bulunur. İlk eşitleme tüm tabloyu, sonrakiler yalnızca son eşitlenen günden itibaren
+    gelen satırları (ve sürüm sütunu varsa güncellenen eski satırları) çeker.
+    Kaynakta silinen eski satırlar artımlı eşitlemede fark edilmez; tam eşitleme gerekir.
+    """
+
+    def __init__(self, directory=AYNA_KLASORU, max_age=AYNA_TAZELIK):
+        self.directory = directory
+        self.max_age = max_age
+        self._info = {}   # dosya yolu -> eşitleme bilgisi (bellekteki kopya)
+        self._locks = {}  # dosya yolu -> eşitleme kilidi (aynı aynayı iki iş aynı anda yazmasın)
+        self._lock = threading.Lock()
+
+    def path(self, config, target_table):
+        dosya_adi = re.sub(r'[^\w.-]', '_', target_table)
+        return os.path.join(self.directory, config_key(config), f"{dosya_adi}.sqlite")
+
+    @staticmethod
+    def mirror_config(path):
+        """Ayna dosyasını sorgulamak için bağlantı ayarları."""
+        return {'type': 'sqlite', 'path': path}
+
+    def _sync_lock(self, path):
+        with self._lock:
+            return self._locks.setdefault(path, threading.Lock())
+
+    @staticmethod
+    def _read_info(path):
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            satir = conn.execute(f'SELECT deger FROM "{_BILGI_TABLOSU}" WHERE anahtar = ?', ('bilgi',)).fetchone()
+        finally:
+            conn.close()
+        return json.loads(satir[0]) if satir else None
+
+    def info(self, config, target_table):
+        """Aynanın eşitleme bilgisi; tablo aynalanmamışsa None."""
+        if config.get('type') not in AYNALANABILIR_TURLER:
+            return None
+        path = self.path(config, target_table)
+        if not os.path.exists(path):
+            with self._lock:
+                self._info.pop(path, None)
+            return None
+        with self._lock:
+            bilgi = self._info.get(path)
+        if bilgi is None:
+            try:
+                bilgi = self._read_info(path)
+            except (sqlite3.Error, ValueError) as e:
+                print(f"UYARI: Yerel ayna okunamadı ({path}): {e}")
+                return None
+            if not bilgi or bilgi.get('version') != AYNA_SURUMU:
+                return None
+            with self._lock:
+                self._info[path] = bilgi
+        return bilgi
+
+    def is_fresh(self, bilgi):
+        return bilgi is not None and time.time() - bilgi['synced_at'] <= bilgi.get('max_age', self.max_age)
+
+    def fresh_path(self, config, target_table, date_column_name, baslangic_tarihi, bitis_tarihi):
+        """Ayna güncel ve istenen aralığı kapsıyorsa dosya yolunu, değilse None döndürür."""
+        bilgi = self.info(config, target_table)
+        if not self.is_fresh(bilgi) or bilgi['date_column'] != date_column_name:
+            return None
+        if bilgi.get('since') and str(baslangic_tarihi)[:10] < bilgi['since']:
+            return None
+        # Son eşitlenen günden sonrasına uzanan aralıkta kaynağa sonradan eklenen satırlar
+        # aynada yoktur: bu sorgular kaynağa gider
+        filigran = bilgi.get('date_watermark')
+        if not filigran or str(bitis_tarihi)[:10] > str(filigran)[:10]:
+            return None
+        return self.path(config, target_table)
+
+    def query(self, config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+              date_column_name=VARSAYILAN_TARIH_SUTUNU):
+        """Aralık sorgusunu güncel aynadan yanıtlar; ayna yoksa, eskiyse veya sütunlar eksikse None."""
+        path = self.fresh_path(config, target_table, date_column_name, baslangic_tarihi, bitis_tarihi)
+        if path is None:
+            return None
+        dtypes = self.info(config, target_table)['dtypes']
+        if columns and any(c not in dtypes for c in columns):
+            return None  # Kaynakta sonradan eklenen sütun: aynada yok
+        print(f"Çalışan iş parçacığı: Sorgu yerel aynadan yanıtlanıyor. Tablo: {target_table}")
+        df = run_database_query(
+            self.mirror_config(path), AYNA_TABLOSU, baslangic_tarihi, bitis_tarihi, columns, date_column_name
+        )
+        return _restore_dtypes(df, dtypes)
+
+    # --- Eşitleme ---
+    def sync(self, config, target_table, date_column_name=VARSAYILAN_TARIH_SUTUNU, version_column=None,
+             since=None, full=False, partial_callback=None):
+        """
+        Aynayı kaynakla eşitler ve güncel eşitleme bilgisini döndürür.
+        Ayna yoksa, 'full' True ise ya da tarih sütunu değiştiyse tablo baştan kopyalanır.
+        'since' ('yyyy-MM-dd') verilirse ilk kopyada yalnızca bu günden sonraki satırlar alınır.
+        'partial_callback' yazılan satır sayısını alır.
+        """
+        if config.get('type') not in AYNALANABILIR_TURLER:
+            raise ValueError(f"'{config.get('type')}' kaynakları için yerel ayna desteklenmiyor (zaten yerel).")
+        path = self.path(config, target_table)
+        with self._sync_lock(path):
+            bilgi = None if full else self.info(config, target_table)
+            if bilgi is None or bilgi['date_column'] != date_column_name:
+                bilgi = self._full_sync(config, target_table, path, date_column_name, version_column,
+                                        since, partial_callback)
+            else:
+                bilgi = self._incremental_sync(config, target_table, path, bilgi, partial_callback)
+            with self._lock:
+                self._info[path] = bilgi
+        return bilgi
+
+    def _full_sync(self, config, target_table, path, date_column_name, version_column, since, partial_callback):
+        print(f"Çalışan iş parçacığı: Yerel ayna oluşturuluyor. Tablo: {target_table}")
+        table_info = cached_table_info(config, target_table)
+        if version_column is None:
+            version_column = default_version_column(config, table_info)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Yeni kopya geçici dosyaya yazılır; tamamlanınca eskisinin yerine geçer
+        gecici = f"{path}.{threading.get_ident()}.yeni"
+        if os.path.exists(gecici):
+            os.remove(gecici)
+        conn = sqlite3.connect(gecici)
+        durum = {'dtypes': None, 'rows': 0}
+        try:
+            conn.execute("PRAGMA journal_mode = OFF")  # Toplu yükleme; dosya hazır olana kadar kullanılmaz
+            conn.execute("PRAGMA synchronous = OFF")
+
+            def yaz(df):
+                if durum['dtypes'] is None:
+                    conn.execute(pd.io.sql.get_schema(df, AYNA_TABLOSU))
+                    durum['dtypes'] = {ad: str(tip) for ad, tip in df.dtypes.items()}
+                    durum['insert'] = (
+                        f'INSERT INTO "{AYNA_TABLOSU}" ({", ".join(quote_identifier("sqlite", c) for c in df.columns)}) '
+                        f'VALUES ({", ".join("?" * len(df.columns))})'
+                    )
+                conn.executemany(durum['insert'], _to_sqlite_rows(df))
+                durum['rows'] += len(df)
+                if partial_callback:
+                    partial_callback(durum['rows'])
+
+            stream_database_query(config, target_table, since or _ILK_GUN, _SON_GUN,
+                                  partial_callback=yaz, date_column_name=date_column_name)
+            if durum['dtypes'] is None:
+                raise ValueError(f"'{target_table}' tablosunda aynalanacak satır bulunamadı.")
+
+            tarih_sql = quote_identifier('sqlite', date_column_name)
+            conn.execute(f'CREATE INDEX "IX_{AYNA_TABLOSU}_TARIH" ON "{AYNA_TABLOSU}" ({tarih_sql})')
+            anahtar = [c for c in table_info.get('primary_key') or [] if c in durum['dtypes']]
+            if anahtar:
+                conn.execute(f'CREATE UNIQUE INDEX "PK_{AYNA_TABLOSU}" ON "{AYNA_TABLOSU}" '
+                             f'({", ".join(quote_identifier("sqlite", c) for c in anahtar)})')
+            bilgi = {
+                'version': AYNA_SURUMU,
+                'table': target_table,
+                'date_column': date_column_name,
+                'version_column': version_column if version_column in durum['dtypes'] and anahtar else None,
+                'primary_key': anahtar,
+                'since': since,
+                'dtypes': durum['dtypes'],
+            }
+            bilgi = self._write_info(conn, bilgi)
+            conn.commit()
+            conn.execute("PRAGMA journal_mode = WAL")  # Eşitleme sürerken okumalar engellenmesin
+        except BaseException:
+            conn.close()
+            os.remove(gecici)
+            raise
+        conn.close()
+
+        dispose_engine(self.mirror_config(path))  # Eski dosyayı tutan bağlantıları bırak
+        for ek in ("-wal", "-shm"):
+            if os.path.exists(path + ek):
+                os.remove(path + ek)
+        os.replace(gecici, path)
+        print(f"Çalışan iş parçacığı: Yerel ayna oluşturuldu. {bilgi['rows']} satır -> {path}")
+        return bilgi
+
+    def _incremental_sync(self, config, target_table, path, bilgi, partial_callback):
+        db_type = config.get('type')
+        tarih_sutunu = bilgi['date_column']
+        tarih_sql = quote_identifier('sqlite', tarih_sutunu)
+        conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        try:
+            # Son eşitlenen gün yeniden çekilir: o güne sonradan eklenen satırlar da gelsin
+            gun = (bilgi.get('date_watermark') or bilgi.get('since') or _ILK_GUN)[:10]
+            surum_sutunu = bilgi.get('version_column')
+            surum = None
+            if surum_sutunu:
+                surum = conn.execute(
+                    f'SELECT MAX({quote_identifier("sqlite", surum_sutunu)}) FROM "{AYNA_TABLOSU}"'
+                ).fetchone()[0]
+            print(f"Çalışan iş parçacığı: Yerel ayna eşitleniyor ({gun} gününden itibaren). Tablo: {target_table}")
+
+            sutunlar = list(bilgi['dtypes'])
+            insert_sql = (
+                f'INSERT INTO "{AYNA_TABLOSU}" ({", ".join(quote_identifier("sqlite", c) for c in sutunlar)}) '
+                f'VALUES ({", ".join("?" * len(sutunlar))})'
+            )
+            yazilan = [0]
+
+            conn.execute("BEGIN IMMEDIATE")  # Okuyucular eşitleme bitene kadar eski hali görür
+            conn.execute(f'DELETE FROM "{AYNA_TABLOSU}" WHERE {tarih_sql} >= ?', (gun,))
+
+            def yaz(df):
+                conn.executemany(insert_sql, _to_sqlite_rows(df.reindex(columns=sutunlar)))
+                yazilan[0] += len(df)
+                if partial_callback:
+                    partial_callback(yazilan[0])
+
+            stream_database_query(config, target_table, gun, _SON_GUN,
+                                  partial_callback=yaz, date_column_name=tarih_sutunu)
+
+            if surum_sutunu and surum is not None:
+                # Önceki günlerde güncellenen satırlar: birincil anahtarla silinip yeniden yazılır
+                kaynak_tarih = quote_identifier(db_type, tarih_sutunu)
+                degisen = read_sql_timed(
+                    config,
+                    f"SELECT * FROM {format_table_name(db_type, target_table)} "
+                    f"WHERE {quote_identifier(db_type, surum_sutunu)} > :surum AND {kaynak_tarih} < :gun",
+                    {'surum': surum, 'gun': range_bounds(gun, gun)[0]},
+                    label=f"{target_table} (ayna)",
+                )
+                if not degisen.empty:
+                    anahtar = bilgi['primary_key']
+                    kosul = " AND ".join(f'{quote_identifier("sqlite", c)} = ?' for c in anahtar)
+                    conn.executemany(
+                        f'DELETE FROM "{AYNA_TABLOSU}" WHERE {kosul}',
+                        _to_sqlite_rows(degisen[anahtar])
+                    )
+                    yaz(degisen)
+                    print(f"Çalışan iş parçacığı: {len(degisen)} güncellenmiş satır aynaya yazıldı.")
+
+            bilgi = self._write_info(conn, dict(bilgi))
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        print(f"Çalışan iş parçacığı: Yerel ayna eşitlendi. {yazilan[0]} satır yazıldı, toplam {bilgi['rows']}.")
+        return bilgi
+
+    @staticmethod
+    def _write_info(conn, bilgi):
+        """Satır sayısı, tarih filigranı ve eşitleme zamanını hesaplayıp aynaya yazar."""
+        tarih_sql = quote_identifier('sqlite', bilgi['date_column'])
+        satir, son_tarih = conn.execute(
+            f'SELECT COUNT(*), MAX({tarih_sql}) FROM "{AYNA_TABLOSU}"'
+        ).fetchone()
+        bilgi.update(rows=satir, date_watermark=son_tarih, synced_at=time.time())
+        conn.execute(f'CREATE TABLE IF NOT EXISTS "{_BILGI_TABLOSU}" (anahtar TEXT PRIMARY KEY, deger TEXT)')
+        conn.execute(f'INSERT OR REPLACE INTO "{_BILGI_TABLOSU}" VALUES (?, ?)',
+                     ('bilgi', json.dumps(bilgi, ensure_ascii=False)))
+        return bilgi
+
+    def remove(self, config, target_table):
+        """Tablonun aynasını siler; sorgular yeniden kaynağa gider."""
+        path = self.path(config, target_table)
+        with self._sync_lock(path):
+            dispose_engine(self.mirror_config(path))
+            with self._lock:
+                self._info.pop(path, None)
+            for ek in ("", "-wal", "-shm"):
+                try:
+                    os.remove(path + ek)
+                except FileNotFoundError:
+                    pass
+
+
+# Uygulama genelinde paylaşılan ayna deposu
+local_mirror = LocalMirror()
+
+
+def sync_mirror(config, target_table, date_column_name=VARSAYILAN_TARIH_SUTUNU, full=False,
+                partial_callback=None):
+    """(Worker Görevi) Tablonun yerel aynasını oluşturur veya artımlı olarak eşitler."""
+    return local_mirror.sync(config, target_table, date_column_name, full=full,
+                             partial_callback=partial_callback)
+
+
+def remove_mirror(config, target_table):
+    """(Worker Görevi) Tablonun yerel aynasını siler."""
+    local_mirror.remove(config, target_table)
+    return target_table
+
+
+def answer_from_mirror(config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+                       date_column_name=VARSAYILAN_TARIH_SUTUNU):
+    """Aralık sorgusunu güncel yerel aynadan yanıtlar; yanıtlanamıyorsa None (kaynağa gidilir)."""
+    try:
+        return local_mirror.query(config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name)
+    except Exception as e:
+        print(f"UYARI: Yerel ayna kullanılamadı, kaynağa gidiliyor: {e}")
+        return None
@@ -0,0 +1,156 @@
+# src/core/pg_copy.py
+
+import io
+import csv
+import tempfile
+import threading
+
+import pandas as pd
+from sqlalchemy import text
+
+from .database import (
+    get_engine, config_key, build_range_query, is_date_type, run_database_query,
+    VARSAYILAN_TARIH_SUTUNU
+)
+from .diagnostics import QueryTimer, record_query
+from .arrow_fetch import ARROW_VAR, arrow_type, column_type_names, run_arrow_query
+
+if ARROW_VAR:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+# COPY çıktısı bu boyuta kadar bellekte, aşarsa geçici dosyada tutulur (byte)
+KOPYA_BELLEK_SINIRI = 256 * 1024 * 1024
+
+# Bu SQLSTATE kodlarıyla başarısız olan bağlantılarda COPY oturum boyunca tekrar denenmez:
+# 42501 = insufficient_privilege, 0A000 = feature_not_supported (ör. COPY'yi desteklemeyen ara katmanlar)
+_KALICI_HATALAR = ('42501', '0A000')
+
+# COPY kullanılamadığı anlaşılan bağlantılar (config_key)
+_copy_kapali = set()
+_copy_kapali_kilidi = threading.Lock()
+
+
+def copy_available(config):
+    """Bağlantı COPY ile toplu çekmeye uygun mu? (Yalnızca PostgreSQL; daha önce reddedilmemiş olmalı.)"""
+    if config.get('type') != 'postgres':
+        return False
+    with _copy_kapali_kilidi:
+        return config_key(config) not in _copy_kapali
+
+
+def _render_sql(engine, raw_conn, sql_query, params):
+    """
+    text() sorgusunu parametreleri sürücü tarafından güvenle yerleştirilmiş tek bir SQL metnine çevirir.
+    COPY (SELECT ...) bağlama parametresi kabul etmediği için değerler mogrify ile gömülür.
+    """
+    compiled = text(sql_query).compile(dialect=engine.dialect)
+    with raw_conn.cursor() as cursor:
+        gomulu = cursor.mogrify(str(compiled), params)
+    return gomulu.decode(raw_conn.encoding) if isinstance(gomulu, bytes) else gomulu
+
+
+def _read_csv_arrow(dosya, names, tip_adlari, arrow):
+    """COPY CSV çıktısını pyarrow ile (çok iş parçacıklı) okur; tipler tablo yapısından gelir."""
+    tipler = {ad: arrow_type(tip) for ad, tip in zip(names, tip_adlari)}
+    convert = dict(
+        # PostgreSQL CSV'de NULL tırnaksız boş alandır; tırnaklı "" boş metindir
+        null_values=[""], strings_can_be_null=True, quoted_strings_can_be_null=False,
+        true_values=["t", "true"], false_values=["f", "false"],
+    )
+    try:
+        tablo = pa_csv.read_csv(dosya, convert_options=pa_csv.ConvertOptions(
+            column_types={ad: tip for ad, tip in tipler.items() if tip is not None}, **convert
+        ))
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        # Metin biçimi bildirilen tiple okunamadı (ör. yerel biçimli MONEY): tipleri çıkarım yap
+        print(f"UYARI: COPY çıktısı tablo tipleriyle okunamadı, tipler çıkarılacak: {e}")
+        dosya.seek(0)
+        tablo = pa_csv.read_csv(dosya, convert_options=pa_csv.ConvertOptions(**convert))
+    if arrow:
+        return tablo.to_pandas(types_mapper=pd.ArrowDtype)
+    return tablo.to_pandas()
+
+
+def _read_csv_pandas(dosya, names, tip_adlari):
+    """pyarrow yoksa COPY CSV çıktısını pandas ile okur; tarih tipli sütunlar ayrıca çevrilir."""
+    df = pd.read_csv(dosya, keep_default_na=False, na_values=[""], low_memory=False)
+    for ad, tip in zip(names, tip_adlari):
+        if is_date_type(tip) and ad in df.columns:
+            df[ad] = pd.to_datetime(df[ad], errors='coerce', utc="TIME ZONE" in str(tip).upper())
+    return df
+
+
+def _copy_header(dosya):
+    """CSV başlık satırından sütun adlarını okur ve dosyayı başa sarar."""
+    ilk_satir = dosya.readline()
+    dosya.seek(0)
+    return next(csv.reader(io.StringIO(ilk_satir.decode('utf-8'))), [])
+
+
+def run_copy_query(config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+                   date_column_name=VARSAYILAN_TARIH_SUTUNU, arrow=False):
+    """
+    (Worker Görevi) PostgreSQL'de tarih aralığı sorgusunu COPY (SELECT ...) TO STDOUT ile çeker.
+    Satırlar sürücüde tek tek Python nesnesine çevrilmez: sunucunun CSV çıktısı doğrudan
+    (bellekte, büyükse geçici dosyada) toplanıp sütun tabanlı okuyucuyla (pyarrow, yoksa pandas)
+    DataFrame'e dönüştürülür.
+    Yetki veya destek eksikliğinde normal sorgu yoluna (run_database_query / run_arrow_query) düşer.
+    """
+    yedek = run_arrow_query if arrow else run_database_query
+    if not copy_available(config):
+        return yedek(config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name)
+
+    print(f"Çalışan iş parçacığı: COPY ile toplu çekme başlatıldı. Tablo: {target_table}")
+
+    sql_query, params = build_range_query(
+        config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name
+    )
+    timer = QueryTimer()
+    with timer.phase('engine'):
+        engine = get_engine(config)
+        raw_conn = engine.raw_connection()
+    dbapi_hatasi = engine.dialect.dbapi.Error
+    df = None
+    try:
+        with tempfile.SpooledTemporaryFile(max_size=KOPYA_BELLEK_SINIRI) as dosya:
+            try:
+                with timer.phase('execute'):
+                    sorgu = _render_sql(engine, raw_conn, sql_query, params)
+                    copy_sql = f"COPY ({sorgu}) TO STDOUT WITH (FORMAT csv, HEADER true, ENCODING 'UTF8')"
+                    cursor = raw_conn.cursor()
+                    if not hasattr(cursor, 'copy_expert'):
+                        raise NotImplementedError("Sürücü COPY desteklemiyor (psycopg2 gerekli).")
+                    # Tarih/saat değerleri ISO biçiminde gelsin; sadece bu işlem (transaction) için geçerli
+                    cursor.execute("SET LOCAL DateStyle = 'ISO, YMD'")
+                with timer.phase('fetch'):
+                    cursor.copy_expert(copy_sql, dosya)
+                    cursor.close()
+                raw_conn.rollback()  # Salt okunur işlemi kapat (SET LOCAL da geri alınır)
+            except (dbapi_hatasi, NotImplementedError) as e:
+                raw_conn.rollback()
+                kod = getattr(e, 'pgcode', None)
+                if isinstance(e, NotImplementedError) or kod in _KALICI_HATALAR:
+                    with _copy_kapali_kilidi:
+                        _copy_kapali.add(config_key(config))
+                print(f"UYARI: COPY ile çekilemedi ({kod or e}), normal sorguya geçiliyor: {e}")
+            else:
+                with timer.phase('dataframe'):
+                    dosya.seek(0)
+                    names = _copy_header(dosya)
+                    tip_adlari = column_type_names(config, target_table, names)
+                    if ARROW_VAR:
+                        df = _read_csv_arrow(dosya, names, tip_adlari, arrow)
+                    else:
+                        df = _read_csv_pandas(dosya, names, tip_adlari)
+    finally:
+        raw_conn.close()  # Bağlantı havuza geri döner
+
+    if df is None:
+        # Bağlantı havuza döndükten sonra normal yoldan çek
+        return yedek(config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name)
+
+    record_query(f"{target_table} (copy)", config.get('type'), config_key(config)[:12],
+                 sql_query, params, len(df), timer)
+    print(f"Çalışan iş parçacığı: COPY ile çekme bitti. {len(df)} satır bulundu.")
+    return df
@@ -0,0 +1,188 @@
+# src/core/preflight.py
+
+import re
+import json
+import math
+import time
+import threading
+from contextlib import contextmanager
+
+from sqlalchemy import text
+
+from .database import (
+    get_engine, format_table_name, range_predicate, split_table_name, VARSAYILAN_TARIH_SUTUNU
+)
+from .schema_cache import schema_catalog, cached_table_info
+from .mirror import local_mirror, AYNA_TABLOSU
+
+# Ön kontrol sorgusu bu süreyi (saniye) aşarsa iptal edilir; sorgu tahminsiz başlar
+ON_KONTROL_ZAMAN_ASIMI = 3.0
+
+# Otomatik sorgu modu eşikleri (tahmini bellek boyutu, byte)
+OTOMATIK_BELLEK_SINIRI = 256 * 1024 ** 2   # Altı: tümünü yükle
+BUYUK_SONUC_SINIRI = 2 * 1024 ** 3         # Üstü: kullanıcı uyarılır, otomatik modda sayfalı gözatma
+
+# DataFrame'de bir hücrenin yaklaşık bellek karşılığı (byte)
+_SAYISAL_GENISLIK = 8     # int64/float64/datetime64/bool (pandas sütun dizisi)
+_METIN_GENISLIGI = 72     # Python str nesnesi (~49 byte başlık + ortalama içerik) ve işaretçisi
+_BILINMEYEN_GENISLIK = 16
+_SAYISAL_TIPLER = ("INT", "FLOAT", "DOUBLE", "REAL", "NUMERIC", "DECIMAL", "MONEY",
+                   "DATE", "TIME", "BOOL", "BIT", "SERIAL")
+_METIN_TIPLER = ("CHAR", "TEXT", "CLOB", "STRING", "UUID", "UNIQUEIDENTIFIER", "JSON", "XML")
+
+_SQL_SERVER_TAHMINI = re.compile(r'StatementEstRows="([0-9.eE+-]+)"')
+
+
+def _cell_width(type_name):
+    """SQL tip adından bir hücrenin DataFrame'deki yaklaşık boyutu."""
+    tip = str(type_name or "").upper()
+    if any(t in tip for t in _METIN_TIPLER):
+        return _METIN_GENISLIGI
+    if any(t in tip for t in _SAYISAL_TIPLER):
+        return _SAYISAL_GENISLIK
+    return _BILINMEYEN_GENISLIK
+
+
+def estimate_row_width(table_info, columns=None, date_column_name=None):
+    """Seçili sütunlara (None -> tümü) göre bir satırın DataFrame'deki yaklaşık boyutu (byte)."""
+    tipler = {c['name']: c.get('type') for c in table_info.get('columns', [])}
+    if columns:
+        secili = list(columns)
+        if date_column_name and date_column_name not in secili:
+            secili.append(date_column_name)
+    else:
+        secili = list(tipler)
+    return sum(_cell_width(tipler.get(ad)) for ad in secili) or _BILINMEYEN_GENISLIK
+
+
+@contextmanager
+def _time_limit(conn, db_type, saniye):
+    """
+    Bağlantıdaki sorguyu 'saniye' sonunda sürücü düzeyinde iptal ettirir.
+    PostgreSQL: statement_timeout (yalnızca bu işlem); SQLite/DuckDB: interrupt();
+    pyodbc (SQL Server/Access): sorgu zaman aşımı.
+    """
+    dbapi_conn = conn.connection.dbapi_connection
+    if db_type == 'postgres':
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(saniye * 1000)}")
+        yield
+        return
+    if hasattr(dbapi_conn, 'interrupt'):
+        zamanlayici = threading.Timer(saniye, dbapi_conn.interrupt)
+        zamanlayici.start()
+        try:
+            yield
+        finally:
+            zamanlayici.cancel()
+        return
+    if hasattr(dbapi_conn, 'timeout'):
+        onceki = dbapi_conn.timeout
+        dbapi_conn.timeout = max(1, math.ceil(saniye))
+        try:
+            yield
+        finally:
+            dbapi_conn.timeout = onceki
+        return
+    yield
+
+
+def _plan_rows(conn, db_type, sql_query, params):
+    """Planlayıcının tahmini satır sayısı (sorgu çalıştırılmaz). Desteklenmiyorsa None."""
+    if db_type == 'postgres':
+        plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql_query}"), params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    if db_type == 'sql':
+        conn.exec_driver_sql("SET SHOWPLAN_XML ON")
+        try:
+            plan = "".join(row[0] for row in conn.execute(text(sql_query), params))
+        finally:
+            conn.exec_driver_sql("SET SHOWPLAN_XML OFF")
+        eslesme = _SQL_SERVER_TAHMINI.search(plan)
+        return int(float(eslesme.group(1))) if eslesme else None
+    return None
+
+
+def _catalog_rows(config, target_table):
+    """Şema kataloğundaki tablo satır sayısı (tüm tablo; aralık için üst sınır). Yoksa None."""
+    kayit = schema_catalog.get_tables(config)
+    if not kayit:
+        return None
+    schema_name, table_name = split_table_name(target_table)
+    for tablo in kayit[0]:
+        if tablo['name'] == target_table or (tablo['table'] == table_name and tablo['schema'] == schema_name):
+            return tablo.get('rows')
+    return None
+
+
+def estimate_result_size(config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+                         date_column_name=VARSAYILAN_TARIH_SUTUNU, timeout=ON_KONTROL_ZAMAN_ASIMI):
+    """
+    (Worker Görevi) Tarih aralığı sorgusunun sonuç boyutunu veri çekmeden tahmin eder.
+    PostgreSQL ve SQL Server'da planlayıcı istatistikleri (EXPLAIN), diğerlerinde tarih
+    indeksi üzerinden COUNT(*) kullanılır; sorgu 'timeout' saniyede iptal edilir.
+    Tablonun güncel yerel aynası varsa sayım aynada yapılır.
+    Olmazsa şema kataloğundaki tablo satır sayısı üst sınır olarak verilir.
+    Dönüş: {'rows', 'bytes', 'source' ('plan' | 'count' | 'catalog' | None), 'exact', 'seconds'}
+    """
+    print(f"Çalışan iş parçacığı: Sonuç boyutu tahmin ediliyor. Tablo: {target_table}")
+    t0 = time.perf_counter()
+    sorgu_config, sorgu_tablosu = config, target_table
+    ayna = local_mirror.fresh_path(config, target_table, date_column_name, baslangic_tarihi, bitis_tarihi)
+    if ayna:
+        # Sorgu yerel aynadan yanıtlanacak: sayım da aynada yapılır, kaynağa gidilmez
+        sorgu_config, sorgu_tablosu = local_mirror.mirror_config(ayna), AYNA_TABLOSU
+    db_type = sorgu_config.get('type')
+    where_sql, params = range_predicate(db_type, date_column_name, baslangic_tarihi, bitis_tarihi)
+    formatted_table_name = format_table_name(db_type, sorgu_tablosu)
+
+    satir, kaynak = None, None
+    try:
+        with get_engine(sorgu_config).connect() as conn:
+            with _time_limit(conn, db_type, timeout):
+                if db_type in ('postgres', 'sql'):
+                    satir = _plan_rows(conn, db_type, f"SELECT 1 FROM {formatted_table_name} WHERE {where_sql}", params)
+                    kaynak = 'plan'
+                else:
+                    # Yalnızca tarih indeksi okunur (index-only); tablo satırlarına gidilmez
+                    satir = conn.execute(
+                        text(f"SELECT COUNT(*) FROM {formatted_table_name} WHERE {where_sql}"), params
+                    ).scalar()
+                    kaynak = 'count'
+    except Exception as e:
+        print(f"UYARI: Sonuç boyutu tahmin edilemedi ({type(e).__name__}): {e}")
+        satir, kaynak = None, None
+
+    if satir is None:
+        satir = _catalog_rows(config, target_table)
+        kaynak = 'catalog' if satir is not None else None
+
+    boyut = None
+    if satir is not None:
+        table_info = cached_table_info(config, target_table)
+        boyut = int(satir) * estimate_row_width(table_info, columns, date_column_name)
+
+    tahmin = {
+        'rows': int(satir) if satir is not None else None,
+        'bytes': boyut,
+        'source': kaynak,
+        'exact': kaynak == 'count',
+        'seconds': time.perf_counter() - t0,
+    }
+    print(f"Çalışan iş parçacığı: Tahmin: {tahmin['rows']} satır, {boyut} byte ({kaynak}).")
+    return tahmin
+
+
+def choose_strategy(tahmin):
+    """
+    Tahmine göre sorgu modu: 'bellek' (tümünü yükle), 'akis' (parça parça) veya 'gozat' (sayfalı).
+    Boyut bilinmiyorsa tümünü yükle. Çok büyük sonuçlar için özet rapor arayüzde önerilir.
+    """
+    boyut = (tahmin or {}).get('bytes')
+    if boyut is None or boyut < OTOMATIK_BELLEK_SINIRI:
+        return 'bellek'
+    if boyut < BUYUK_SONUC_SINIRI:
+        return 'akis'
+    return 'gozat'
+
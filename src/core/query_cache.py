@@ -0,0 +1,444 @@
+# src/core/query_cache.py
+
+import os
+import time
+import json
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+
+import pandas as pd
+
+from .database import (
+    config_key, run_database_query, run_parallel_range_query, stream_database_query,
+    VARSAYILAN_TARIH_SUTUNU
+)
+
+from .arrow_fetch import ARROW_VAR, run_arrow_query, to_backend
+from .pg_copy import run_copy_query, copy_available
+from .mirror import answer_from_mirror
+
+# Parquet için pyarrow gerekir; yoksa disk katmanı pickle kullanır
+DISK_FORMATI = "parquet" if ARROW_VAR else "pickle"
+
+ONBELLEK_KLASORU = os.path.join(os.path.expanduser("~"), ".admintabletool", "sorgu_onbellek")
+BELLEK_SINIRI = 512 * 1024 * 1024       # Bellekteki LRU katmanı için üst sınır (byte)
+DISK_SINIRI = 2 * 1024 * 1024 * 1024    # Disk katmanı için üst sınır (byte)
+ONBELLEK_OMRU = 12 * 60 * 60            # TTL (saniye); bundan eski kayıtlar kullanılmaz
+
+
+def frame_nbytes(df):
+    """DataFrame'in bellekte kapladığı yaklaşık alanı (byte) döndürür."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class MemoryLRU:
+    """
+    Boyut sınırlı, iş parçacığı güvenli LRU önbellek.
+    Sınır aşıldığında en uzun süredir kullanılmayan kayıtlar atılır.
+    """
+
+    def __init__(self, max_bytes, sizeof=frame_nbytes):
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._items = OrderedDict()  # anahtar -> (değer, boyut, eklenme_zamanı)
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, max_age=None):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            value, _, created = item
+            if max_age is not None and time.time() - created > max_age:
+                self._remove(key)
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value, created=None):
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            if size > self.max_bytes:
+                return  # Tek başına sınırı aşan kayıt bellekte tutulmaz
+            self._items[key] = (value, size, created or time.time())
+            self._total += size
+            while self._total > self.max_bytes:
+                oldest = next(iter(self._items))
+                self._remove(oldest)
+
+    def pop(self, key):
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._total = 0
+
+    def _remove(self, key):
+        _, size, _ = self._items.pop(key)
+        self._total -= size
+
+
+class QueryCache:
+    """
+    Sorgu sonuçları için iki katmanlı önbellek: bellekte LRU, diskte Parquet dosyaları.
+    Kayıtlar ONBELLEK_OMRU'ndan eskiyse yok sayılır; disk katmanı DISK_SINIRI'nı
+    aşınca en eski dosyalar silinir.
+    """
+
+    def __init__(self, folder=ONBELLEK_KLASORU, memory_bytes=BELLEK_SINIRI,
+                 disk_bytes=DISK_SINIRI, ttl=ONBELLEK_OMRU):
+        self.folder = folder
+        self.disk_bytes = disk_bytes
+        self.ttl = ttl
+        self.memory = MemoryLRU(memory_bytes)
+        self._disk_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(config, target_table, date_column, baslangic_tarihi, bitis_tarihi, columns=None):
+        """Bağlantı, tablo, tarih sütunu, aralık ve sütun seçiminden önbellek anahtarı üretir."""
+        raw = json.dumps([
+            config_key(config), target_table, date_column,
+            str(baslangic_tarihi), str(bitis_tarihi), list(columns) if columns else None
+        ])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        uzanti = "parquet" if DISK_FORMATI == "parquet" else "pkl"
+        return os.path.join(self.folder, f"{key}.{uzanti}")
+
+    def get(self, key, arrow=False):
+        """
+        Önce bellekte, sonra diskte arar. Bulunamazsa veya süresi dolmuşsa None döner.
+        'arrow' True ise Parquet dosyası doğrudan pd.ArrowDtype sütunlarıyla okunur.
+        """
+        df = self.memory.get(key, max_age=self.ttl)
+        if df is not None:
+            return df
+
+        path = self._path(key)
+        try:
+            created = os.path.getmtime(path)
+        except OSError:
+            return None
+        if time.time() - created > self.ttl:
+            self._remove_file(path)
+            return None
+
+        try:
+            if DISK_FORMATI == "parquet":
+                df = pd.read_parquet(path, dtype_backend='pyarrow') if arrow else pd.read_parquet(path)
+            else:
+                df = pd.read_pickle(path)
+        except Exception as e:
+            print(f"UYARI: Önbellek dosyası okunamadı, siliniyor: {path} ({e})")
+            self._remove_file(path)
+            return None
+
+        self.memory.put(key, df, created=created)
+        return df
+
+    def put(self, key, df):
+        """Sonucu bellek katmanına ve diske yazar (disk yazımı başarısız olursa sadece bellekte kalır)."""
+        self.memory.put(key, df)
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            if DISK_FORMATI == "parquet":
+                df.to_parquet(tmp_path, index=False)
+            else:
+                df.to_pickle(tmp_path)
+            os.replace(tmp_path, path)  # Yarım yazılmış dosya asla okunmasın
+        except Exception as e:
+            print(f"UYARI: Sorgu sonucu diske önbelleklenemedi: {e}")
+            return
+        self._evict_disk()
+
+    def has(self, key):
+        """Anahtar için taze bir kayıt var mı? (Diskteki dosyayı okumadan kontrol eder.)"""
+        if key in self.memory:
+            return True
+        try:
+            return time.time() - os.path.getmtime(self._path(key)) <= self.ttl
+        except OSError:
+            return False
+
+    def invalidate(self, key):
+        self.memory.pop(key)
+        self._remove_file(self._path(key))
+
+    def clear(self):
+        """Bellekteki ve diskteki tüm kayıtları siler."""
+        self.memory.clear()
+        with self._disk_lock:
+            for entry in self._disk_entries():
+                self._remove_file(entry.path)
+
+    def _disk_entries(self):
+        try:
+            return [e for e in os.scandir(self.folder) if e.is_file() and not e.name.endswith('.tmp')]
+        except OSError:
+            return []
+
+    def _evict_disk(self):
+        """Disk katmanı sınırı aşıldıysa en eski dosyaları siler."""
+        with self._disk_lock:
+            entries = []
+            for entry in self._disk_entries():
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.disk_bytes:
+                    break
+                self._remove_file(path)
+                total -= size
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# Uygulama genelinde paylaşılan önbellek
+result_cache = QueryCache()
+
+
+# --- Günlük bölümler (partition) ---
+# Sonuçlar her gün için ayrı kaydedilir. Yeni bir aralık istendiğinde yalnızca
+# önbellekte olmayan günler veritabanından çekilir, gerisi önbellekten birleştirilir.
+
+def _partition_key(config, target_table, gun, columns=None, date_column_name=VARSAYILAN_TARIH_SUTUNU):
+    return QueryCache.make_key(
+        config, target_table, date_column_name, gun.isoformat(), gun.isoformat(), columns
+    )
+
+
+def _is_cacheable(gun):
+    """Bugün ve sonrası henüz tamamlanmadığı için önbelleğe alınmaz."""
+    return gun < date.today()
+
+
+def _days(baslangic_tarihi, bitis_tarihi):
+    bas = date.fromisoformat(str(baslangic_tarihi)[:10])
+    bit = date.fromisoformat(str(bitis_tarihi)[:10])
+    return [bas + timedelta(days=i) for i in range((bit - bas).days + 1)]
+
+
+def _plan_partitions(config, target_table, baslangic_tarihi, bitis_tarihi, force_refresh, columns=None,
+                     date_column_name=VARSAYILAN_TARIH_SUTUNU, arrow=False):
+    """
+    Aralığı tarih sırasıyla adımlara böler:
+    ('onbellek', gün, df) -> önbellekteki gün, ('sorgu', ilk_gün, son_gün) -> çekilecek aralık.
+    Art arda eksik günler tek bir sorgu aralığında birleştirilir.
+    """
+    plan = []
+    for gun in _days(baslangic_tarihi, bitis_tarihi):
+        df = None
+        if not force_refresh and _is_cacheable(gun):
+            df = result_cache.get(_partition_key(config, target_table, gun, columns, date_column_name), arrow)
+        if df is not None:
+            plan.append(('onbellek', gun, df))
+        elif plan and plan[-1][0] == 'sorgu':
+            plan[-1] = ('sorgu', plan[-1][1], gun)
+        else:
+            plan.append(('sorgu', gun, gun))
+    return plan
+
+
+def _store_partitions(config, target_table, df, ilk_gun, son_gun, columns=None, skip_existing=False,
+                      date_column_name=VARSAYILAN_TARIH_SUTUNU):
+    """[ilk_gün, son_gün] aralığının sonucunu günlere bölerek önbelleğe yazar (boş günler dahil)."""
+    if date_column_name not in df.columns:
+        return
+    gunler = pd.to_datetime(df[date_column_name], errors='coerce').dt.date
+    # Günü belirlenemeyen (çevrilemeyen ya da aralık dışına düşen) satır varsa o günler
+    # eksik kaydedilir ve "tam" sayılırdı: sonuç hiç bölümlenmez
+    aralikta = gunler.notna() & (gunler >= ilk_gun) & (gunler <= son_gun)
+    if not aralikta.all():
+        print(f"UYARI: '{date_column_name}' değerlerinin {int((~aralikta).sum())} tanesi güne "
+              f"çevrilemedi; sonuç günlük önbelleğe yazılmadı.")
+        return
+    gruplar = {gun: idx for gun, idx in df.groupby(gunler, sort=False).indices.items()}
+    bos = df.iloc[0:0]
+    gun = ilk_gun
+    while gun <= son_gun:
+        if _is_cacheable(gun):
+            key = _partition_key(config, target_table, gun, columns, date_column_name)
+            if not (skip_existing and result_cache.has(key)):
+                idx = gruplar.get(gun)
+                parca = bos if idx is None else df.iloc[idx].reset_index(drop=True)
+                result_cache.put(key, parca)
+        gun += timedelta(days=1)
+
+
+def _concat_ordered(parcalar, arrow=False):
+    # Bellek katmanındaki parçalar başka bir modda çekilmiş olabilir: sütun tiplerini eşitle
+    parcalar = [to_backend(p, arrow) for p in parcalar]
+    dolu = [p for p in parcalar if not p.empty]
+    if not dolu:
+        return parcalar[0] if parcalar else pd.DataFrame()
+    if len(dolu) == 1:
+        return dolu[0]
+    return pd.concat(dolu, ignore_index=True)
+
+
+def _fetch_range(config, target_table, baslangic_tarihi, bitis_tarihi, columns, paralel, date_column_name,
+                 arrow=False, bulk_copy=False, progress_callback=None):
+    """
+    Aralığı seçili yoldan çeker. Tablonun güncel yerel aynası aralığı kapsıyorsa hangi yol
+    seçilmiş olursa olsun sonuç aynadan gelir; kaynağa gidilmez.
+    'progress_callback' yalnızca satır satır okunan normal sorguda parça parça çağrılır;
+    diğer yollarda ilerleme aralık bittiğinde bildirilir.
+    """
+    df = answer_from_mirror(config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name)
+    if df is not None:
+        return to_backend(df, arrow)
+    if bulk_copy and copy_available(config):
+        query_func = functools.partial(run_copy_query, arrow=arrow)
+    elif arrow:
+        query_func = run_arrow_query
+    elif progress_callback and not (paralel and paralel > 1):
+        query_func = functools.partial(run_database_query, progress_callback=progress_callback)
+    else:
+        query_func = run_database_query
+    if paralel and paralel > 1:
+        return run_parallel_range_query(
+            config, target_table, baslangic_tarihi, bitis_tarihi, columns, parca_sayisi=paralel,
+            date_column_name=date_column_name, query_func=query_func
+        )
+    return query_func(config, target_table, baslangic_tarihi, bitis_tarihi, columns, date_column_name)
+
+
+def cached_database_query(config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+                          force_refresh=False, paralel=0, date_column_name=VARSAYILAN_TARIH_SUTUNU,
+                          arrow=False, bulk_copy=False, partial_callback=None, is_cancelled=None):
+    """
+    (Worker Görevi) run_database_query'nin önbellekli hali.
+    Önbellekteki günler diskten/bellekten alınır; yalnızca eksik günler için
+    veritabanına yarı açık aralık sorguları gönderilir ve sonuç tarih sırasıyla birleştirilir.
+    'force_refresh' True ise tüm aralık yeniden çekilir ve önbellek güncellenir.
+    'paralel' > 1 ise eksik aralıklar o kadar dilime bölünüp eşzamanlı çekilir.
+    'arrow' True ise eksik aralıklar run_arrow_query ile çekilir ve sonuç pd.ArrowDtype sütunludur.
+    'bulk_copy' True ise PostgreSQL'de eksik aralıklar COPY ... TO STDOUT ile toplu çekilir.
+    'partial_callback' verilirse o ana kadar hazır olan toplam satır sayısı (int) bildirilir.
+    'is_cancelled' True dönerse sıradaki eksik aralıklar çekilmez ve None döner
+    (çekilmiş aralıklar önbellekte kalır).
+    """
+    plan = _plan_partitions(
+        config, target_table, baslangic_tarihi, bitis_tarihi, force_refresh, columns, date_column_name, arrow
+    )
+    if not plan:
+        return _fetch_range(
+            config, target_table, baslangic_tarihi, bitis_tarihi, columns, paralel, date_column_name, arrow,
+            bulk_copy, progress_callback=partial_callback
+        )
+
+    parcalar = []
+    hazir = 0  # Önceki adımlardan gelen satır sayısı
+    for adim in plan:
+        if adim[0] == 'onbellek':
+            parcalar.append(adim[2])
+            hazir += len(adim[2])
+            if partial_callback:
+                partial_callback(hazir)
+            continue
+        if is_cancelled and is_cancelled():
+            print("Çalışan iş parçacığı: Sorgulama iptal edildi.")
+            return None
+        _, ilk_gun, son_gun = adim
+        ilerleme = None
+        if partial_callback:
+            ilerleme = functools.partial(lambda onceki, okunan: partial_callback(onceki + okunan), hazir)
+        df = _fetch_range(
+            config, target_table, ilk_gun.isoformat(), son_gun.isoformat(), columns, paralel,
+            date_column_name, arrow, bulk_copy, progress_callback=ilerleme
+        )
+        _store_partitions(config, target_table, df, ilk_gun, son_gun, columns, date_column_name=date_column_name)
+        parcalar.append(df)
+        hazir += len(df)
+        if partial_callback:
+            partial_callback(hazir)
+
+    onbellek_gunu = sum(1 for adim in plan if adim[0] == 'onbellek')
+    print(f"Çalışan iş parçacığı: {onbellek_gunu} gün önbellekten, "
+          f"{len(plan) - onbellek_gunu} aralık veritabanından alındı.")
+    return _concat_ordered(parcalar, arrow)
+
+
+def cached_stream_query(config, target_table, baslangic_tarihi, bitis_tarihi, columns=None,
+                        force_refresh=False, partial_callback=None, date_column_name=VARSAYILAN_TARIH_SUTUNU,
+                        is_cancelled=None):
+    """
+    (Worker Görevi) stream_database_query'nin önbellekli hali.
+    Önbellekteki günler tek parça, eksik aralıklar akışla ve tarih sırasıyla iletilir.
+    (toplam_satır, tamamı_önbellekten_mi) döndürür; akışla gelen sonuç arayüzde
+    birleştirildikten sonra store_query_result ile saklanır.
+    'is_cancelled' True dönerse akış ilk fırsatta durur.
+    """
+    plan = _plan_partitions(
+        config, target_table, baslangic_tarihi, bitis_tarihi, force_refresh, columns, date_column_name
+    )
+    if not plan:
+        # Geçersiz (ters) aralık: saklanacak gün yok
+        toplam = stream_database_query(
+            config, target_table, baslangic_tarihi, bitis_tarihi, columns,
+            partial_callback=partial_callback, date_column_name=date_column_name, is_cancelled=is_cancelled
+        )
+        return toplam, True
+
+    toplam = 0
+    for adim in plan:
+        if is_cancelled and is_cancelled():
+            break
+        if adim[0] == 'onbellek':
+            df = to_backend(adim[2], False)  # Akış parçaları NumPy tipleriyle birleştirilir
+            if partial_callback and not df.empty:
+                partial_callback(df)
+            toplam += len(df)
+        else:
+            _, ilk_gun, son_gun = adim
+            df = answer_from_mirror(
+                config, target_table, ilk_gun.isoformat(), son_gun.isoformat(), columns, date_column_name
+            )
+            if df is not None:
+                # Güncel aynadan gelen aralık tek parça olarak iletilir
+                if partial_callback and not df.empty:
+                    partial_callback(df)
+                toplam += len(df)
+                continue
+            toplam += stream_database_query(
+                config, target_table, ilk_gun.isoformat(), son_gun.isoformat(), columns,
+                partial_callback=partial_callback, date_column_name=date_column_name, is_cancelled=is_cancelled
+            )
+    return toplam, all(adim[0] == 'onbellek' for adim in plan)
+
+
+def store_query_result(config, target_table, baslangic_tarihi, bitis_tarihi, columns, df,
+                       date_column_name=VARSAYILAN_TARIH_SUTUNU):
+    """(Worker Görevi) Akış modunda birleştirilen sonucu günlere bölüp önbellekte olmayanları yazar."""
+    gunler = _days(baslangic_tarihi, bitis_tarihi)
+    if gunler:
+        _store_partitions(
+            config, target_table, df, gunler[0], gunler[-1], columns,
+            skip_existing=True, date_column_name=date_column_name
+        )
+    return len(df)
@@ -0,0 +1,87 @@
+# src/core/report_cache.py
+
+import os
+import json
+import hashlib
+import threading
+
+from .query_cache import QueryCache
+
+RAPOR_ONBELLEK_KLASORU = os.path.join(os.path.expanduser("~"), ".admintabletool", "rapor_onbellek")
+RAPOR_BELLEK_SINIRI = 256 * 1024 ** 2  # Byte; geçmiş raporlar arasında gezinirken bellekte tutulanlar
+RAPOR_DISK_SINIRI = 2 * 1024 ** 3      # Byte; aşılınca en eski sütunlu kopyalar silinir
+
+
+def report_key(tam_yol):
+    """
+    Rapor dosyasının yolu, değişiklik zamanı ve boyutundan üretilen anahtar.
+    Dosya değişirse anahtar da değişir; eski kopya hiç okunmaz, zamanla silinir.
+    """
+    stat = os.stat(tam_yol)
+    raw = json.dumps([os.path.normcase(os.path.abspath(tam_yol)), stat.st_mtime_ns, stat.st_size])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+# Excel raporlarının ayrıştırılmış sütunlu (Parquet) kopyaları. Raporlar kaydedildikten sonra
+# değişmez: süre sınırı yoktur, geçerlilik anahtardaki değişiklik zamanı ve boyutla sağlanır.
+report_cache = QueryCache(
+    folder=RAPOR_ONBELLEK_KLASORU, memory_bytes=RAPOR_BELLEK_SINIRI,
+    disk_bytes=RAPOR_DISK_SINIRI, ttl=float('inf')
+)
+
+# Dosya başına okuma kilidi: ön yüklemenin okuduğu raporu kullanıcı da açarsa
+# dosya ikinci kez ayrıştırılmaz, ilk okumanın bitmesi beklenir
+_okuma_kilitleri = {}
+_okuma_kilitleri_lock = threading.Lock()
+
+
+def report_load_lock(tam_yol):
+    with _okuma_kilitleri_lock:
+        return _okuma_kilitleri.setdefault(os.path.normcase(os.path.abspath(tam_yol)), threading.Lock())
+
+
+def get_cached_report(tam_yol):
+    """Raporun sütunlu kopyası varsa döndürür, yoksa (veya dosya okunamıyorsa) None."""
+    try:
+        key = report_key(tam_yol)
+    except OSError:
+        return None
+    return report_cache.get(key)
+
+
+def store_report(tam_yol, df):
+    """Raporun DataFrame'ini, dosyanın şu anki haline bağlı olarak önbelleğe yazar."""
+    try:
+        key = report_key(tam_yol)
+    except OSError as e:
+        print(f"UYARI: Rapor önbelleğe alınamadı ({tam_yol}): {e}")
+        return
+    # Excel'e dizin yazılmaz; okunan rapor da 0'dan başlayan dizinle gelir
+    report_cache.put(key, df.reset_index(drop=True))
+
+
+def prefetch_reports(yollar, is_cancelled=None):
+    """
+    (Worker Görevi) Raporları verilen sırayla okuyup önbelleğe alır; bellekte olanlar atlanır.
+    Her dosyadan önce 'is_cancelled' sorulur, True dönerse kalanlar okunmaz.
+    Okunan rapor sayısını döndürür.
+    """
+    from .database import load_excel_file
+
+    okunan = 0
+    for tam_yol in yollar:
+        if is_cancelled and is_cancelled():
+            print("Çalışan iş parçacığı: Rapor ön yüklemesi iptal edildi.")
+            break
+        try:
+            if report_key(tam_yol) in report_cache.memory:
+                continue
+        except OSError:
+            continue
+        try:
+            load_excel_file(tam_yol)
+        except Exception as e:
+            print(f"UYARI: Rapor önceden okunamadı ({tam_yol}): {e}")
+            continue
+        okunan += 1
+    return okunan
@@ -0,0 +1,145 @@
+# src/core/schema_cache.py
+
+import os
+import json
+import time
+import threading
+
+from .database import config_key, get_database_tables, get_table_info
+
+SEMA_KLASORU = os.path.join(os.path.expanduser("~"), ".admintabletool", "sema_onbellek")
+SEMA_OMRU = 24 * 60 * 60    # TTL (saniye); daha eski katalog gösterilir ama arka planda yenilenir
+KATALOG_SURUMU = 2          # Dosya biçimi değiştiğinde artırılır; eski dosyalar yok sayılır
+
+
+class SchemaCatalog:
+    """
+    Bağlantı başına diskte tutulan şema kataloğu (tablo listesi ve tablo yapıları).
+    Her bağlantı, ayarlarının özetiyle (config_key) adlandırılmış tek bir JSON dosyasıdır.
+    Tablo listesi ve her tablonun yapısı ayrı zaman damgası taşır.
+    """
+
+    def __init__(self, directory=SEMA_KLASORU, max_age=SEMA_OMRU):
+        self.directory = directory
+        self.max_age = max_age
+        self._catalogs = {}  # config_key -> katalog sözlüğü (bellekteki kopya)
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load(self, key):
+        """Kataloğu bellekten, yoksa diskten okur. Kilit altında çağrılmalıdır."""
+        catalog = self._catalogs.get(key)
+        if catalog is None:
+            try:
+                with open(self._path(key), 'r', encoding='utf-8') as f:
+                    catalog = json.load(f)
+            except (OSError, ValueError):
+                catalog = {}
+            if catalog.get('version') != KATALOG_SURUMU:
+                catalog = {'version': KATALOG_SURUMU}
+            catalog.setdefault('tables', None)
+            catalog.setdefault('table_info', {})
+            self._catalogs[key] = catalog
+        return catalog
+
+    def _save(self, key, catalog):
+        """Kataloğu diske atomik olarak yazar. Kilit altında çağrılmalıdır."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(catalog, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"UYARI: Şema kataloğu diske yazılamadı: {e}")
+
+    def is_fresh(self, saved_at):
+        return saved_at is not None and time.time() - saved_at <= self.max_age
+
+    def get_tables(self, config):
+        """Kayıtlı tablo listesini (tablolar, kayıt_zamanı) olarak döndürür; yoksa None."""
+        with self._lock:
+            entry = self._load(config_key(config))['tables']
+        if not entry:
+            return None
+        return entry['items'], entry['saved_at']
+
+    def put_tables(self, config, tables):
+        key = config_key(config)
+        with self._lock:
+            catalog = self._load(key)
+            catalog['tables'] = {'items': list(tables), 'saved_at': time.time()}
+            self._save(key, catalog)
+
+    def get_table_info(self, config, target_table):
+        """Kayıtlı tablo yapısını (bilgi, kayıt_zamanı) olarak döndürür; yoksa None."""
+        with self._lock:
+            entry = self._load(config_key(config))['table_info'].get(target_table)
+        if not entry:
+            return None
+        return entry['info'], entry['saved_at']
+
+    def put_table_info(self, config, target_table, info):
+        key = config_key(config)
+        with self._lock:
+            catalog = self._load(key)
+            catalog['table_info'][target_table] = {'info': info, 'saved_at': time.time()}
+            self._save(key, catalog)
+
+    def invalidate(self, config):
+        """Bir bağlantının kataloğunu bellekten ve diskten siler."""
+        key = config_key(config)
+        with self._lock:
+            self._catalogs.pop(key, None)
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"UYARI: Şema kataloğu silinemedi: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._catalogs.clear()
+            if not os.path.isdir(self.directory):
+                return
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+
+
+# Uygulama genelinde paylaşılan katalog
+schema_catalog = SchemaCatalog()
+
+
+def refresh_database_tables(config):
+    """(Worker Görevi) Tablo listesini veritabanından okur ve kataloğa yazar."""
+    all_tables, engine = get_database_tables(config)
+    schema_catalog.put_tables(config, all_tables)
+    return all_tables, engine
+
+
+def cached_table_info(config, target_table, force_refresh=False):
+    """
+    (Worker Görevi) Tablo yapısını (sütunlar, birincil anahtar, indeksler) döndürür.
+    Katalogda süresi dolmamış kayıt varsa veritabanına gidilmez.
+    """
+    if not force_refresh:
+        cached = schema_catalog.get_table_info(config, target_table)
+        if cached is not None and schema_catalog.is_fresh(cached[1]):
+            print(f"Çalışan iş parçacığı: Tablo yapısı katalogdan okundu -> {target_table}")
+            return cached[0]
+    info = get_table_info(config, target_table)
+    schema_catalog.put_table_info(config, target_table, info)
+    return info
+
+
+def cached_table_columns(config, target_table, force_refresh=False):
+    """(Worker Görevi) Tablonun sütunlarını katalog üzerinden döndürür."""
+    return cached_table_info(config, target_table, force_refresh)['columns']
@@ -0,0 +1,77 @@
+# src/core/sorting.py
+
+import numpy as np
+import pandas as pd
+
+# Türkçe alfabe sırası (q, w, x Latin alfabesindeki yerlerine eklendi)
+TURKCE_ALFABE = "abcçdefgğhıijklmnoöpqrsştuüvwxyz"
+
+# Harfleri Unicode özel kullanım alanına taşı: rakam ve noktalama işaretlerinden
+# sonra, fakat kendi aralarında Türkçe alfabe sırasında karşılaştırılırlar.
+_HARF_KODLARI = {harf: chr(0xE000 + i) for i, harf in enumerate(TURKCE_ALFABE)}
+_HARF_KODLARI.update({'â': _HARF_KODLARI['a'], 'î': _HARF_KODLARI['i'], 'û': _HARF_KODLARI['u']})
+_HARF_TABLOSU = str.maketrans(_HARF_KODLARI)
+
+# Python'un lower() metodu 'I' -> 'i' yapar; Türkçede 'I' -> 'ı', 'İ' -> 'i' olmalı
+_KUCUK_HARF_TABLOSU = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+
+def turkish_collation_key(text):
+    """Metni, Türkçe alfabe sırasına göre karşılaştırılabilen bir anahtara çevirir."""
+    return str(text).translate(_KUCUK_HARF_TABLOSU).lower().translate(_HARF_TABLOSU)
+
+
+def column_sort_key(series):
+    """
+    Bir sütun için (sıra_numaraları, boş_mu) dizilerini döndürür.
+    Sıra numaraları int64'tür; eşit değerler aynı numarayı alır. Metin sütunları
+    Türkçe sıralama anahtarına göre numaralanır. Sonuç sütun başına bir kez
+    hesaplanıp saklanabilir; sonraki sıralamalar yalnızca diziler üzerinde çalışır.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+
+    is_na = series.isna().to_numpy(dtype=bool)
+
+    if pd.api.types.is_bool_dtype(series.dtype) or pd.api.types.is_numeric_dtype(series.dtype):
+        values = pd.to_numeric(series, errors='coerce')
+    elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+        values = series
+    else:
+        # Metin (veya karışık) sütun: Türkçe anahtarlar
+        values = series.map(turkish_collation_key, na_action='ignore')
+
+    try:
+        codes, _ = pd.factorize(values, sort=True)
+    except TypeError:
+        # Karşılaştırılamayan karışık tipler: metin olarak sırala
+        codes, _ = pd.factorize(
+            series.map(turkish_collation_key, na_action='ignore'), sort=True
+        )
+
+    ranks = np.asarray(codes, dtype=np.int64)
+    return ranks, is_na
+
+
+def compute_sort_order(df, sort_spec, key_cache=None):
+    """
+    (Worker Görevi) Çok sütunlu, kararlı (stable) sıralama için permütasyon dizisini hesaplar.
+    'sort_spec' -> [(sütun_no, artan_mı), ...]; ilk eleman birincil anahtardır.
+    Boş değerler yönden bağımsız olarak en sona konur.
+    'key_cache' verilirse sütun anahtarları bu sözlükte saklanır ve tekrar kullanılır.
+    """
+    if key_cache is None:
+        key_cache = {}
+
+    keys = []
+    # np.lexsort son anahtarı birincil kabul eder: en önemsizden başla
+    for column, ascending in reversed(sort_spec):
+        if column not in key_cache:
+            key_cache[column] = column_sort_key(df.iloc[:, column])
+        ranks, is_na = key_cache[column]
+        keys.append(ranks if ascending else -ranks)
+        keys.append(is_na)
+
+    if not keys:
+        return np.arange(len(df), dtype=np.int64)
+    return np.lexsort(keys).astype(np.int64, copy=False)
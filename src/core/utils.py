@@ -1,15 +1,37 @@
+import importlib
+import threading
 
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+# reportlab yalnızca ilk PDF dışa aktarımında yüklenir (açılış süresine eklenmez)
+_pdf_fontlari = None  # (normal, kalın) font adları; None -> henüz kaydedilmedi
+_font_kilidi = threading.Lock()
 
 
-# --- PDF Font Ayarı (Değişiklik yok) ---
+# --- PDF Font Ayarı ---
 def register_pdf_fonts():
-    try:
-        pdfmetrics.registerFont(TTFont('Arial', r'C:\Windows\Fonts\arial.ttf'))
-        pdfmetrics.registerFont(TTFont('Arial_Bold', r'C:\Windows\Fonts\arialbd.ttf'))
-        print("PDF fontları (Arial) başarıyla yüklendi.")
-    except Exception as e:
-        print(f"UYARI: PDF fontları yüklenemedi. Hata: {e}")
-        pdfmetrics.registerFont(TTFont('Arial', 'Helvetica'))
-        pdfmetrics.registerFont(TTFont('Arial_Bold', 'Helvetica-Bold'))
+    """
+    PDF fontlarını (Arial) bir kez kaydeder ve (normal, kalın) font adlarını döndürür.
+    Arial bulunamazsa reportlab'in yerleşik Helvetica fontları kullanılır.
+    """
+    global _pdf_fontlari
+    with _font_kilidi:
+        if _pdf_fontlari is not None:
+            return _pdf_fontlari
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        try:
+            pdfmetrics.registerFont(TTFont('Arial', r'C:\Windows\Fonts\arial.ttf'))
+            pdfmetrics.registerFont(TTFont('Arial_Bold', r'C:\Windows\Fonts\arialbd.ttf'))
+            print("PDF fontları (Arial) başarıyla yüklendi.")
+            _pdf_fontlari = ('Arial', 'Arial_Bold')
+        except Exception as e:
+            print(f"UYARI: PDF fontları yüklenemedi, Helvetica kullanılacak. Hata: {e}")
+            _pdf_fontlari = ('Helvetica', 'Helvetica-Bold')
+        return _pdf_fontlari
+
+
+def preload_modules(modul_adlari):
+    """(Worker Görevi) Ağır modülleri arka planda içe aktarır; ilk kullanımda beklenmez."""
+    for ad in modul_adlari:
+        importlib.import_module(ad)
+    print(f"Çalışan iş parçacığı: {len(modul_adlari)} modül önceden yüklendi.")
+    return modul_adlari
@@ -1,10 +1,13 @@
 # src/threading/workers.py
+import inspect
+import threading
 import traceback
 from PyQt6.QtCore import QRunnable, QObject, pyqtSignal
 
 class WorkerSignals(QObject):
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
+    partial = pyqtSignal(object)  # Akış modunda parça parça gelen ara sonuçlar
 
 class Worker(QRunnable):
     def __init__(self, fn, *args, **kwargs):
@@ -13,13 +16,42 @@ class Worker(QRunnable):
         self.args = args
         self.kwargs = kwargs
         self.signals = WorkerSignals()
+        self._iptal = threading.Event()
+
+        parametreler = inspect.signature(fn).parameters
+        # Görev 'partial_callback' parametresi alıyorsa ara sonuçları sinyalle ilet
+        if 'partial_callback' in parametreler:
+            self.kwargs.setdefault('partial_callback', self._emit_partial)
+        # Görev 'is_cancelled' parametresi alıyorsa iptal edildiğini sorabilir ve erken bırakır
+        if 'is_cancelled' in parametreler:
+            self.kwargs.setdefault('is_cancelled', self.is_cancelled)
+
+    def cancel(self):
+        """
+        İşi iptal eder: henüz başlamadıysa hiç çalışmaz; çalışıyorsa sonucu ve hatası
+        (ara sonuçlar dahil) sinyalle iletilmez. Görevin kendisi yalnızca 'is_cancelled'
+        alıyorsa erken durur.
+        """
+        self._iptal.set()
+
+    def is_cancelled(self):
+        return self._iptal.is_set()
+
+    def _emit_partial(self, sonuc):
+        if not self._iptal.is_set():
+            self.signals.partial.emit(sonuc)
 
     def run(self):
+        if self._iptal.is_set():
+            return
         try:
             result = self.fn(*self.args, **self.kwargs)
         except Exception as e:
+            if self._iptal.is_set():
+                return
             print(f"Worker hatası: {e}")
             traceback.print_exc()
             self.signals.error.emit(str(e))
         else:
-            self.signals.finished.emit(result)
+            if not self._iptal.is_set():
+                self.signals.finished.emit(result)
@@ -0,0 +1,150 @@
+# Form implementation generated from reading ui file 'arayuz.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1131, 689)
+        MainWindow.setMinimumSize(QtCore.QSize(500, 500))
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout_Main = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout_Main.setObjectName("verticalLayout_Main")
+        self.veritabaniLabel = QtWidgets.QLabel(parent=self.centralwidget)
+        self.veritabaniLabel.setMinimumSize(QtCore.QSize(400, 0))
+        self.veritabaniLabel.setMaximumSize(QtCore.QSize(16777215, 80))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.veritabaniLabel.setFont(font)
+        self.veritabaniLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.veritabaniLabel.setWordWrap(True)
+        self.veritabaniLabel.setObjectName("veritabaniLabel")
+        self.verticalLayout_Main.addWidget(self.veritabaniLabel)
+        self.horizontalLayout_Dates = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_Dates.setObjectName("horizontalLayout_Dates")
+        self.date_Baslangic = QtWidgets.QDateEdit(parent=self.centralwidget)
+        self.date_Baslangic.setDateTime(QtCore.QDateTime(QtCore.QDate(2023, 4, 19), QtCore.QTime(18, 0, 0)))
+        self.date_Baslangic.setObjectName("date_Baslangic")
+        self.horizontalLayout_Dates.addWidget(self.date_Baslangic)
+        self.date_Bitis = QtWidgets.QDateEdit(parent=self.centralwidget)
+        self.date_Bitis.setDateTime(QtCore.QDateTime(QtCore.QDate(2023, 4, 20), QtCore.QTime(18, 0, 0)))
+        self.date_Bitis.setObjectName("date_Bitis")
+        self.horizontalLayout_Dates.addWidget(self.date_Bitis)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_Dates.addItem(spacerItem)
+        self.verticalLayout_Main.addLayout(self.horizontalLayout_Dates)
+        self.horizontalLayout_Buttons = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_Buttons.setObjectName("horizontalLayout_Buttons")
+        self.btn_Sorgula = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_Sorgula.setObjectName("btn_Sorgula")
+        self.horizontalLayout_Buttons.addWidget(self.btn_Sorgula)
+        self.btn_Excel = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_Excel.setObjectName("btn_Excel")
+        self.horizontalLayout_Buttons.addWidget(self.btn_Excel)
+        self.btn_PDF = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_PDF.setObjectName("btn_PDF")
+        self.horizontalLayout_Buttons.addWidget(self.btn_PDF)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_Buttons.addItem(spacerItem1)
+        self.tarihSecCBox = QtWidgets.QComboBox(parent=self.centralwidget)
+        self.tarihSecCBox.setObjectName("tarihSecCBox")
+        self.horizontalLayout_Buttons.addWidget(self.tarihSecCBox)
+        self.geriTarihButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.geriTarihButton.setObjectName("geriTarihButton")
+        self.horizontalLayout_Buttons.addWidget(self.geriTarihButton)
+        self.ileriTarihButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.ileriTarihButton.setObjectName("ileriTarihButton")
+        self.horizontalLayout_Buttons.addWidget(self.ileriTarihButton)
+        self.verticalLayout_Main.addLayout(self.horizontalLayout_Buttons)
+        self.tbl_Veri = QtWidgets.QTableView(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.tbl_Veri.sizePolicy().hasHeightForWidth())
+        self.tbl_Veri.setSizePolicy(sizePolicy)
+        self.tbl_Veri.setObjectName("tbl_Veri")
+        self.verticalLayout_Main.addWidget(self.tbl_Veri)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(parent=MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1131, 26))
+        self.menubar.setObjectName("menubar")
+        self.menuAna_Sayfa = QtWidgets.QMenu(parent=self.menubar)
+        self.menuAna_Sayfa.setObjectName("menuAna_Sayfa")
+        self.menuAyarlar = QtWidgets.QMenu(parent=self.menubar)
+        self.menuAyarlar.setObjectName("menuAyarlar")
+        self.menuVeritaban = QtWidgets.QMenu(parent=self.menubar)
+        self.menuVeritaban.setObjectName("menuVeritaban")
+        self.menuVeritaban_T_r_Se_iniz = QtWidgets.QMenu(parent=self.menuVeritaban)
+        self.menuVeritaban_T_r_Se_iniz.setObjectName("menuVeritaban_T_r_Se_iniz")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(parent=MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.actionVeritaban_n_Se = QtGui.QAction(parent=MainWindow)
+        self.actionVeritaban_n_Se.setObjectName("actionVeritaban_n_Se")
+        self.actionSQL_Server = QtGui.QAction(parent=MainWindow)
+        self.actionSQL_Server.setObjectName("actionSQL_Server")
+        self.actionMicrosoft_SQL = QtGui.QAction(parent=MainWindow)
+        self.actionMicrosoft_SQL.setObjectName("actionMicrosoft_SQL")
+        self.actionPostgreSQL = QtGui.QAction(parent=MainWindow)
+        self.actionPostgreSQL.setObjectName("actionPostgreSQL")
+        self.actionOracle_Database = QtGui.QAction(parent=MainWindow)
+        self.actionOracle_Database.setObjectName("actionOracle_Database")
+        self.actionAccess_Database = QtGui.QAction(parent=MainWindow)
+        self.actionAccess_Database.setObjectName("actionAccess_Database")
+        self.actionMySQL = QtGui.QAction(parent=MainWindow)
+        self.actionMySQL.setObjectName("actionMySQL")
+        self.actionSQLite = QtGui.QAction(parent=MainWindow)
+        self.actionSQLite.setObjectName("actionSQLite")
+        self.actionDuckDB = QtGui.QAction(parent=MainWindow)
+        self.actionDuckDB.setObjectName("actionDuckDB")
+        self.menuVeritaban_T_r_Se_iniz.addAction(self.actionMicrosoft_SQL)
+        self.menuVeritaban_T_r_Se_iniz.addAction(self.actionPostgreSQL)
+        self.menuVeritaban_T_r_Se_iniz.addAction(self.actionOracle_Database)
+        self.menuVeritaban_T_r_Se_iniz.addAction(self.actionAccess_Database)
+        self.menuVeritaban_T_r_Se_iniz.addAction(self.actionMySQL)
+        self.menuVeritaban_T_r_Se_iniz.addAction(self.actionSQLite)
+        self.menuVeritaban_T_r_Se_iniz.addAction(self.actionDuckDB)
+        self.menuVeritaban.addAction(self.menuVeritaban_T_r_Se_iniz.menuAction())
+        self.menuVeritaban.addAction(self.actionVeritaban_n_Se)
+        self.menubar.addAction(self.menuAna_Sayfa.menuAction())
+        self.menubar.addAction(self.menuAyarlar.menuAction())
+        self.menubar.addAction(self.menuVeritaban.menuAction())
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.veritabaniLabel.setText(_translate("MainWindow", "Veritabanı ve Tablo"))
+        self.btn_Sorgula.setText(_translate("MainWindow", "Sorgulama"))
+        self.btn_Excel.setText(_translate("MainWindow", "Excel Olarak Kaydet"))
+        self.btn_PDF.setText(_translate("MainWindow", "PDF Olarak Kaydet"))
+        self.geriTarihButton.setText(_translate("MainWindow", "Geri Button"))
+        self.ileriTarihButton.setText(_translate("MainWindow", "İleri Button"))
+        self.menuAna_Sayfa.setTitle(_translate("MainWindow", "Ana Sayfa"))
+        self.menuAyarlar.setTitle(_translate("MainWindow", "Ayarlar"))
+        self.menuVeritaban.setTitle(_translate("MainWindow", "Veritabanı"))
+        self.menuVeritaban_T_r_Se_iniz.setTitle(_translate("MainWindow", "Veritabanı Sistemleri"))
+        self.actionVeritaban_n_Se.setText(_translate("MainWindow", "Veritabanını Seç"))
+        self.actionSQL_Server.setText(_translate("MainWindow", "SQL Server"))
+        self.actionMicrosoft_SQL.setText(_translate("MainWindow", "Microsoft SQL"))
+        self.actionPostgreSQL.setText(_translate("MainWindow", "PostgreSQL"))
+        self.actionOracle_Database.setText(_translate("MainWindow", "Oracle Database"))
+        self.actionAccess_Database.setText(_translate("MainWindow", "Access Database "))
+        self.actionMySQL.setText(_translate("MainWindow", "MySQL"))
+        self.actionSQLite.setText(_translate("MainWindow", "SQLite"))
+        self.actionDuckDB.setText(_translate("MainWindow", "DuckDB"))
+
+
+# compile_ui.py tarafından yazıldı; arayuz.ui değişince yeniden derleyin
+UI_KAYNAK_OZETI = 'a6b44a66e3fbbd2369dc3a3a40dc92b2cef19ef8901bff9e94ec1a31e60cc369'
@@ -0,0 +1,40 @@
+# src/ui/compile_ui.py
+"""
+arayuz.ui dosyasını Python koduna (arayuz_ui.py) derler.
+Derlenmiş arayüz açılışta .ui dosyasının XML olarak ayrıştırılmasını ve PyQt6.uic'in
+yüklenmesini önler. .ui dosyası her değiştiğinde yeniden çalıştırılmalıdır; derleme
+eskiyse MainWindow uyarı verip loadUi ile açılmaya devam eder.
+
+Kullanım:
+    python -m src.ui.compile_ui
+"""
+import io
+import os
+import hashlib
+
+UI_DOSYASI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'arayuz.ui')
+DERLENMIS_DOSYA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'arayuz_ui.py')
+
+
+def ui_source_digest(ui_yolu=UI_DOSYASI):
+    """.ui dosyasının içerik özeti; derlenmiş kodun güncel olup olmadığını anlamak için."""
+    with open(ui_yolu, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def compile_ui(ui_yolu=UI_DOSYASI, hedef=DERLENMIS_DOSYA):
+    """.ui dosyasını derler; kaynağın özetini UI_KAYNAK_OZETI olarak modülün sonuna yazar."""
+    from PyQt6 import uic
+    kod = io.StringIO()
+    uic.compileUi(ui_yolu, kod)
+    with open(hedef, 'w', encoding='utf-8') as f:
+        # Başlıktaki mutlak yol makineden makineye değişmesin
+        f.write(kod.getvalue().replace(ui_yolu, os.path.basename(ui_yolu), 1))
+        f.write("\n\n# compile_ui.py tarafından yazıldı; arayuz.ui değişince yeniden derleyin\n")
+        f.write(f"UI_KAYNAK_OZETI = {ui_source_digest(ui_yolu)!r}\n")
+    print(f"Arayüz derlendi: {hedef}")
+    return hedef
+
+
+if __name__ == '__main__':
+    compile_ui()
@@ -0,0 +1,126 @@
+# src/ui/diagnostics_panel.py
+import json
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (
+    QDockWidget, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QPlainTextEdit, QPushButton, QLabel, QSplitter, QAbstractItemView, QHeaderView
+)
+
+from src.core.diagnostics import QUERY_PHASES, TANILAMA_GUNLUGU
+
+# Aşama anahtarı -> sütun başlığı
+_ASAMA_BASLIKLARI = {
+    'engine': "Bağlantı",
+    'execute': "Çalıştırma",
+    'first_row': "İlk Satır",
+    'fetch': "Aktarım",
+    'dataframe': "DataFrame",
+}
+
+
+class DiagnosticsPanel(QDockWidget):
+    """
+    Sorgu tanılama paneli: her sorgunun aşama sürelerini (ms) listeler, seçilen sorgunun
+    SQL metnini ve parametrelerini gösterir, istenirse yürütme planını (EXPLAIN) ister.
+    """
+    explain_requested = pyqtSignal(object)  # Plan istenen tanılama kaydı
+
+    MAX_KAYIT = 200
+
+    def __init__(self, parent=None):
+        super().__init__("Sorgu Tanılama", parent)
+        self.setObjectName("dockTanilama")
+        self._kayitlar = []  # En yeni kayıt başta
+
+        icerik = QWidget()
+        layout = QVBoxLayout(icerik)
+
+        basliklar = ["Zaman", "Sorgu", "Satır"] + [_ASAMA_BASLIKLARI[a] for a in QUERY_PHASES] + ["Toplam"]
+        self.table = QTableWidget(0, len(basliklar))
+        self.table.setHorizontalHeaderLabels(basliklar)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+
+        self.detail = QPlainTextEdit()
+        self.detail.setReadOnly(True)
+        self.detail.setFont(QFont("Consolas", 9))
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        splitter.addWidget(self.table)
+        splitter.addWidget(self.detail)
+        layout.addWidget(splitter)
+
+        buton_satiri = QHBoxLayout()
+        self.btn_Explain = QPushButton("Plan Al (EXPLAIN)")
+        self.btn_Explain.setToolTip(
+            "PostgreSQL: EXPLAIN (ANALYZE, BUFFERS) sorguyu gerçekten çalıştırır.\n"
+            "SQL Server: tahmini plan (SHOWPLAN_XML) alınır, sorgu çalıştırılmaz."
+        )
+        self.btn_Explain.setEnabled(False)
+        self.btn_Explain.clicked.connect(self._on_explain_clicked)
+        btn_temizle = QPushButton("Temizle")
+        btn_temizle.clicked.connect(self.clear)
+        buton_satiri.addWidget(self.btn_Explain)
+        buton_satiri.addWidget(btn_temizle)
+        buton_satiri.addStretch()
+        gunluk = QLabel(f"Günlük: {TANILAMA_GUNLUGU}")
+        gunluk.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        buton_satiri.addWidget(gunluk)
+        layout.addLayout(buton_satiri)
+
+        self.setWidget(icerik)
+
+    def add_record(self, kayit):
+        """Yeni bir tanılama kaydını ekler (ana iş parçacığında çağrılmalıdır)."""
+        if kayit.get('kind') == 'explain':
+            self.detail.setPlainText(f"{kayit['sql']}\n\n--- Yürütme Planı ---\n{kayit['plan']}")
+            return
+
+        self._kayitlar.insert(0, kayit)
+        self.table.insertRow(0)
+        asamalar = kayit.get('phases_ms', {})
+        degerler = [kayit.get('time', '')[-8:], kayit.get('label') or "", kayit.get('rows')]
+        degerler += [asamalar.get(a) for a in QUERY_PHASES] + [kayit.get('total_ms')]
+        for sutun, deger in enumerate(degerler):
+            if isinstance(deger, (int, float)) and sutun >= 3:
+                metin = f"{deger:,.1f}"
+            else:
+                metin = "" if deger is None else str(deger)
+            item = QTableWidgetItem(metin)
+            if sutun >= 2:
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            self.table.setItem(0, sutun, item)
+
+        while len(self._kayitlar) > self.MAX_KAYIT:
+            self._kayitlar.pop()
+            self.table.removeRow(self.table.rowCount() - 1)
+
+    def clear(self):
+        self._kayitlar.clear()
+        self.table.setRowCount(0)
+        self.detail.clear()
+
+    def selected_record(self):
+        row = self.table.currentRow()
+        if 0 <= row < len(self._kayitlar):
+            return self._kayitlar[row]
+        return None
+
+    def _on_selection_changed(self):
+        kayit = self.selected_record()
+        self.btn_Explain.setEnabled(kayit is not None)
+        if kayit is None:
+            return
+        parametreler = json.dumps(kayit.get('params'), ensure_ascii=False, default=str, indent=2)
+        self.detail.setPlainText(f"{kayit['sql']}\n\n--- Parametreler ---\n{parametreler}")
+
+    def _on_explain_clicked(self):
+        kayit = self.selected_record()
+        if kayit is not None:
+            self.explain_requested.emit(kayit)
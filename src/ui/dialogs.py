@@ -2,9 +2,19 @@
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QLineEdit, 
     QPushButton, QDialogButtonBox, QLabel, QWidget,
-    QFileDialog, QHBoxLayout  
+    QFileDialog, QHBoxLayout, QListWidget, QListWidgetItem, QComboBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
+    QTreeWidget, QTreeWidgetItem, QSpinBox, QTabWidget, QTableView
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
+
+
+# Dosya tabanlı veritabanları: tür -> (pencere başlığı, dosya süzgeci)
+DOSYA_TABANLI_TURLER = {
+    "access": ("Access Veritabanı Seç", "Access Dosyaları (*.mdb *.accdb);;Tüm Dosyalar (*.*)"),
+    "sqlite": ("SQLite Veritabanı Seç", "SQLite Dosyaları (*.db *.sqlite *.sqlite3);;Tüm Dosyalar (*.*)"),
+    "duckdb": ("DuckDB Veritabanı Seç", "DuckDB Dosyaları (*.duckdb *.db);;Tüm Dosyalar (*.*)"),
+}
 
 
 class ConnectionDialog(QDialog):
@@ -33,21 +43,28 @@ class ConnectionDialog(QDialog):
         self.pass_edit = QLineEdit()
         self.pass_edit.setEchoMode(QLineEdit.EchoMode.Password)
         
-        # --- Access'e özel dosya seçme widget'ı ---
-        self.access_widget = QWidget()
-        access_layout = QHBoxLayout(self.access_widget)
+        # --- Dosya tabanlı veritabanları (Access, SQLite, DuckDB) için dosya seçme widget'ı ---
+        self.file_widget = QWidget()
+        file_layout = QHBoxLayout(self.file_widget)
         self.path_edit = QLineEdit()
-        self.path_edit.setPlaceholderText("Lütfen bir .mdb veya .accdb dosyası seçin...")
         self.path_edit.setReadOnly(True)
         browse_button = QPushButton("Gözat...")
-        browse_button.clicked.connect(self.browse_access_file)
-        access_layout.addWidget(self.path_edit)
-        access_layout.addWidget(browse_button)
-        access_layout.setContentsMargins(0,0,0,0)
+        browse_button.clicked.connect(self.browse_database_file)
+        file_layout.addWidget(self.path_edit)
+        file_layout.addWidget(browse_button)
+        file_layout.setContentsMargins(0,0,0,0)
 
         # --- Arayüzü seçilen türe göre doldur ---
-        if self.db_type == "access":
-            self.form_layout.addRow("Dosya Yolu:", self.access_widget)
+        if self.db_type in DOSYA_TABANLI_TURLER:
+            if self.db_type == "access":
+                self.path_edit.setPlaceholderText("Lütfen bir .mdb veya .accdb dosyası seçin...")
+            elif self.db_type == "sqlite":
+                self.setWindowTitle("SQLite Bağlantısı")
+                self.path_edit.setPlaceholderText("Lütfen bir SQLite (.db, .sqlite) dosyası seçin...")
+            else:
+                self.setWindowTitle("DuckDB Bağlantısı")
+                self.path_edit.setPlaceholderText("Lütfen bir DuckDB (.duckdb) dosyası seçin...")
+            self.form_layout.addRow("Dosya Yolu:", self.file_widget)
             self.setMinimumWidth(500)
         else:
             # SQL Server, PostgreSQL vb. için ortak ayarlar
@@ -74,17 +91,15 @@ class ConnectionDialog(QDialog):
         
         main_layout.addWidget(button_box)
 
-    def browse_access_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Access Veritabanı Seç", "", 
-            "Access Dosyaları (*.mdb *.accdb);;Tüm Dosyalar (*.*)"
-        )
+    def browse_database_file(self):
+        baslik, suzgec = DOSYA_TABANLI_TURLER[self.db_type]
+        file_path, _ = QFileDialog.getOpenFileName(self, baslik, "", suzgec)
         if file_path:
             self.path_edit.setText(file_path)
 
     def accept(self):
         """Kullanıcı 'OK'e bastığında ayarları 'self.config' sözlüğüne kaydet."""
-        if self.db_type == "access":
+        if self.db_type in DOSYA_TABANLI_TURLER:
             if not self.path_edit.text():
                 # Hata yönetimi eklenebilir
                 return
@@ -100,4 +115,445 @@ class ConnectionDialog(QDialog):
 
     def get_config(self):
         """Ana pencerenin bağlantı ayarlarını alması için kullanılır."""
-        return self.config
\ No newline at end of file
+        return self.config
+
+
+def format_bytes(size):
+    """Byte değerini okunabilir biçime çevirir (ör. 1.5 GB)."""
+    if size is None:
+        return ""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+class _SortableItem(QTableWidgetItem):
+    """Gösterilen metne göre değil, UserRole'deki sayıya göre sıralanan hücre."""
+    def __lt__(self, other):
+        mine = self.data(Qt.ItemDataRole.UserRole)
+        theirs = other.data(Qt.ItemDataRole.UserRole)
+        if mine is None or theirs is None:
+            return theirs is not None  # Bilinmeyen değerler artan sırada başa gelir
+        return mine < theirs
+
+
+class TableSelectDialog(QDialog):
+    """
+    Tablo seçim diyaloğu. Tablolar şema, yaklaşık satır sayısı ve boyutla listelenir;
+    başlıklara tıklanarak sıralanabilir, üstteki kutuyla ada göre süzülebilir.
+    """
+    def __init__(self, tables, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Tablo Seç")
+        self.setMinimumSize(560, 480)
+
+        main_layout = QVBoxLayout(self)
+        main_layout.addWidget(QLabel("Lütfen sorgulanacak tabloyu seçin:"))
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Tablo adında ara...")
+        self.filter_edit.textChanged.connect(self._apply_filter)
+        main_layout.addWidget(self.filter_edit)
+
+        self.table_widget = QTableWidget(len(tables), 4)
+        self.table_widget.setHorizontalHeaderLabels(["Şema", "Tablo", "Satır (yaklaşık)", "Boyut"])
+        self.table_widget.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table_widget.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table_widget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_widget.verticalHeader().setVisible(False)
+        header = self.table_widget.horizontalHeader()
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+
+        for row, table in enumerate(tables):
+            schema_item = QTableWidgetItem(table.get('schema') or "")
+            name_item = QTableWidgetItem(table.get('table') or table['name'])
+            name_item.setData(Qt.ItemDataRole.UserRole, table['name'])
+            rows = table.get('rows')
+            rows_item = _SortableItem(f"{rows:,}".replace(",", ".") if rows is not None else "")
+            rows_item.setData(Qt.ItemDataRole.UserRole, rows)
+            size_item = _SortableItem(format_bytes(table.get('bytes')))
+            size_item.setData(Qt.ItemDataRole.UserRole, table.get('bytes'))
+            for item in (rows_item, size_item):
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            for column, item in enumerate((schema_item, name_item, rows_item, size_item)):
+                self.table_widget.setItem(row, column, item)
+
+        # Sıralama, satırlar doldurulduktan sonra açılır (doldururken satırlar yer değiştirmesin)
+        self.table_widget.setSortingEnabled(True)
+        self.table_widget.sortByColumn(1, Qt.SortOrder.AscendingOrder)
+        self.table_widget.doubleClicked.connect(self.accept)
+        if tables:
+            self.table_widget.selectRow(0)
+        main_layout.addWidget(self.table_widget)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box)
+
+    def _apply_filter(self, text):
+        text = text.strip().lower()
+        for row in range(self.table_widget.rowCount()):
+            name = self.table_widget.item(row, 1).data(Qt.ItemDataRole.UserRole)
+            self.table_widget.setRowHidden(row, bool(text) and text not in name.lower())
+
+    def get_selected_table(self):
+        """Seçilen tablonun sorgularda kullanılan adını ('şema.tablo') döndürür."""
+        rows = self.table_widget.selectionModel().selectedRows(1)
+        if not rows:
+            return None
+        return rows[0].data(Qt.ItemDataRole.UserRole)
+
+
+class ColumnSelectDialog(QDialog):
+    """
+    Sorguda çekilecek sütunları seçtiren diyalog.
+    Sütun listesi veritabanından okunan (reflected) tablo bilgisinden gelir.
+    Hiçbir sütun seçilmezse veya hepsi seçilirse tüm sütunlar (SELECT *) çekilir.
+    """
+    def __init__(self, columns, selected=None, locked=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Sütunları Seç")
+        self.setMinimumSize(400, 500)
+
+        selected = set(selected or [c['name'] for c in columns])
+        self.locked = locked  # Her zaman çekilen sütun (tarih sütunu)
+
+        main_layout = QVBoxLayout(self)
+        main_layout.addWidget(QLabel("Sorguda çekilecek sütunları işaretleyin:"))
+
+        self.list_widget = QListWidget()
+        for column in columns:
+            item = QListWidgetItem(f"{column['name']}  ({column['type']})")
+            item.setData(Qt.ItemDataRole.UserRole, column['name'])
+            if column['name'] == locked:
+                item.setCheckState(Qt.CheckState.Checked)
+                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsUserCheckable)
+                item.setToolTip("Tarih sütunu her zaman çekilir.")
+            else:
+                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                item.setCheckState(
+                    Qt.CheckState.Checked if column['name'] in selected else Qt.CheckState.Unchecked
+                )
+            self.list_widget.addItem(item)
+        main_layout.addWidget(self.list_widget)
+
+        select_layout = QHBoxLayout()
+        all_button = QPushButton("Tümünü Seç")
+        all_button.clicked.connect(lambda: self._set_all(Qt.CheckState.Checked))
+        none_button = QPushButton("Hiçbirini Seçme")
+        none_button.clicked.connect(lambda: self._set_all(Qt.CheckState.Unchecked))
+        select_layout.addWidget(all_button)
+        select_layout.addWidget(none_button)
+        main_layout.addLayout(select_layout)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box)
+
+    def _set_all(self, state):
+        for i in range(self.list_widget.count()):
+            item = self.list_widget.item(i)
+            if item.data(Qt.ItemDataRole.UserRole) != self.locked:
+                item.setCheckState(state)
+
+    def get_selected_columns(self):
+        """
+        Seçilen sütun adlarını döndürür.
+        Tüm sütunlar seçiliyse (veya hiçbiri) None döner: SELECT * kullanılır.
+        """
+        selected = []
+        for i in range(self.list_widget.count()):
+            item = self.list_widget.item(i)
+            if item.checkState() == Qt.CheckState.Checked:
+                selected.append(item.data(Qt.ItemDataRole.UserRole))
+        if len(selected) == self.list_widget.count() or not [c for c in selected if c != self.locked]:
+            return None
+        return selected
+
+
+class DateColumnDialog(QDialog):
+    """
+    Tarih aralığı sorgularında kullanılacak sütunu seçtiren diyalog.
+    Adaylar date_column_candidates() sırasıyla gelir: indeksli tarih sütunları en üsttedir.
+    """
+    def __init__(self, candidates, current=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Tarih Sütununu Seç")
+        self.setMinimumSize(400, 360)
+
+        main_layout = QVBoxLayout(self)
+        main_layout.addWidget(QLabel(
+            "Tarih aralığı hangi sütuna uygulansın?\n"
+            "İndeksli sütunlar büyük tablolarda çok daha hızlı sorgulanır."
+        ))
+
+        self.list_widget = QListWidget()
+        for candidate in candidates:
+            etiket = f"{candidate['name']}  ({candidate['type']})"
+            if candidate.get('indexed'):
+                etiket += "  — indeksli"
+            item = QListWidgetItem(etiket)
+            item.setData(Qt.ItemDataRole.UserRole, candidate['name'])
+            self.list_widget.addItem(item)
+            if candidate['name'] == current:
+                self.list_widget.setCurrentItem(item)
+        if self.list_widget.currentRow() < 0 and self.list_widget.count():
+            self.list_widget.setCurrentRow(0)
+        self.list_widget.itemDoubleClicked.connect(self.accept)
+        main_layout.addWidget(self.list_widget)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box)
+
+    def get_selected_column(self):
+        item = self.list_widget.currentItem()
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
+
+class AggregateDialog(QDialog):
+    """
+    Özet rapor (gruplama) ayarlarını alan diyalog: gruplanacak sütunlar,
+    tarih sütunu için zaman dilimi ve toplama fonksiyonları.
+    """
+    def __init__(self, columns, functions, buckets, date_column=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Özet Rapor")
+        self.setMinimumSize(450, 550)
+
+        column_names = [c['name'] for c in columns]
+        main_layout = QVBoxLayout(self)
+
+        # --- Zaman dilimi ---
+        form_layout = QFormLayout()
+        self.bucket_combo = QComboBox()
+        for key, label in buckets.items():
+            self.bucket_combo.addItem(label, userData=key)
+        form_layout.addRow(f"Zaman Dilimi ({date_column}):", self.bucket_combo)
+        main_layout.addLayout(form_layout)
+
+        # --- Gruplanacak sütunlar ---
+        main_layout.addWidget(QLabel("Gruplanacak sütunlar:"))
+        self.group_list = QListWidget()
+        for name in column_names:
+            if name == date_column:
+                continue
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Unchecked)
+            self.group_list.addItem(item)
+        main_layout.addWidget(self.group_list)
+
+        # --- Toplama fonksiyonları ---
+        main_layout.addWidget(QLabel("Hesaplanacak değerler:"))
+        add_layout = QHBoxLayout()
+        self.function_combo = QComboBox()
+        self.function_combo.addItems(functions)
+        self.column_combo = QComboBox()
+        self.column_combo.addItem("* (Tüm satırlar)", userData='*')
+        for name in column_names:
+            self.column_combo.addItem(name, userData=name)
+        add_button = QPushButton("Ekle")
+        add_button.clicked.connect(self._add_aggregate)
+        remove_button = QPushButton("Kaldır")
+        remove_button.clicked.connect(self._remove_aggregate)
+        add_layout.addWidget(self.function_combo)
+        add_layout.addWidget(self.column_combo)
+        add_layout.addWidget(add_button)
+        add_layout.addWidget(remove_button)
+        main_layout.addLayout(add_layout)
+
+        self.aggregate_list = QListWidget()
+        main_layout.addWidget(self.aggregate_list)
+        self._append_aggregate("COUNT", '*')
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box)
+
+    def _append_aggregate(self, function, column):
+        item = QListWidgetItem(f"{function}({column})")
+        item.setData(Qt.ItemDataRole.UserRole, (function, column))
+        self.aggregate_list.addItem(item)
+
+    def _add_aggregate(self):
+        function = self.function_combo.currentText()
+        column = self.column_combo.currentData()
+        if column == '*' and function != "COUNT":
+            return  # '*' yalnızca COUNT ile anlamlı
+        self._append_aggregate(function, column)
+
+    def _remove_aggregate(self):
+        for item in self.aggregate_list.selectedItems():
+            self.aggregate_list.takeItem(self.aggregate_list.row(item))
+
+    def accept(self):
+        if self.aggregate_list.count() == 0:
+            return  # En az bir değer gerekli
+        super().accept()
+
+    def get_spec(self):
+        """{'group_by': [...], 'bucket': ..., 'aggregates': [(fonksiyon, sütun), ...]} döndürür."""
+        group_by = [
+            self.group_list.item(i).text() for i in range(self.group_list.count())
+            if self.group_list.item(i).checkState() == Qt.CheckState.Checked
+        ]
+        aggregates = [
+            tuple(self.aggregate_list.item(i).data(Qt.ItemDataRole.UserRole))
+            for i in range(self.aggregate_list.count())
+        ]
+        return {
+            'group_by': group_by,
+            'bucket': self.bucket_combo.currentData(),
+            'aggregates': aggregates,
+        }
+
+
+class MultiTargetDialog(QDialog):
+    """
+    Çoklu hedef sorgusu için tablo seçimi. Bu oturumda bağlanılan her veritabanı
+    bir düğümdür; altındaki tablolar işaretlenerek aynı tarih aralığı hepsinden çekilir.
+    """
+    SONUC_BIRLESIK = 'birlesik'
+    SONUC_SEKMELER = 'sekmeler'
+
+    def __init__(self, connections, default_limit=4, parent=None):
+        """'connections': [(etiket, config, tablo_listesi), ...]"""
+        super().__init__(parent)
+        self.setWindowTitle("Çoklu Hedef Sorgusu")
+        self.setMinimumSize(520, 560)
+
+        main_layout = QVBoxLayout(self)
+        main_layout.addWidget(QLabel(
+            "Sorgulanacak tabloları işaretleyin.\n"
+            "Başka bir veritabanı eklemek için önce 'Veritabanı' menüsünden ona bağlanın."
+        ))
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Tablo adında ara...")
+        self.filter_edit.textChanged.connect(self._apply_filter)
+        main_layout.addWidget(self.filter_edit)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Bağlantı / Tablo", "Satır (yaklaşık)"])
+        self.tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for etiket, config, tables in connections:
+            parent_item = QTreeWidgetItem([etiket, ""])
+            parent_item.setFlags(parent_item.flags() | Qt.ItemFlag.ItemIsAutoTristate | Qt.ItemFlag.ItemIsUserCheckable)
+            parent_item.setCheckState(0, Qt.CheckState.Unchecked)
+            for table in tables:
+                rows = table.get('rows')
+                child = QTreeWidgetItem([table['name'], f"{rows:,}".replace(",", ".") if rows is not None else ""])
+                child.setFlags(child.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                child.setCheckState(0, Qt.CheckState.Unchecked)
+                child.setData(0, Qt.ItemDataRole.UserRole, (config, table['name']))
+                child.setTextAlignment(1, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                parent_item.addChild(child)
+            self.tree.addTopLevelItem(parent_item)
+            parent_item.setExpanded(True)
+        main_layout.addWidget(self.tree)
+
+        form_layout = QFormLayout()
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItem("Tek tablo (KAYNAK sütunuyla birleştir)", userData=self.SONUC_BIRLESIK)
+        self.mode_combo.addItem("Her hedef ayrı sekmede", userData=self.SONUC_SEKMELER)
+        form_layout.addRow("Sonuç:", self.mode_combo)
+        self.limit_spin = QSpinBox()
+        self.limit_spin.setRange(1, 16)
+        self.limit_spin.setValue(default_limit)
+        self.limit_spin.setToolTip("Aynı sunucuya aynı anda gönderilecek en fazla sorgu sayısı.")
+        form_layout.addRow("Bağlantı başına eşzamanlı sorgu:", self.limit_spin)
+        main_layout.addLayout(form_layout)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box)
+
+    def _apply_filter(self, text):
+        text = text.strip().lower()
+        for i in range(self.tree.topLevelItemCount()):
+            parent_item = self.tree.topLevelItem(i)
+            for j in range(parent_item.childCount()):
+                child = parent_item.child(j)
+                child.setHidden(bool(text) and text not in child.text(0).lower())
+
+    def get_targets(self):
+        """İşaretli hedefleri [(config, tablo), ...] olarak döndürür."""
+        targets = []
+        for i in range(self.tree.topLevelItemCount()):
+            parent_item = self.tree.topLevelItem(i)
+            for j in range(parent_item.childCount()):
+                child = parent_item.child(j)
+                if child.checkState(0) == Qt.CheckState.Checked:
+                    targets.append(child.data(0, Qt.ItemDataRole.UserRole))
+        return targets
+
+    def accept(self):
+        if not self.get_targets():
+            return  # En az bir hedef gerekli
+        super().accept()
+
+    def get_result_mode(self):
+        return self.mode_combo.currentData()
+
+    def get_connection_limit(self):
+        return self.limit_spin.value()
+
+
+class FanOutResultsDialog(QDialog):
+    """
+    Çoklu hedef sorgusunun sonuçlarını her hedef için ayrı bir sekmede gösterir.
+    Başarısız hedefler özet satırında listelenir; bir sekme ana tabloya aktarılabilir.
+    """
+    frame_selected = pyqtSignal(object)  # Ana tabloda gösterilmesi istenen DataFrame
+
+    def __init__(self, sonuclar, parent=None):
+        super().__init__(parent)
+        from src.ui.models import DataFrameModel  # pandas'ı açılışta yüklememek için burada
+        self.setWindowTitle("Çoklu Hedef Sonuçları")
+        self.resize(900, 600)
+        self._frames = []
+
+        main_layout = QVBoxLayout(self)
+        ozet = [f"{s['label']}: {len(s['df'])} satır, {s['seconds']:.1f} sn"
+                for s in sonuclar if s.get('df') is not None]
+        ozet += [f"{s['label']}: HATA — {s['error']}" for s in sonuclar if s.get('df') is None]
+        summary = QLabel("\n".join(ozet))
+        summary.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        main_layout.addWidget(summary)
+
+        self.tabs = QTabWidget()
+        for sonuc in sonuclar:
+            if sonuc.get('df') is None:
+                continue
+            view = QTableView()
+            model = DataFrameModel(view)
+            model.set_dataframe(sonuc['df'])
+            view.setModel(model)
+            view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            self.tabs.addTab(view, f"{sonuc['label']} ({len(sonuc['df'])})")
+            self._frames.append(sonuc['df'])
+        main_layout.addWidget(self.tabs)
+
+        button_layout = QHBoxLayout()
+        show_button = QPushButton("Ana Tabloda Göster")
+        show_button.setToolTip("Seçili sekmedeki sonucu ana tabloya aktarır (dışa aktarım için).")
+        show_button.clicked.connect(self._emit_current)
+        close_button = QPushButton("Kapat")
+        close_button.clicked.connect(self.close)
+        button_layout.addStretch()
+        button_layout.addWidget(show_button)
+        button_layout.addWidget(close_button)
+        main_layout.addLayout(button_layout)
+
+    def _emit_current(self):
+        index = self.tabs.currentIndex()
+        if 0 <= index < len(self._frames):
+            self.frame_selected.emit(self._frames[index])
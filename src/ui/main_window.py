@@ -1,26 +1,47 @@
 import sys
 import os
 import re
+import json
 import traceback
 import urllib.parse
-from datetime import datetime
 import functools
+import importlib.util
 
-from PyQt6.QtCore import QThreadPool, Qt
+from PyQt6.QtCore import QThreadPool, Qt, QSettings, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QActionGroup
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QTableWidgetItem,
-    QMessageBox, QProgressDialog, QFileDialog, QInputDialog, QLabel
+    QApplication, QMainWindow, QHeaderView,
+    QMessageBox, QProgressDialog, QFileDialog, QLabel, QCheckBox, QMenu, QProgressBar
 )
-from PyQt6.uic import loadUi
 
-from src.ui.dialogs import ConnectionDialog
-
-import pandas as pd
+from src.ui.dialogs import (
+    ConnectionDialog, TableSelectDialog, ColumnSelectDialog, DateColumnDialog, AggregateDialog,
+    MultiTargetDialog, FanOutResultsDialog, format_bytes
+)
+from src.ui.diagnostics_panel import DiagnosticsPanel
 
 from src.threading.workers import Worker, WorkerSignals
-from src.core.database import get_database_tables, run_database_query, load_excel_file
-from src.core.file_exporter import get_yeni_kayit_yolu, task_run_excel, task_run_pdf
-from src.core.utils import register_pdf_fonts
+# Çekirdek modüller (pandas, SQLAlchemy) ilk kullanımda yüklenir; pencere önce açılır
+from src import core
+from src.core import diagnostics
+from src.core.utils import preload_modules
+from src.ui.compile_ui import UI_DOSYASI, ui_source_digest
+
+# Önceden derlenmiş arayüz (python -m src.ui.compile_ui); yoksa .ui dosyası loadUi ile okunur
+try:
+    from src.ui.arayuz_ui import Ui_MainWindow, UI_KAYNAK_OZETI
+except ImportError:
+    Ui_MainWindow = UI_KAYNAK_OZETI = None
+
+# Pencere göründükten sonra arka planda yüklenen modüller (ilk sorgu/rapor beklemesin)
+ONCEDEN_YUKLENECEK_MODULLER = (
+    'src.ui.models', 'src.core.query_cache', 'src.core.schema_cache', 'src.core.browse',
+)
+
+# Geçmiş raporlarda gösterilen dosyanın her iki yanında önceden okunacak rapor sayısı
+KOMSU_RAPOR_ONYUKLEME = 2
+# İleri/geri tıklamaları bu süre (ms) içinde birleştirilir; yalnızca son seçilen rapor yüklenir
+RAPOR_GECIS_GECIKMESI_MS = 150
 
 # --- Doğal Sıralama ---
 def natural_sort_key(s):
@@ -28,14 +49,14 @@ def natural_sort_key(s):
 
 
 class MainWindow(QMainWindow):
+    # Tanılama kayıtları çalışan iş parçacıklarından gelir; sinyal ana iş parçacığına taşır
+    tanilama_kaydi = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
+        self._arayuzu_kur()
 
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        ui_file_path = os.path.join(current_dir, 'arayuz.ui')
-        loadUi(ui_file_path, self)
-
-        self.df = pd.DataFrame()
+        self._df = None  # Boş sonuç ilk okunduğunda oluşturulur (bkz. 'df')
         self.rapor_ana_klasoru = r"C:\rapor\excel"
         self.secili_dosyalar_listesi = []
         self.secili_dosya_index = 0
@@ -46,18 +67,76 @@ class MainWindow(QMainWindow):
         self.db_config = {}       # Artık db_path yerine tüm ayarları tutan bir sözlük
         self.db_engine = None     # Başarılı bağlantıdan sonra motoru (engine) saklayabiliriz
         self.target_table = None  # Kullanıcının seçtiği tablo adı
+        self.secili_sutunlar = None  # Sorguda çekilecek sütunlar (None -> tümü)
+        self.tarih_sutunu = None  # Tarih aralığının uygulandığı sütun (tablo seçilince belirlenir)
+        self.bilinen_baglantilar = {}  # Bu oturumda bağlanılan veritabanları (config_key -> config)
+
+        # Kullanıcı tercihleri (tablo bazında sütun seçimi vb.)
+        self.ayarlar = QSettings("AdminTableTool", "AdminTableTool")
 
         self.threadpool = QThreadPool()
         print(f"Multithreading için {self.threadpool.maxThreadCount()} adet iş parçacığı mevcut.")
+        # Yerel ayna eşitlemeleri uzun sürebilir: kendi tek iş parçacığında çalışır, sorguları bekletmez
+        self.ayna_havuzu = QThreadPool(self)
+        self.ayna_havuzu.setMaxThreadCount(1)
+        # Komşu raporların ön yüklemesi de ayrı havuzda: kullanıcının açtığı rapor sırada beklemez
+        self.onyukleme_havuzu = QThreadPool(self)
+        self.onyukleme_havuzu.setMaxThreadCount(1)
+        self._onyukleme_isi = None
+
+        # Sonuç istekleri (sorgu, rapor yükleme): yalnızca en son isteğin sonucu gösterilir
+        self._istek_nesli = 0
+        self._istek_isleri = []  # Güncel isteğin worker'ları; yeni istek gelince iptal edilir
+        # Sıralama istekleri: yalnızca son başlık tıklamasının sonucu uygulanır
+        self._siralama_nesli = 0
+        self._siralama_isi = None
+        self.rapor_gecis_zamanlayici = QTimer(self)
+        self.rapor_gecis_zamanlayici.setSingleShot(True)
+        self.rapor_gecis_zamanlayici.setInterval(RAPOR_GECIS_GECIKMESI_MS)
+        self.rapor_gecis_zamanlayici.timeout.connect(self.excel_dosyasini_yukle)
+
+        # Veri modelleri pandas gerektirir; pencere çizildikten sonra kurulur (bkz. _modelleri_kur)
+        self._veri_modeli = None
+        self._gozatma_modeli = None
+        self._kurulum_basladi = False
+        self._kurulum_tamam = False
+        self.tbl_Veri.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._gozatma = None  # Aktif gözatma oturumu (bağlantı, tablo, aralık, anahtar)
+
+        # Sıralama Qt'ye bırakılmaz: başlık tıklamasında permütasyon arka planda hesaplanır
+        self.tbl_Veri.setSortingEnabled(False)
+        self.siralama = []  # [(sütun_no, artan_mı), ...] ilk eleman birincil anahtar
+        basliklar = self.tbl_Veri.horizontalHeader()
+        basliklar.setSectionsClickable(True)
+        basliklar.setSortIndicatorShown(True)
+        basliklar.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        basliklar.sectionClicked.connect(self._on_header_clicked)
 
-        self.tbl_Veri.setSortingEnabled(True)
         self.progress_dialog = None
+        self._akis_suruyor = False
+        self.sorgu_tahmini = None  # Son sorgunun ön kontrol tahmini (satır/byte); ilerleme çubuğu için
+
+        # Akış modunda bekleme penceresi ilk satırlarla kapanır; ilerleme durum çubuğunda sürer
+        self.ilerleme_cubugu = QProgressBar()
+        self.ilerleme_cubugu.setMaximumWidth(220)
+        self.ilerleme_cubugu.hide()
 
         self.status_light = QLabel()
         try:
+            self.statusbar.addPermanentWidget(self.ilerleme_cubugu)
             self.statusbar.addPermanentWidget(self.status_light)
         except Exception:
             pass
+
+        # Önbellekteki sonucu kullanmadan veritabanından yeniden çekmek için
+        self.chk_Yenile = QCheckBox("Önbelleği Atla (Yenile)")
+        self.chk_Yenile.setToolTip("İşaretliyse sonuç önbellekten değil, doğrudan veritabanından çekilir.")
+        try:
+            self.horizontalLayout_Buttons.insertWidget(
+                self.horizontalLayout_Buttons.indexOf(self.btn_PDF) + 1, self.chk_Yenile
+            )
+        except AttributeError as e:
+            print(f"UYARI: Buton alanı bulunamadı. {e}")
         
 
         # Connect UI signals
@@ -83,14 +162,297 @@ class MainWindow(QMainWindow):
             self.actionPostgreSQL.triggered.connect(
                 functools.partial(self.set_database_type, "postgres")
             )
+            self.actionSQLite.triggered.connect(
+                functools.partial(self.set_database_type, "sqlite")
+            )
+            self.actionDuckDB.triggered.connect(
+                functools.partial(self.set_database_type, "duckdb")
+            )
             # ... (actionMySQL, actionOracle_Database vb. buraya eklenebilir) ...
         except AttributeError as e:
             print(f"HATA: 'arayuz.ui' dosyanızdaki menü eylemleri (actionAccess_Database vb.) kodla eşleşmiyor. {e}")
 
+        # Sorgu tanılama paneli (aşama süreleri, EXPLAIN)
+        self.tanilama_paneli = DiagnosticsPanel(self)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.tanilama_paneli)
+        self.tanilama_paneli.hide()
+        self.tanilama_paneli.explain_requested.connect(self._on_explain_istegi)
+        self.tanilama_kaydi.connect(self.tanilama_paneli.add_record)
+        diagnostics.add_listener(self.tanilama_kaydi.emit)
+
+        self._ayarlar_menusunu_kur()
+
+        self.actionSutunlariSec = QAction("Sütunları Seç...", self)
+        self.actionSutunlariSec.triggered.connect(self.sutunlari_sec)
+        self.actionTarihSutunu = QAction("Tarih Sütununu Seç...", self)
+        self.actionTarihSutunu.triggered.connect(self.tarih_sutunu_sec)
+        self.actionOzetRapor = QAction("Özet Rapor (Gruplama)...", self)
+        self.actionOzetRapor.triggered.connect(self.ozet_rapor)
+        self.actionCokluHedef = QAction("Çoklu Hedef Sorgusu...", self)
+        self.actionCokluHedef.triggered.connect(self.coklu_hedef_sorgusu)
+
+        # Yerel ayna: yavaş kaynak tablonun yerel kopyası; güncelken sorgular ondan yanıtlanır
+        self.menuYerelAyna = QMenu("Yerel Ayna", self)
+        self.actionAynaEsitle = QAction("Tabloyu Aynala / Eşitle", self)
+        self.actionAynaEsitle.triggered.connect(lambda: self.yerel_aynayi_esitle())
+        self.actionAynaYeniden = QAction("Aynayı Baştan Oluştur", self)
+        self.actionAynaYeniden.triggered.connect(lambda: self.yerel_aynayi_esitle(tam=True))
+        self.actionAynaKaldir = QAction("Aynayı Kaldır", self)
+        self.actionAynaKaldir.triggered.connect(self.yerel_aynayi_kaldir)
+        self.menuYerelAyna.addAction(self.actionAynaEsitle)
+        self.menuYerelAyna.addAction(self.actionAynaYeniden)
+        self.menuYerelAyna.addAction(self.actionAynaKaldir)
+        try:
+            self.menuVeritaban.addAction(self.actionSutunlariSec)
+            self.menuVeritaban.addAction(self.actionTarihSutunu)
+            self.menuVeritaban.addAction(self.actionOzetRapor)
+            self.menuVeritaban.addAction(self.actionCokluHedef)
+            self.menuVeritaban.addMenu(self.menuYerelAyna)
+        except AttributeError as e:
+            print(f"UYARI: 'Veritabanı' menüsü bulunamadı. {e}")
 
         self.update_connection_status()
+
+    def _arayuzu_kur(self):
+        """
+        Derlenmiş arayüz (arayuz_ui.py) .ui dosyasıyla güncelse onu kullanır;
+        değilse .ui dosyasını çalışma anında loadUi ile okur.
+        """
+        if Ui_MainWindow is not None and UI_KAYNAK_OZETI == ui_source_digest():
+            # setupUi pencereyi hem hedef hem 'ui' nesnesi olarak kullanır: bileşenler self'e eklenir
+            self.retranslateUi = functools.partial(Ui_MainWindow.retranslateUi, self)
+            Ui_MainWindow.setupUi(self, self)
+            return
+        print("UYARI: Derlenmiş arayüz bulunamadı veya eski; 'arayuz.ui' çalışma anında okunuyor. "
+              "Daha hızlı açılış için: python -m src.ui.compile_ui")
+        from PyQt6.uic import loadUi
+        loadUi(UI_DOSYASI, self)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._kurulum_basladi:
+            self._kurulum_basladi = True
+            # İlk çizimden sonraki olay döngüsü turunda: pencere önce ekrana gelir
+            QTimer.singleShot(0, self._gecikmeli_kurulum)
+
+    def _gecikmeli_kurulum(self):
+        """Kayıtlı raporları tarar; ağır modülleri (pandas, veritabanı katmanı) arka planda yükler."""
         self.kayitli_raporlari_tara()
+        worker = Worker(preload_modules, ONCEDEN_YUKLENECEK_MODULLER)
+        worker.signals.finished.connect(lambda _: self._modelleri_kur())
+        worker.signals.error.connect(lambda hata: print(f"UYARI: Modüller önceden yüklenemedi: {hata}"))
+        self.threadpool.start(worker)
 
+    def _modelleri_kur(self):
+        """Veri modellerini kurar. Önceden yükleme bitmeden modellere erişilirse burada beklenir."""
+        if self._kurulum_tamam:
+            return
+        from src.ui.models import DataFrameModel, KeysetPageModel
+
+        # tbl_Veri sanal bir model üzerinden çalışır (hücre nesnesi oluşturulmaz)
+        self._veri_modeli = DataFrameModel(self)
+        self.tbl_Veri.setModel(self._veri_modeli)
+
+        # Sayfalı gözatma modu: sayfalar kaydırdıkça imleçle (keyset) çekilir
+        self._gozatma_modeli = KeysetPageModel(core.GOZATMA_SAYFA_BOYUTU, parent=self)
+        self._gozatma_modeli.page_requested.connect(self._on_gozatma_sayfa_istegi)
+        self._kurulum_tamam = True
+
+    @property
+    def veri_modeli(self):
+        self._modelleri_kur()
+        return self._veri_modeli
+
+    @property
+    def gozatma_modeli(self):
+        self._modelleri_kur()
+        return self._gozatma_modeli
+
+    @property
+    def df(self):
+        """Gösterilen sonuç. Henüz atanmamışsa boş DataFrame (pandas ilk okumada yüklenir)."""
+        if self._df is None:
+            import pandas as pd
+            self._df = pd.DataFrame()
+        return self._df
+
+    @df.setter
+    def df(self, value):
+        self._df = value
+
+
+    def _ayarlar_menusunu_kur(self):
+        """'Ayarlar' menüsüne sorgu davranışını belirleyen seçenekleri ekler."""
+        # Sorgu modu: sonuçların nasıl çekilip gösterileceği
+        # 'otomatik': ön kontrol tahminine göre bellek / akış / gözatma seçilir
+        self.sorgu_modu = 'otomatik'
+        self.menuSorguModu = QMenu("Sorgu Modu", self)
+        mod_grubu = QActionGroup(self)
+        for mod, etiket in (
+            ('otomatik', "Otomatik (Sonuç Boyutuna Göre)"),
+            ('bellek', "Tümünü Yükle"),
+            ('akis', "Akış Modu (Sonuçları Parça Parça Göster)"),
+            ('gozat', "Sayfalı Gözatma (Çok Büyük Tablolar)"),
+        ):
+            action = QAction(etiket, self)
+            action.setCheckable(True)
+            action.setChecked(mod == self.sorgu_modu)
+            action.triggered.connect(functools.partial(self._set_sorgu_modu, mod))
+            mod_grubu.addAction(action)
+            self.menuSorguModu.addAction(action)
+
+        # Büyük aralıkları dilimlere bölüp eşzamanlı çekme (akış modunda kullanılmaz)
+        self.paralel_dilim = 0
+        self.menuParalel = QMenu("Paralel Çekme (PostgreSQL / SQL Server)", self)
+        paralel_grubu = QActionGroup(self)
+        for dilim in (0, 2, 4, 8):
+            action = QAction("Kapalı" if dilim == 0 else f"{dilim} dilim", self)
+            action.setCheckable(True)
+            action.setChecked(dilim == self.paralel_dilim)
+            action.triggered.connect(functools.partial(self._set_paralel_dilim, dilim))
+            paralel_grubu.addAction(action)
+            self.menuParalel.addAction(action)
+
+        # Yüklenen verinin tiplerini küçült (kategori, küçük tamsayı, tarih); tercih kalıcıdır
+        self.actionBellekOptimizasyonu = QAction("Bellek Optimizasyonu (Veri Tiplerini Küçült)", self)
+        self.actionBellekOptimizasyonu.setCheckable(True)
+        self.actionBellekOptimizasyonu.setChecked(self.ayarlar.value("bellek_optimizasyonu", False, type=bool))
+        self.actionBellekOptimizasyonu.toggled.connect(
+            lambda acik: self.ayarlar.setValue("bellek_optimizasyonu", acik)
+        )
+
+        # Arrow tabanlı çekme: sütunlar tablo yapısındaki SQL tiplerine göre pd.ArrowDtype olur
+        self.actionArrow = QAction("Arrow Veri Tipleri (pyarrow)", self)
+        self.actionArrow.setCheckable(True)
+        # pyarrow burada içe aktarılmaz (açılış süresi); yalnızca kurulu olup olmadığına bakılır
+        arrow_var = importlib.util.find_spec("pyarrow") is not None
+        self.actionArrow.setEnabled(arrow_var)
+        self.actionArrow.setChecked(arrow_var and self.ayarlar.value("arrow_cekme", False, type=bool))
+        self.actionArrow.toggled.connect(lambda acik: self.ayarlar.setValue("arrow_cekme", acik))
+
+        # PostgreSQL'de tümünü yükle modunda COPY ... TO STDOUT ile toplu çekme; yetki yoksa normal sorguya düşer
+        self.actionPgCopy = QAction("PostgreSQL COPY ile Toplu Çekme", self)
+        self.actionPgCopy.setCheckable(True)
+        self.actionPgCopy.setChecked(self.ayarlar.value("pg_copy", False, type=bool))
+        self.actionPgCopy.toggled.connect(lambda acik: self.ayarlar.setValue("pg_copy", acik))
+
+        self.actionOnbellegiTemizle = QAction("Sorgu Önbelleğini Temizle", self)
+        self.actionOnbellegiTemizle.triggered.connect(self.sorgu_onbellegini_temizle)
+        self.actionSemaYenile = QAction("Şema Kataloğunu Yenile", self)
+        self.actionSemaYenile.triggered.connect(self.sema_katalogunu_yenile)
+        try:
+            self.menuAyarlar.addMenu(self.menuSorguModu)
+            self.menuAyarlar.addMenu(self.menuParalel)
+            self.menuAyarlar.addAction(self.actionBellekOptimizasyonu)
+            self.menuAyarlar.addAction(self.actionArrow)
+            self.menuAyarlar.addAction(self.actionPgCopy)
+            self.menuAyarlar.addSeparator()
+            self.menuAyarlar.addAction(self.actionOnbellegiTemizle)
+            self.menuAyarlar.addAction(self.actionSemaYenile)
+            self.menuAyarlar.addSeparator()
+            panel_action = self.tanilama_paneli.toggleViewAction()
+            panel_action.setText("Sorgu Tanılama Paneli")
+            self.menuAyarlar.addAction(panel_action)
+        except AttributeError as e:
+            print(f"UYARI: 'Ayarlar' menüsü bulunamadı. {e}")
+
+    # --- Sonuç istekleri: yalnızca en son isteğin sonucu gösterilir ---
+    def _yeni_istek(self):
+        """
+        Yeni bir sonuç isteği başlatır: önceki isteğin worker'ları iptal edilir (sıradakiler
+        hiç çalışmaz, çalışanların sonucu gösterilmez) ve süren akış durdurulur.
+        """
+        self._istek_nesli += 1
+        for worker in self._istek_isleri:
+            worker.cancel()
+        self._istek_isleri = []
+        if self._akis_suruyor:
+            self._akis_suruyor = False
+            self.ilerleme_cubugu.hide()
+        return self._istek_nesli
+
+    def _guncel(self, nesil, slot):
+        """Slotu yalnızca 'nesil' hâlâ güncel istekse çağırır (iptalden önce kuyruğa girmiş sinyaller için)."""
+        def cagir(*args):
+            if nesil == self._istek_nesli:
+                slot(*args)
+        return cagir
+
+    def _istek_baslat(self, worker, finished, error, partial=None):
+        """Worker'ı güncel isteğe bağlar ve başlatır; sinyalleri istek eskidiyse yok sayılır."""
+        nesil = self._istek_nesli
+        worker.signals.finished.connect(self._guncel(nesil, finished))
+        worker.signals.error.connect(self._guncel(nesil, error))
+        if partial is not None:
+            worker.signals.partial.connect(self._guncel(nesil, partial))
+        self._istek_isleri.append(worker)
+        self.threadpool.start(worker)
+
+    def _sonucu_goster(self, df):
+        """Kullanıcının seçtiği hazır sonucu gösterir; yoldaki istekler geçersiz olur."""
+        self._yeni_istek()
+        self._on_query_finished(df)
+
+    def _yukleme_gorevi(self, task):
+        """Bellek optimizasyonu açıksa görevi, sonucunu küçültecek şekilde sarar."""
+        return core.optimized(task) if self.actionBellekOptimizasyonu.isChecked() else task
+
+    def _set_sorgu_modu(self, mod):
+        self.sorgu_modu = mod
+        print(f"Sorgu modu: {mod}")
+
+    def _set_paralel_dilim(self, dilim):
+        self.paralel_dilim = dilim
+        print(f"Paralel çekme: {dilim if dilim else 'kapalı'}")
+
+    def sorgu_onbellegini_temizle(self):
+        """Bellekteki ve diskteki tüm önbelleğe alınmış sorgu sonuçlarını siler."""
+        core.result_cache.clear()
+        self.statusbar.showMessage("Sorgu önbelleği temizlendi.", 5000)
+
+    def sema_katalogunu_yenile(self):
+        """Kayıtlı tablo listesini ve tablo yapılarını siler; bağlıysa listeyi yeniden okur."""
+        if not self.db_config:
+            core.schema_catalog.clear()
+            self.statusbar.showMessage("Şema kataloğu temizlendi.", 5000)
+            return
+        core.schema_catalog.invalidate(self.db_config)
+        self.load_tables_from_db()
+
+    def yerel_aynayi_esitle(self, tam=False):
+        """Seçili tablonun yerel aynasını arka planda oluşturur veya artımlı olarak eşitler."""
+        config, tablo = dict(self.db_config), self.target_table
+        self.statusbar.showMessage(f"Yerel ayna eşitleniyor: {tablo}...")
+        worker = Worker(core.sync_mirror, config, tablo, date_column_name=self.tarih_sutunu, full=tam)
+        worker.signals.partial.connect(
+            lambda satir: self.statusbar.showMessage(f"Yerel ayna eşitleniyor: {tablo} ({satir:,} satır)")
+        )
+        worker.signals.finished.connect(
+            lambda bilgi: self.statusbar.showMessage(
+                f"Yerel ayna güncel: {tablo} ({bilgi['rows']:,} satır, son kayıt: {bilgi['date_watermark']})", 8000
+            )
+        )
+        worker.signals.error.connect(
+            lambda hata: self.statusbar.showMessage(f"Yerel ayna eşitlenemedi: {hata}", 8000)
+        )
+        self.ayna_havuzu.start(worker)
+
+    def yerel_aynayi_kaldir(self):
+        """Seçili tablonun yerel aynasını siler; sorgular yeniden kaynağa gider."""
+        worker = Worker(core.remove_mirror, dict(self.db_config), self.target_table)
+        worker.signals.finished.connect(
+            lambda tablo: self.statusbar.showMessage(f"Yerel ayna kaldırıldı: {tablo}", 5000)
+        )
+        worker.signals.error.connect(self._on_task_error)
+        self.ayna_havuzu.start(worker)
+
+    def _aynayi_tazele(self):
+        """Tablonun aynası varsa ama eskidiyse arka planda artımlı eşitleme başlatır."""
+        if self.db_config.get('type') not in core.AYNALANABILIR_TURLER or self.ayna_havuzu.activeThreadCount():
+            return
+        bilgi = core.local_mirror.info(self.db_config, self.target_table)
+        if bilgi is not None and not core.local_mirror.is_fresh(bilgi):
+            self.yerel_aynayi_esitle()
 
     def update_connection_status(self):
         """Bağlantı durumunu (ışık), etiketleri ve butonların aktifliğini günceller."""
@@ -107,10 +469,21 @@ class MainWindow(QMainWindow):
             style = "background-color: #4CAF50; border-radius: 6px; min-width: 12px; max-width: 12px; min-height: 12px; max-height: 12px;"
             
             # Etiket metnini güncelle
-            label_text = f"Sistem: {db_type.capitalize()}  |  Tablo: {self.target_table}"
+            tarih_hazir = self.tarih_sutunu is not None
+            label_text = (
+                f"Sistem: {db_type.capitalize()}  |  Tablo: {self.target_table}  |  "
+                f"Tarih: {self.tarih_sutunu if tarih_hazir else 'belirleniyor...'}"
+            )
+            if self.secili_sutunlar:
+                label_text += f"  |  Sütun: {len(self.secili_sutunlar)} seçili"
             tooltip = f"BAĞLANDI\nSistem: {db_type}\nTablo: {self.target_table}"
             
-            self.btn_Sorgula.setEnabled(True)
+            # Tarih sütunu belirlenmeden gönderilen sorgu yanlış sütunla gider
+            self.btn_Sorgula.setEnabled(tarih_hazir)
+            self.actionSutunlariSec.setEnabled(True)
+            self.actionOzetRapor.setEnabled(tarih_hazir)
+            self.actionTarihSutunu.setEnabled(True)
+            self.menuYerelAyna.setEnabled(tarih_hazir and db_type in core.AYNALANABILIR_TURLER)
             self.date_Baslangic.setEnabled(True)
             self.date_Bitis.setEnabled(True)
         else:
@@ -122,6 +495,10 @@ class MainWindow(QMainWindow):
             tooltip = "BAĞLI DEĞİL\nLütfen 'Veritabanı' menüsünden bağlantı kurun."
 
             self.btn_Sorgula.setEnabled(False)
+            self.actionSutunlariSec.setEnabled(False)
+            self.actionOzetRapor.setEnabled(False)
+            self.actionTarihSutunu.setEnabled(False)
+            self.menuYerelAyna.setEnabled(False)
             self.date_Baslangic.setEnabled(False)
             self.date_Bitis.setEnabled(False)
             self.btn_Excel.setEnabled(False)
@@ -154,16 +531,43 @@ class MainWindow(QMainWindow):
             self.load_tables_from_db()
 
     def load_tables_from_db(self):
-        """Veritabanına bağlanıp tablo listesini çekmek için bir worker başlatır."""
+        """
+        Tablo listesini gösterir. Katalogda kayıtlı liste varsa hemen kullanılır
+        (süresi dolmuşsa arka planda yenilenir); yoksa veritabanından okunur.
+        """
+        cached = core.schema_catalog.get_tables(self.db_config)
+        if cached is not None:
+            table_list, kayit_zamani = cached
+            if not core.schema_catalog.is_fresh(kayit_zamani):
+                self._tablolari_arka_planda_yenile()
+            self._tablo_sec(table_list)
+            return
 
         self.show_loading_dialog("Veritabanına bağlanılıyor ve tablolar okunuyor...")
 
         # Worker'a 'self.db_path' yerine 'self.db_config' sözlüğünü ver
-        worker = Worker(get_database_tables, self.db_config) 
+        worker = Worker(core.refresh_database_tables, self.db_config)
         worker.signals.finished.connect(self._on_tables_loaded)
         worker.signals.error.connect(self._on_task_error)
         self.threadpool.start(worker)
 
+    def _tablolari_arka_planda_yenile(self):
+        """Kayıtlı tablo listesini, arayüzü bekletmeden veritabanından günceller."""
+        config = dict(self.db_config)
+        worker = Worker(core.refresh_database_tables, config)
+        worker.signals.finished.connect(functools.partial(self._on_tables_refreshed, config))
+        worker.signals.error.connect(
+            lambda hata: self.statusbar.showMessage(f"Tablo listesi yenilenemedi: {hata}", 5000)
+        )
+        self.threadpool.start(worker)
+
+    def _on_tables_refreshed(self, config, results):
+        """(Callback) Arka plan yenilemesi bitti; liste katalogda güncellendi."""
+        if core.config_key(config) != core.config_key(self.db_config):
+            return  # Bu arada başka bir bağlantıya geçilmiş
+        table_list, engine = results
+        self.db_engine = engine
+        self.statusbar.showMessage(f"Tablo listesi güncellendi ({len(table_list)} tablo).", 5000)
 
     def _on_tables_loaded(self, results):
         """(Callback) Worker'dan gelen tablo listesini alır ve kullanıcıya sunar."""
@@ -179,20 +583,26 @@ class MainWindow(QMainWindow):
 
         # Başarılı bağlantıdan gelen 'engine' nesnesini ilerde kullanmak için sakla
         self.db_engine = engine 
+        self._tablo_sec(table_list)
 
+    def _tablo_sec(self, table_list):
+        """Tablo listesini kullanıcıya sunar ve seçimi kaydeder."""
         if not table_list:
             QMessageBox.warning(self, "Hata", "Veritabanında okunabilir bir tablo bulunamadı.")
             self.db_config = {} # Bağlantıyı başarısız say
             self.update_connection_status()
             return
 
-        table_name, ok = QInputDialog.getItem(
-            self, "Tablo Seç", "Lütfen sorgulanacak tabloyu seçin:",
-            table_list, 0, False
-        )
+        # Çoklu hedef sorgusunda seçilebilsin
+        self.bilinen_baglantilar[core.config_key(self.db_config)] = dict(self.db_config)
 
-        if ok and table_name:
+        dialog = TableSelectDialog(table_list, parent=self)
+        table_name = dialog.get_selected_table() if dialog.exec() else None
+
+        if table_name:
             self.target_table = table_name
+            self.secili_sutunlar = self._kayitli_sutunlar()
+            self._tarih_sutununu_belirle()
             print(f"Kullanıcı '{table_name}' tablosunu seçti.")
         else:
             self.db_config = {} # Bağlantıyı başarısız say
@@ -201,47 +611,456 @@ class MainWindow(QMainWindow):
 
         self.update_connection_status()
         
-    def show_loading_dialog(self, text):
+    # --- Tarih sütunu ---
+    def _tarih_ayar_anahtari(self, config=None, tablo=None):
+        return f"tarih_sutunu/{core.config_key(config or self.db_config)}/{tablo or self.target_table}"
+
+    def _tarih_sutununu_belirle(self):
+        """
+        Kayıtlı tarih sütunu varsa onu kullanır; yoksa tablo yapısını arka planda okuyup
+        varsayılanı (TARIH ya da ilk indeksli tarih sütunu) seçer.
+        """
+        kayit = self.ayarlar.value(self._tarih_ayar_anahtari(), "")
+        # Varsayılan belirlenene kadar None kalır; sorgu butonları bu sürede kapalıdır
+        self.tarih_sutunu = kayit or None
+        if kayit:
+            return
+        tablo = self.target_table
+        worker = Worker(core.cached_table_info, self.db_config, tablo)
+        worker.signals.finished.connect(functools.partial(self._on_varsayilan_tarih, tablo))
+        worker.signals.error.connect(functools.partial(self._on_varsayilan_tarih_hatasi, tablo))
+        self.threadpool.start(worker)
+
+    def _on_varsayilan_tarih(self, tablo, table_info):
+        if tablo != self.target_table:
+            return  # Bu arada başka bir tablo seçilmiş
+        self.tarih_sutunu = core.default_date_column(table_info)
+        self.update_connection_status()
+
+    def _on_varsayilan_tarih_hatasi(self, tablo, hata):
+        """Tablo yapısı okunamazsa sabit varsayılan (TARIH) kullanılır; bağlantı sıfırlanmaz."""
+        if tablo != self.target_table:
+            return
+        self.statusbar.showMessage(f"Tablo yapısı okunamadı: {hata}", 5000)
+        self.tarih_sutunu = core.VARSAYILAN_TARIH_SUTUNU
+        self.update_connection_status()
+
+    def tarih_sutunu_sec(self):
+        """Tablo yapısını okur ve tarih sütunu seçim diyaloğunu açar."""
+        if not self.db_config or not self.target_table:
+            QMessageBox.warning(self, "Hata", "Lütfen önce bir veritabanı ve tablo seçin.")
+            return
+        self.show_loading_dialog("Tablo yapısı okunuyor...")
+        worker = Worker(core.cached_table_info, self.db_config, self.target_table)
+        worker.signals.finished.connect(self._on_tarih_adaylari)
+        worker.signals.error.connect(self._on_task_error)
+        self.threadpool.start(worker)
+
+    def _on_tarih_adaylari(self, table_info):
+        self.close_loading_dialog()
+        dialog = DateColumnDialog(core.date_column_candidates(table_info), self.tarih_sutunu, parent=self)
+        if not dialog.exec() or not dialog.get_selected_column():
+            return
+        self.tarih_sutunu = dialog.get_selected_column()
+        self.ayarlar.setValue(self._tarih_ayar_anahtari(), self.tarih_sutunu)
+        self.update_connection_status()
+
+    # --- Sütun seçimi (projection) ---
+    def _sutun_ayar_anahtari(self, config=None, tablo=None):
+        return f"sutunlar/{core.config_key(config or self.db_config)}/{tablo or self.target_table}"
+
+    def _kayitli_sutunlar(self, config=None, tablo=None):
+        """Bu bağlantı ve tablo için daha önce kaydedilen sütun seçimini döndürür."""
+        kayit = self.ayarlar.value(self._sutun_ayar_anahtari(config, tablo), "")
+        try:
+            return (json.loads(kayit) or None) if kayit else None
+        except (TypeError, ValueError):
+            return None
+
+    def _sutunlari_yukle(self, callback):
+        """Tablonun sütunlarını arka planda okur ve 'callback'e verir."""
+        if not self.db_config or not self.target_table:
+            QMessageBox.warning(self, "Hata", "Lütfen önce bir veritabanı ve tablo seçin.")
+            return
+        self.show_loading_dialog("Tablo sütunları okunuyor...")
+        worker = Worker(core.cached_table_columns, self.db_config, self.target_table)
+        worker.signals.finished.connect(callback)
+        worker.signals.error.connect(self._on_task_error)
+        self.threadpool.start(worker)
+
+    def sutunlari_sec(self):
+        """Tablonun sütunlarını okur ve seçim diyaloğunu açar."""
+        self._sutunlari_yukle(self._on_columns_loaded)
+
+    def _on_columns_loaded(self, columns):
+        self.close_loading_dialog()
+        dialog = ColumnSelectDialog(columns, self.secili_sutunlar, locked=self.tarih_sutunu, parent=self)
+        if not dialog.exec():
+            return
+        self.secili_sutunlar = dialog.get_selected_columns()
+        self.ayarlar.setValue(self._sutun_ayar_anahtari(), json.dumps(self.secili_sutunlar or []))
+        self.update_connection_status()
+
+    # --- Özet rapor (sunucu tarafında gruplama) ---
+    def ozet_rapor(self):
+        """Gruplama ayarlarını sorar; toplama işini veritabanına yaptırır."""
+        self._sutunlari_yukle(self._on_ozet_columns_loaded)
+
+    def _on_ozet_columns_loaded(self, columns):
+        self.close_loading_dialog()
+        dialog = AggregateDialog(
+            columns, core.AGGREGATE_FUNCTIONS, core.TIME_BUCKETS, date_column=self.tarih_sutunu, parent=self
+        )
+        if not dialog.exec():
+            return
+
+        self._yeni_istek()
+        self.show_loading_dialog("Özet rapor hazırlanıyor... Lütfen bekleyin.")
+        baslangic = self.date_Baslangic.date().toString("yyyy-MM-dd")
+        bitis = self.date_Bitis.date().toString("yyyy-MM-dd")
+        worker = Worker(
+            core.run_aggregate_query, self.db_config, self.target_table, baslangic, bitis,
+            date_column_name=self.tarih_sutunu, **dialog.get_spec()
+        )
+        self._istek_baslat(worker, self._on_query_finished, self._on_task_error)
+
+    # --- Çoklu hedef sorgusu (fan-out) ---
+    @staticmethod
+    def _baglanti_etiketi(config):
+        if config.get('path'):
+            return f"{config['type']}: {os.path.basename(config['path'])}"
+        return f"{config['type']}: {config.get('host')}/{config.get('database')}"
+
+    def coklu_hedef_sorgusu(self):
+        """Aynı tarih aralığını seçilen birden çok tablodan/bağlantıdan eşzamanlı çeker."""
+        baglantilar = []
+        for config in self.bilinen_baglantilar.values():
+            kayit = core.schema_catalog.get_tables(config)
+            if kayit:
+                baglantilar.append((self._baglanti_etiketi(config), config, kayit[0]))
+        if not baglantilar:
+            QMessageBox.warning(self, "Bağlantı Yok",
+                "Çoklu sorgu için önce 'Veritabanı' menüsünden en az bir veritabanına bağlanın.")
+            return
+
+        dialog = MultiTargetDialog(baglantilar, default_limit=core.BAGLANTI_BASINA_SINIR, parent=self)
+        if not dialog.exec():
+            return
+
+        hedefler = []
+        for config, tablo in dialog.get_targets():
+            tarih_sutunu = self.ayarlar.value(self._tarih_ayar_anahtari(config, tablo), "") or None
+            hedefler.append(core.make_target(config, tablo, tarih_sutunu, self._kayitli_sutunlar(config, tablo)))
+
+        baslangic = self.date_Baslangic.date().toString("yyyy-MM-dd")
+        bitis = self.date_Bitis.date().toString("yyyy-MM-dd")
+        # Her hedef önbellekli tam yükleme yolundan geçer (dilimli paralel çekme hedef başına kapalı)
+        query_func = functools.partial(
+            self._yukleme_gorevi(core.cached_database_query), force_refresh=self.chk_Yenile.isChecked(),
+            arrow=self.actionArrow.isChecked(), bulk_copy=self.actionPgCopy.isChecked()
+        )
+
+        self._yeni_istek()
+        self._fanout_biten = 0
+        self.show_loading_dialog(f"{len(hedefler)} hedef sorgulanıyor... (0 / {len(hedefler)})")
+        worker = Worker(
+            core.run_fanout_query, hedefler, baslangic, bitis,
+            max_per_connection=dialog.get_connection_limit(), query_func=query_func
+        )
+        self._istek_baslat(
+            worker, functools.partial(self._on_fanout_finished, dialog.get_result_mode()), self._on_fanout_error,
+            partial=functools.partial(self._on_fanout_partial, len(hedefler))
+        )
+
+    def _on_fanout_partial(self, toplam, sonuc):
+        """(Callback) Bir hedef tamamlandı: ilerlemeyi günceller."""
+        self._fanout_biten += 1
+        if self.progress_dialog:
+            self.progress_dialog.setLabelText(
+                f"{toplam} hedef sorgulanıyor... ({self._fanout_biten} / {toplam})\nSon biten: {sonuc['label']}"
+            )
+
+    def _on_fanout_finished(self, mod, sonuclar):
+        self.close_loading_dialog()
+        hatalar = [s for s in sonuclar if s['error']]
+        en_yavas = max(s['seconds'] for s in sonuclar)
+
+        if mod == MultiTargetDialog.SONUC_SEKMELER:
+            pencere = FanOutResultsDialog(sonuclar, parent=self)
+            pencere.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            pencere.frame_selected.connect(self._sonucu_goster)
+            pencere.show()
+        else:
+            self._on_query_finished(core.union_results(sonuclar))
+
+        satir = sum(len(s['df']) for s in sonuclar if s['df'] is not None)
+        self.statusbar.showMessage(
+            f"Çoklu sorgu bitti: {len(sonuclar) - len(hatalar)} / {len(sonuclar)} hedef, {satir} satır "
+            f"(en yavaş hedef {en_yavas:.1f} sn).", 8000
+        )
+        if hatalar:
+            QMessageBox.warning(self, "Bazı Hedefler Başarısız",
+                "\n".join(f"{s['label']}: {s['error']}" for s in hatalar))
+
+    def _on_fanout_error(self, hata_mesaji):
+        # Hedeflerin hiçbirinden veri alınamadı; aktif bağlantı etkilenmez
+        self.close_loading_dialog()
+        QMessageBox.critical(self, "Hata", f"Çoklu sorgu başarısız oldu:\n\n{hata_mesaji}")
+
+    def show_loading_dialog(self, text, toplam=0):
+        """Bekleme penceresi. 'toplam' (satır) verilirse ilerleme çubuğu belirli, değilse sonsuz döner."""
         if not self.progress_dialog:
             self.progress_dialog = QProgressDialog(text, None, 0, 0, self)
             self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
             self.progress_dialog.setCancelButton(None)
             self.progress_dialog.setMinimumDuration(0)
         self.progress_dialog.setLabelText(text)
+        self.progress_dialog.setRange(0, min(toplam or 0, 2**31 - 1))
         self.progress_dialog.setValue(0)
         self.progress_dialog.show()
         QApplication.processEvents()
 
+    def _ilerleme_goster(self, satir):
+        """Okunan satır sayısını, ön kontrol tahminine göre bekleme penceresinde ve durum çubuğunda gösterir."""
+        tahmin = (self.sorgu_tahmini or {}).get('rows')
+        if not tahmin:
+            return
+        # Planlayıcı tahmini düşük kalmış olabilir: çubuk geri gitmesin, sona dayanmasın
+        toplam = min(max(tahmin, satir + 1), 2**31 - 1)
+        yaklasik = "" if self.sorgu_tahmini.get('exact') else "~"
+        metin = f"Yükleniyor... {satir:,} / {yaklasik}{tahmin:,} satır"
+        # Modal pencerede setValue olay döngüsünü çalıştırır; sorgu bu arada bitip pencereyi kapatabilir
+        dialog = self.progress_dialog
+        if dialog:
+            dialog.setMaximum(toplam)
+            dialog.setLabelText(metin)
+            dialog.setValue(min(satir, toplam))
+        if self._akis_suruyor:
+            self.ilerleme_cubugu.setMaximum(toplam)
+            self.ilerleme_cubugu.setValue(min(satir, toplam))
+            self.ilerleme_cubugu.show()
+
     def close_loading_dialog(self):
         if self.progress_dialog:
             self.progress_dialog.close()
             self.progress_dialog = None
 
-# Bu fonksiyonu güncelleyin
     def sorgulama_yap(self):
-        """1. Adım: 'Sorgula' butonu."""
+        """1. Adım: 'Sorgula' butonu. Önce sonuç boyutu tahmin edilir (ön kontrol)."""
 
         if not self.db_config or not self.target_table:
             QMessageBox.warning(self, "Hata", "Lütfen önce 'Veritabanı' menüsünden bir veritabanı ve tablo seçin.")
             return
-
-        self.show_loading_dialog("Veritabanı sorgulanıyor... Lütfen bekleyin.")
+        if self.tarih_sutunu is None:
+            self.statusbar.showMessage("Tarih sütunu belirleniyor, lütfen bekleyin...", 3000)
+            return
 
         baslangic = self.date_Baslangic.date().toString("yyyy-MM-dd")
         bitis = self.date_Bitis.date().toString("yyyy-MM-dd")
+        yenile = self.chk_Yenile.isChecked()
+        self._yeni_istek()
+        self.sorgu_tahmini = None
+        # Aynası eskimiş tablo arka planda eşitlenir; eşitleme bitene kadar sorgular kaynağa gider
+        self._aynayi_tazele()
+
+        if self.sorgu_modu == 'gozat':
+            # Sayfalı gözatma belleği zaten sınırlar; tahmine gerek yok
+            self.show_loading_dialog("Veritabanı sorgulanıyor... Lütfen bekleyin.")
+            self._gozatma_baslat(baslangic, bitis)
+            return
+
+        self.show_loading_dialog("Sonuç boyutu tahmin ediliyor...")
+        worker = Worker(
+            core.estimate_result_size, self.db_config, self.target_table, baslangic, bitis,
+            self.secili_sutunlar, date_column_name=self.tarih_sutunu
+        )
+        # Ön kontrol hatası sorguyu engellemez: tahminsiz devam edilir
+        self._istek_baslat(
+            worker, functools.partial(self._on_tahmin_hazir, baslangic, bitis, yenile),
+            lambda _hata: self._on_tahmin_hazir(baslangic, bitis, yenile, None)
+        )
+
+    def _on_tahmin_hazir(self, baslangic, bitis, yenile, tahmin):
+        """(Callback) Tahmine göre sorgu modunu belirler, gerekirse kullanıcıyı uyarır ve sorguyu başlatır."""
+        self.sorgu_tahmini = tahmin
+        mod = self.sorgu_modu
+        if mod == 'otomatik':
+            mod = core.choose_strategy(tahmin)
+            print(f"Otomatik sorgu modu: {mod} (tahmin: {tahmin})")
+
+        if mod != 'gozat' and ((tahmin or {}).get('bytes') or 0) >= core.BUYUK_SONUC_SINIRI:
+            mod = self._buyuk_sonuc_sor(tahmin, mod)
+            if mod is None:
+                self.close_loading_dialog()
+                self.statusbar.showMessage("Sorgu iptal edildi.", 5000)
+                return
+            if mod == 'ozet':
+                self.close_loading_dialog()
+                self.ozet_rapor()
+                return
+
+        satir = (tahmin or {}).get('rows') or 0
+        if mod == 'gozat':
+            self.show_loading_dialog("Veritabanı sorgulanıyor... Lütfen bekleyin.")
+            self._gozatma_baslat(baslangic, bitis)
+            return
+        self.show_loading_dialog("Veritabanı sorgulanıyor... Lütfen bekleyin.", toplam=satir)
+        if mod == 'akis':
+            self._akisli_sorgu_baslat(baslangic, bitis, yenile)
+            return
 
         # Worker'a, Sınıf değişkenlerindeki (self.) değerlerle başlat
         # db_path yerine config sözlüğünün tamamını gönder
-        worker = Worker(run_database_query, self.db_config, self.target_table, baslangic, bitis) 
+        worker = Worker(
+            self._yukleme_gorevi(core.cached_database_query), self.db_config, self.target_table, baslangic, bitis,
+            self.secili_sutunlar, force_refresh=yenile, paralel=self.paralel_dilim,
+            date_column_name=self.tarih_sutunu, arrow=self.actionArrow.isChecked(),
+            bulk_copy=self.actionPgCopy.isChecked()
+        )
+        self._istek_baslat(worker, self._on_query_finished, self._on_task_error, partial=self._ilerleme_goster)
+
+    def _buyuk_sonuc_sor(self, tahmin, mod):
+        """Çok büyük sonuç uyarısı. Seçilen modu ('gozat', 'ozet', verilen mod) ya da iptal için None döndürür."""
+        kaynaklar = {'plan': "planlayıcı istatistikleri", 'count': "kesin sayım", 'catalog': "tablonun tamamı"}
+        kutu = QMessageBox(self)
+        kutu.setIcon(QMessageBox.Icon.Warning)
+        kutu.setWindowTitle("Çok Büyük Sonuç")
+        kutu.setText(
+            f"Bu sorgu yaklaşık {tahmin['rows']:,} satır döndürecek ve belleğe yüklendiğinde "
+            f"~{format_bytes(tahmin['bytes'])} yer kaplayacak "
+            f"(kaynak: {kaynaklar.get(tahmin.get('source'), 'bilinmiyor')})."
+        )
+        kutu.setInformativeText(
+            "Sayfalı gözatma satırları kaydırdıkça getirir; özet rapor veriyi sunucuda gruplar."
+        )
+        gozat = kutu.addButton("Sayfalı Gözat", QMessageBox.ButtonRole.AcceptRole)
+        ozet = kutu.addButton("Özet Rapor...", QMessageBox.ButtonRole.ActionRole)
+        yukle = kutu.addButton("Yine de Yükle", QMessageBox.ButtonRole.DestructiveRole)
+        kutu.addButton("İptal", QMessageBox.ButtonRole.RejectRole)
+        kutu.setDefaultButton(gozat)
+        kutu.exec()
+        secilen = kutu.clickedButton()
+        if secilen is gozat:
+            return 'gozat'
+        if secilen is ozet:
+            return 'ozet'
+        if secilen is yukle:
+            return mod
+        return None
+
+    def _akisli_sorgu_baslat(self, baslangic, bitis, yenile=False):
+        """Sorguyu akış modunda başlatır; satırlar geldikçe tabloya eklenir."""
+        self.df = None
+        self.tabloyu_doldur(self.df)
+        self._akis_suruyor = True # Satırlar gelirken sıralama kapalı
+        self.btn_Sorgula.setEnabled(False)
+
+        istek = (dict(self.db_config), self.target_table, baslangic, bitis, self.secili_sutunlar)
+        tarih_sutunu = self.tarih_sutunu
+        worker = Worker(core.cached_stream_query, *istek, force_refresh=yenile, date_column_name=tarih_sutunu)
+        self._istek_baslat(
+            worker, functools.partial(self._on_stream_finished, istek, tarih_sutunu), self._on_task_error,
+            partial=self._on_query_partial
+        )
 
-        worker.signals.finished.connect(self._on_query_finished)
-        worker.signals.error.connect(self._on_task_error)
+    def _on_query_partial(self, df_parca):
+        """(Callback) Akış modunda gelen her parçayı tablonun sonuna ekler."""
+        # İlk satırlar geldi, tabloyu göstermek için bekleme penceresini kapat
+        self.close_loading_dialog()
+        self.veri_modeli.append_frame(df_parca)
+        self.statusbar.showMessage(f"Yükleniyor... {self.veri_modeli.rowCount()} satır")
+        self._ilerleme_goster(self.veri_modeli.rowCount())
+
+    def _on_stream_finished(self, istek, tarih_sutunu, sonuc):
+        """(Callback) Akış bitti: parçaları dışa aktarım için tek bir DataFrame'de birleştirir."""
+        toplam, onbellekten = sonuc
+        self.df = self.veri_modeli.dataframe()
+        self._akis_suruyor = False
+        self.ilerleme_cubugu.hide()
+
+        if not onbellekten:
+            # Birleştirilen sonucu arka planda önbelleğe yaz
+            worker = Worker(core.store_query_result, *istek, self.df, date_column_name=tarih_sutunu)
+            worker.signals.error.connect(lambda hata: print(f"Önbelleğe yazılamadı: {hata}"))
+            self.threadpool.start(worker)
+
+        self.close_loading_dialog()
+        self.update_connection_status()
+        self.statusbar.showMessage(f"Sorgulama bitti. {toplam} satır bulundu.", 5000)
+
+    # --- Sayfalı gözatma (keyset pagination) ---
+    def _gozatma_baslat(self, baslangic, bitis):
+        """Birincil anahtarı okur, ardından ilk sayfayı ister."""
+        worker = Worker(core.get_primary_key, self.db_config, self.target_table)
+        self._istek_baslat(worker, functools.partial(self._on_gozatma_pk, baslangic, bitis), self._on_task_error)
+
+    def _on_gozatma_pk(self, baslangic, bitis, primary_key):
+        self.close_loading_dialog()
+        self.df = None  # Gözatma modunda tüm sonuç bellekte tutulmaz
+        self.veri_modeli.set_dataframe(self.df)
+        self._gozatma = {
+            'config': dict(self.db_config), 'table': self.target_table,
+            'baslangic': baslangic, 'bitis': bitis,
+            'primary_key': primary_key, 'columns': self.secili_sutunlar,
+            'date_column': self.tarih_sutunu, 'sort_column': None,
+        }
+        self.tbl_Veri.setModel(self.gozatma_modeli)
+        self.tbl_Veri.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.gozatma_modeli.reset(core.keyset_order_columns(primary_key, None, self.tarih_sutunu))
+        self.update_connection_status()
+        self.statusbar.showMessage("Gözatma modu: satırlar kaydırdıkça sayfa sayfa yüklenir.", 5000)
+
+    def _on_gozatma_sayfa_istegi(self, sayfa_no, after_key, nesil):
+        """(Model isteği) Bir sayfayı arka planda çeker."""
+        if not self._gozatma:
+            return
+        g = self._gozatma
+        worker = Worker(
+            core.fetch_keyset_page, g['config'], g['table'], g['baslangic'], g['bitis'],
+            self.gozatma_modeli.order_columns, descending=self.gozatma_modeli.descending,
+            after_key=after_key, page_size=core.GOZATMA_SAYFA_BOYUTU, columns=g['columns'],
+            date_column_name=g['date_column']
+        )
+        worker.signals.finished.connect(functools.partial(self.gozatma_modeli.page_loaded, sayfa_no, nesil))
+        worker.signals.error.connect(functools.partial(self._on_gozatma_sayfa_hatasi, sayfa_no, nesil))
         self.threadpool.start(worker)
 
+    def _on_gozatma_sayfa_hatasi(self, sayfa_no, nesil, hata_mesaji):
+        self.gozatma_modeli.page_failed(sayfa_no, nesil)
+        print(f"Ana arayüz: Sayfa {sayfa_no + 1} çekilemedi: {hata_mesaji}")
+        self.statusbar.showMessage(f"Sayfa çekilemedi: {hata_mesaji}", 5000)
+
+    def _gozatma_sirala(self, column):
+        """Gözatma modunda başlık tıklaması: sıralama ORDER BY olarak veritabanına yaptırılır."""
+        g = self._gozatma
+        sutun = self.gozatma_modeli.headerData(column, Qt.Orientation.Horizontal)
+        azalan = (not self.gozatma_modeli.descending) if sutun == g['sort_column'] else False
+        g['sort_column'] = sutun
+        self.tbl_Veri.horizontalHeader().setSortIndicator(
+            column, Qt.SortOrder.DescendingOrder if azalan else Qt.SortOrder.AscendingOrder
+        )
+        self.gozatma_modeli.reset(
+            core.keyset_order_columns(g['primary_key'], sutun, g['date_column']), descending=azalan
+        )
+
+    def _gozatmayi_bitir(self):
+        """Gözatma oturumunu kapatır ve tabloyu normal modele döndürür."""
+        if self._gozatma is None:
+            return
+        self._gozatma = None
+        self.gozatma_modeli.clear()
+        self.tbl_Veri.setModel(self.veri_modeli)
+
     def _on_query_finished(self, df):
         self.df = df
         self.tabloyu_doldur(self.df)
         self.update_connection_status()
+        rapor = df.attrs.get('bellek_raporu')
+        if rapor:
+            self.statusbar.showMessage(
+                f"{len(df)} satır. Bellek: {rapor['once'] / 1024**2:.1f} MB -> {rapor['sonra'] / 1024**2:.1f} MB "
+                f"({len(rapor['sutunlar'])} sütun küçültüldü).", 8000
+            )
         try:
             if self.tarihSecCBox.currentData() and self.secili_dosyalar_listesi:
                 dosya_adi = self.secili_dosyalar_listesi[self.secili_dosya_index]
@@ -253,19 +1072,51 @@ class MainWindow(QMainWindow):
     def excel_dosyasini_yukle(self):
         if not self.secili_dosyalar_listesi:
             return
+        self.rapor_gecis_zamanlayici.stop()
         try:
             klasor_yolu = self.tarihSecCBox.currentData()
             dosya_adi = self.secili_dosyalar_listesi[self.secili_dosya_index]
             tam_yol = os.path.join(klasor_yolu, dosya_adi)
+            self._yeni_istek()
             self.show_loading_dialog(f"{dosya_adi} yükleniyor... Lütfen bekleyin.")
-            worker = Worker(load_excel_file, tam_yol)
-            worker.signals.finished.connect(self._on_query_finished)
-            worker.signals.error.connect(self._on_task_error)
-            self.threadpool.start(worker)
+            worker = Worker(self._yukleme_gorevi(core.load_excel_file), tam_yol)
+            self._istek_baslat(worker, self._on_rapor_yuklendi, self._on_task_error)
         except Exception as e:
             self._on_task_error(f"Excel yükleme başlatılamadı: {e}")
 
+    def _on_rapor_yuklendi(self, df):
+        self._on_query_finished(df)
+        self._komsu_raporlari_onyukle()
+
+    def _onyuklemeyi_iptal_et(self):
+        """Sıradaki ön yüklemeleri kaldırır; çalışan ön yükleme okuduğu dosyadan sonra durur."""
+        self.onyukleme_havuzu.clear()
+        if self._onyukleme_isi is not None:
+            self._onyukleme_isi.cancel()
+            self._onyukleme_isi = None
+
+    def _komsu_raporlari_onyukle(self):
+        """Gösterilen raporun komşularını, en yakından başlayarak arka planda önbelleğe okur."""
+        self._onyuklemeyi_iptal_et()
+        klasor_yolu = self.tarihSecCBox.currentData()
+        if not klasor_yolu or not self.secili_dosyalar_listesi:
+            return
+        sira = []
+        for uzaklik in range(1, KOMSU_RAPOR_ONYUKLEME + 1):
+            # İleri yön önce: geçmiş raporlarda genellikle ileri gidilir
+            for index in (self.secili_dosya_index + uzaklik, self.secili_dosya_index - uzaklik):
+                if 0 <= index < len(self.secili_dosyalar_listesi):
+                    sira.append(os.path.join(klasor_yolu, self.secili_dosyalar_listesi[index]))
+        if not sira:
+            return
+        worker = Worker(core.prefetch_reports, sira)
+        worker.signals.error.connect(lambda hata: print(f"UYARI: Rapor ön yüklemesi başarısız: {hata}"))
+        self._onyukleme_isi = worker
+        self.onyukleme_havuzu.start(worker)
+
     def combobox_degisti(self, index):
+        # Başka bir tarih klasörüne geçildi: eski klasörün ön yüklemesi boşuna çalışmasın
+        self._onyuklemeyi_iptal_et()
         klasor_yolu = self.tarihSecCBox.currentData()
         if not klasor_yolu:
             self.secili_dosyalar_listesi = []
@@ -286,45 +1137,88 @@ class MainWindow(QMainWindow):
             return
         if self.secili_dosya_index < len(self.secili_dosyalar_listesi) - 1:
             self.secili_dosya_index += 1
-            self.excel_dosyasini_yukle()
+            self._rapor_gecisi_planla()
 
     def onceki_rapor(self):
         if not self.secili_dosyalar_listesi:
             return
         if self.secili_dosya_index > 0:
             self.secili_dosya_index -= 1
-            self.excel_dosyasini_yukle()
+            self._rapor_gecisi_planla()
 
-    def tabloyu_doldur(self, df):
-        self.tbl_Veri.setUpdatesEnabled(False)
-        self.tbl_Veri.setSortingEnabled(False)
+    def _rapor_gecisi_planla(self):
+        """
+        İleri/geri tıklamalarını birleştirir: rapor, son tıklamadan RAPOR_GECIS_GECIKMESI_MS
+        sonra yüklenir; aradaki raporlar hiç okunmaz. Yoldaki eski yükleme gösterilmez.
+        """
+        self._yeni_istek()
+        dosya_adi = self.secili_dosyalar_listesi[self.secili_dosya_index]
+        self.statusbar.showMessage(
+            f"Gösterilecek: {dosya_adi} ({self.secili_dosya_index + 1} / {len(self.secili_dosyalar_listesi)})"
+        )
+        self.rapor_gecis_zamanlayici.start()
 
-        self.tbl_Veri.setRowCount(0)
-        self.tbl_Veri.setColumnCount(0)
+    def tabloyu_doldur(self, df):
+        """Tabloyu verilen DataFrame ile gösterir (satır sayısından bağımsız, anlık)."""
+        self._gozatmayi_bitir()
+        self.siralama = []
+        self.tbl_Veri.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.veri_modeli.set_dataframe(df)
 
-        if df.empty:
-            self.tbl_Veri.setSortingEnabled(True)
-            self.tbl_Veri.setUpdatesEnabled(True)
+    def _on_header_clicked(self, column):
+        """
+        Başlık tıklaması: sıralama sırası (permütasyon) bir worker'da numpy ile hesaplanır.
+        Aynı sütuna tekrar tıklamak yönü değiştirir; Ctrl/Shift ile tıklamak
+        sütunu ek (ikincil) sıralama anahtarı olarak ekler.
+        """
+        if self._gozatma is not None:
+            self._gozatma_sirala(column)
+            return
+        if self._akis_suruyor or self.veri_modeli.rowCount() == 0:
             return
 
-        self.tbl_Veri.setRowCount(len(df))
-        self.tbl_Veri.setColumnCount(len(df.columns))
-        self.tbl_Veri.setHorizontalHeaderLabels(df.columns)
+        onceki = dict(self.siralama)
+        artan = not onceki[column] if column in onceki else True
+        ek_anahtar = QApplication.keyboardModifiers() & (
+            Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier
+        )
+        if ek_anahtar and self.siralama:
+            if column in onceki:
+                self.siralama = [(c, artan if c == column else a) for c, a in self.siralama]
+            else:
+                self.siralama = self.siralama + [(column, artan)]
+        else:
+            self.siralama = [(column, artan)]
 
-        for i in range(len(df)):
-            for j in range(len(df.columns)):
-                raw_value = df.iloc[i, j]
-                item = QTableWidgetItem()
-                is_numeric = isinstance(raw_value, (int, float))
-                if is_numeric:
-                    item.setData(Qt.ItemDataRole.EditRole, float(raw_value))
-                    item.setData(Qt.ItemDataRole.DisplayRole, str(raw_value))
-                else:
-                    item.setData(Qt.ItemDataRole.DisplayRole, str(raw_value))
-                self.tbl_Veri.setItem(i, j, item)
+        birincil, birincil_artan = self.siralama[0]
+        self.tbl_Veri.horizontalHeader().setSortIndicator(
+            birincil, Qt.SortOrder.AscendingOrder if birincil_artan else Qt.SortOrder.DescendingOrder
+        )
+        self.statusbar.showMessage("Sıralanıyor...")
+
+        # Önceki sıralama daha yavaş bitebilir: iptal edilir, sonucu gelirse de yok sayılır
+        if self._siralama_isi is not None:
+            self._siralama_isi.cancel()
+        self._siralama_nesli += 1
+        key_cache = self.veri_modeli.sort_key_cache()
+        worker = Worker(core.compute_sort_order, self.veri_modeli.dataframe(), list(self.siralama), key_cache)
+        worker.signals.finished.connect(functools.partial(self._on_sort_finished, self._siralama_nesli, key_cache))
+        worker.signals.error.connect(self._on_sort_error)
+        self._siralama_isi = worker
+        self.threadpool.start(worker)
 
-        self.tbl_Veri.setSortingEnabled(True)
-        self.tbl_Veri.setUpdatesEnabled(True)
+    def _on_sort_finished(self, nesil, key_cache, order):
+        """(Callback) Hesaplanan sıralamayı modele görünüm olarak uygular; eski tıklamaların sonucu atılır."""
+        if nesil != self._siralama_nesli:
+            return
+        self._siralama_isi = None
+        if self.veri_modeli.set_order(order, key_cache):
+            self.statusbar.showMessage("Sıralama tamamlandı.", 3000)
+
+    def _on_sort_error(self, hata_mesaji):
+        # Sıralama hatası bağlantıyı etkilemez; sadece bildir
+        print(f"Ana arayüz: Sıralama hatası: {hata_mesaji}")
+        self.statusbar.showMessage(f"Sıralama yapılamadı: {hata_mesaji}", 5000)
 
     def export_excel(self):
         if self.df.empty:
@@ -332,12 +1226,12 @@ class MainWindow(QMainWindow):
             return
         start_date = self.date_Baslangic.date().toPyDate()
         end_date = self.date_Bitis.date().toPyDate()
-        kayit_yolu = get_yeni_kayit_yolu("excel", start_date, end_date, self.target_table)
+        kayit_yolu = core.get_yeni_kayit_yolu("excel", start_date, end_date, self.target_table)
         if not kayit_yolu:
             QMessageBox.critical(self, "Hata", "Kayıt yolu oluşturulamadı.")
             return
         self.show_loading_dialog("Excel dosyası oluşturuluyor... Lütfen bekleyin.")
-        worker = Worker(task_run_excel, kayit_yolu, self.df.copy())
+        worker = Worker(core.task_run_excel, kayit_yolu, self.df.copy())
         worker.signals.finished.connect(self._on_export_finished)
         worker.signals.error.connect(self._on_task_error)
         self.threadpool.start(worker)
@@ -348,12 +1242,12 @@ class MainWindow(QMainWindow):
             return
         start_date = self.date_Baslangic.date().toPyDate()
         end_date = self.date_Bitis.date().toPyDate()
-        kayit_yolu = get_yeni_kayit_yolu("pdf", start_date, end_date, self.target_table)
+        kayit_yolu = core.get_yeni_kayit_yolu("pdf", start_date, end_date, self.target_table)
         if not kayit_yolu:
             QMessageBox.critical(self, "Hata", "Kayıt yolu oluşturulamadı.")
             return
         self.show_loading_dialog("PDF dosyası oluşturuluyor... Lütfen bekleyin.")
-        worker = Worker(task_run_pdf, kayit_yolu, self.df.copy())
+        worker = Worker(core.task_run_pdf, kayit_yolu, self.df.copy())
         worker.signals.finished.connect(self._on_export_finished)
         worker.signals.error.connect(self._on_task_error)
         self.threadpool.start(worker)
@@ -369,38 +1263,30 @@ class MainWindow(QMainWindow):
         print(f"Ana arayüz: Görev hatası alındı: {hata_mesaji}")
         QMessageBox.critical(self, "Hata", f"İşlem sırasında bir hata oluştu:\n\n{hata_mesaji}")
 
-        # Hata durumunda bağlantıyı sıfırla
+        # Hata durumunda bağlantıyı sıfırla (bozuk olabilecek havuzu da kapat)
+        core.dispose_engine(self.db_config)
         self.db_config = {} # db_path yerine
         self.target_table = None
         self.db_engine = None
-        self.df = pd.DataFrame()
+        self.df = None
+        self._akis_suruyor = False
+        self.ilerleme_cubugu.hide()
+        self._gozatmayi_bitir()
         self.update_connection_status() # Işığı kırmızıya çeker ve butonları kilitler
     def kayitli_raporlari_tara(self):
-            self.tarihSecCBox.blockSignals(True)
-            self.tarihSecCBox.clear()
-            rapor_klasorleri = {}
-            if not os.path.exists(self.rapor_ana_klasoru):
-                self.tarihSecCBox.blockSignals(False)
-                return
-            for yil_klasor in os.listdir(self.rapor_ana_klasoru):
-                yil_yolu = os.path.join(self.rapor_ana_klasoru, yil_klasor)
-                if os.path.isdir(yil_yolu) and yil_klasor.isdigit():
-                    for gun_ay_klasor in os.listdir(yil_yolu):
-                        # use yil_yolu here (was typo yil_klasoru)
-                        gun_ay_yolu = os.path.join(yil_yolu, gun_ay_klasor)
-                        if os.path.isdir(gun_ay_yolu) and '_' in gun_ay_klasor:
-                            if any(f.endswith('.xlsx') for f in os.listdir(gun_ay_yolu)):
-                                combo_text = f"{gun_ay_klasor}_{yil_klasor}"
-                                rapor_klasorleri[combo_text] = gun_ay_yolu
-            try:
-                sorted_keys = sorted(rapor_klasorleri.keys(), key=lambda d: datetime.strptime(d, '%d_%m_%Y'))
-            except Exception:
-                sorted_keys = sorted(rapor_klasorleri.keys())
-            self.tarihSecCBox.addItem("Geçmiş Rapor Seçin...", userData=None)
-            for key in sorted_keys:
-                self.tarihSecCBox.addItem(key, userData=rapor_klasorleri[key])
-            self.tarihSecCBox.blockSignals(False)
-        # MainWindow sınıfının içine ekleyin
+        """Kayıtlı rapor klasörlerini arka planda tarar (ağ sürücüsünde yavaş olabilir)."""
+        worker = Worker(core.scan_saved_reports, self.rapor_ana_klasoru)
+        worker.signals.finished.connect(self._on_raporlar_tarandi)
+        worker.signals.error.connect(lambda hata: print(f"UYARI: Kayıtlı raporlar taranamadı: {hata}"))
+        self.threadpool.start(worker)
+
+    def _on_raporlar_tarandi(self, klasorler):
+        self.tarihSecCBox.blockSignals(True)
+        self.tarihSecCBox.clear()
+        self.tarihSecCBox.addItem("Geçmiş Rapor Seçin...", userData=None)
+        for combo_text, klasor_yolu in klasorler:
+            self.tarihSecCBox.addItem(combo_text, userData=klasor_yolu)
+        self.tarihSecCBox.blockSignals(False)
 
     def set_database_type(self, db_type):
         """
@@ -408,10 +1294,12 @@ class MainWindow(QMainWindow):
         """
         print(f"Veritabanı türü '{db_type}' olarak ayarlandı.")
 
-        # Ayarları sıfırla
+        # Ayarları sıfırla (eski bağlantının havuzunu kapat)
+        core.dispose_engine(self.db_config)
         self.db_config = {'type': db_type}
         self.target_table = None
-        self.df = pd.DataFrame()
+        self.secili_sutunlar = None
+        self.df = None
         self.tabloyu_doldur(self.df)
 
         # Durumu güncelle (kırmızı ışık, kilitli butonlar)
@@ -440,9 +1328,13 @@ class MainWindow(QMainWindow):
         # Diyaloğu aç ve kullanıcının 'OK'e basmasını bekle
         if dialog.exec():
             # Kullanıcı OK'e bastı
-            self.db_config = dialog.get_config() # Tüm ayarları al (path veya host/user/pass)
+            yeni_config = dialog.get_config() # Tüm ayarları al (path veya host/user/pass)
+            if yeni_config != self.db_config:
+                core.dispose_engine(self.db_config) # Ayarlar değişti, eski havuzu kapat
+            self.db_config = yeni_config
             print(f"Bağlantı ayarları alındı: {self.db_config}")
             self.target_table = None # Yeni DB seçildi, tabloyu sıfırla
+            self.secili_sutunlar = None
 
             # Şimdi bu yeni ayarlarla tablo listesini yüklemeyi dene
             self.load_tables_from_db()
@@ -450,11 +1342,36 @@ class MainWindow(QMainWindow):
             # Kullanıcı İptal'e bastı
             print("Bağlantı ayarları iptal edildi.")
 
+    # --- Sorgu tanılama ---
+    def _on_explain_istegi(self, kayit):
+        """Paneldeki seçili sorgunun yürütme planını arka planda alır."""
+        if not self.db_config or core.config_key(self.db_config)[:12] != kayit.get('connection'):
+            QMessageBox.warning(self, "Plan Alınamadı",
+                "Bu sorgu şu anki bağlantıya ait değil. Plan yalnızca aktif bağlantının sorguları için alınabilir.")
+            return
+        self.show_loading_dialog("Sorgu planı alınıyor...")
+        worker = Worker(core.explain_query, self.db_config, kayit['sql'], kayit.get('params'))
+        worker.signals.finished.connect(lambda _plan: self.close_loading_dialog())
+        worker.signals.error.connect(self._on_explain_hatasi)
+        self.threadpool.start(worker)
+
+    def _on_explain_hatasi(self, hata_mesaji):
+        self.close_loading_dialog()
+        QMessageBox.warning(self, "Plan Alınamadı", hata_mesaji)
+
+    def closeEvent(self, event):
+        """Pencere kapanırken tüm veritabanı bağlantı havuzlarını kapatır."""
+        diagnostics.remove_listener(self.tanilama_kaydi.emit)
+        self._onyuklemeyi_iptal_et()
+        self.threadpool.waitForDone(3000)
+        if 'src.core.database' in sys.modules:  # Hiç bağlanılmadıysa veritabanı katmanı yüklenmez
+            core.dispose_all_engines()
+        super().closeEvent(event)
+
 
 # --- Ana Uygulama Başlangıcı ---
 if __name__ == '__main__':
     app = QApplication(sys.argv)
-    register_pdf_fonts()
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,292 @@
+# src/ui/models.py
+import bisect
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+
+from src.core.browse import row_key
+
+
+def _column_values(series):
+    """
+    Hücre okumaları için sütun dizisi. Kategori, Arrow ve tarih sütunları pandas dizisi olarak
+    tutulur: nesne dizisine açılmazlar (bellek), tarihler Timestamp olarak okunur.
+    """
+    if (isinstance(series.dtype, (pd.CategoricalDtype, pd.ArrowDtype))
+            or pd.api.types.is_datetime64_any_dtype(series.dtype)):
+        return series.array
+    return series.to_numpy()
+
+
+class DataFrameModel(QAbstractTableModel):
+    """
+    'tbl_Veri' için sanal (virtualized) tablo modeli.
+    Hücre nesnesi oluşturmaz; değerleri DataFrame'in sütun dizilerinden okur ve
+    yalnızca Qt'nin çizmek istediği hücreleri metne çevirir. Yükleme süresi
+    satır sayısından bağımsızdır.
+    Akış modunda gelen parçalar kopyalanmadan sona eklenir.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = []       # Sütun adları
+        self._numeric = []       # Sütun sayısal mı? (sıralama/hizalama için)
+        self._chunks = []        # Her parça için sütun dizileri listesi
+        self._frames = []        # Parçaların DataFrame halleri
+        self._offsets = []       # Her parçanın başladığı satır numarası
+        self._row_count = 0
+        self._df_cache = None    # dataframe() için birleştirilmiş sonuç
+        self._order = None       # Sıralama görünümü: görünen satır -> gerçek satır
+        self._key_cache = {}     # Sütun no -> (sıra numaraları, boş_mu) dizileri
+
+    # --- Veri yükleme ---
+    def set_dataframe(self, df):
+        """Modeli verilen DataFrame ile baştan kurar."""
+        self.beginResetModel()
+        self._columns = []
+        self._numeric = []
+        self._chunks = []
+        self._frames = []
+        self._offsets = []
+        self._row_count = 0
+        self._df_cache = None
+        self._order = None
+        self._key_cache = {}
+        if df is not None and len(df.columns):
+            self._set_columns(df)
+            self._add_chunk(df)
+        self.endResetModel()
+
+    def append_frame(self, df):
+        """Akış modunda gelen parçayı mevcut satırların sonuna ekler."""
+        if df is None or df.empty:
+            return
+        if not self._columns:
+            self.set_dataframe(df)
+            return
+        first = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(df) - 1)
+        self._add_chunk(df)
+        if self._order is not None:
+            # Sıralı görünümde yeni satırlar sona eklenir
+            self._order = np.concatenate([self._order, np.arange(first, self._row_count)])
+        self.endInsertRows()
+
+    def dataframe(self):
+        """Modeldeki tüm satırları tek bir DataFrame olarak döndürür."""
+        if self._df_cache is None:
+            if not self._frames:
+                self._df_cache = pd.DataFrame(columns=self._columns)
+            elif len(self._frames) == 1:
+                self._df_cache = self._frames[0]
+            else:
+                self._df_cache = pd.concat(self._frames, ignore_index=True)
+        return self._df_cache
+
+    def _set_columns(self, df):
+        self._columns = [str(c) for c in df.columns]
+        self._numeric = [
+            pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+            for dtype in df.dtypes
+        ]
+
+    def _add_chunk(self, df):
+        arrays = [_column_values(df.iloc[:, j]) for j in range(len(df.columns))]
+        self._chunks.append(arrays)
+        self._frames.append(df)
+        self._offsets.append(self._row_count)
+        self._row_count += len(df)
+        self._df_cache = None
+        self._key_cache = {}
+
+    def _value(self, row, column):
+        if self._order is not None:
+            row = self._order[row]
+        chunk_index = bisect.bisect_right(self._offsets, row) - 1
+        return self._chunks[chunk_index][column][row - self._offsets[chunk_index]]
+
+    # --- QAbstractTableModel arayüzü ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self._value(index.row(), index.column())
+            if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+                return ""
+            return str(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole and self._numeric[index.column()]:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section] if section < len(self._columns) else None
+        return str(section + 1)
+
+    # --- Sıralama görünümü ---
+    def sort_key_cache(self):
+        """
+        Bu veri için hesaplanan sütun sıralama anahtarlarının saklandığı sözlük.
+        Veri değiştiğinde yeni (boş) bir sözlük verilir; eski işler eskisine yazar.
+        """
+        return self._key_cache
+
+    def set_order(self, order, key_cache=None):
+        """
+        Arka planda hesaplanan permütasyon dizisini görünüm olarak uygular.
+        Hesaplama bittiğinde veri değişmişse (farklı anahtar önbelleği) sonuç yok sayılır.
+        """
+        if key_cache is not None and key_cache is not self._key_cache:
+            return False
+        if order is not None and len(order) != self._row_count:
+            return False
+        self.layoutAboutToBeChanged.emit()
+        self._order = order
+        self.layoutChanged.emit()
+        return True
+
+
+class KeysetPageModel(QAbstractTableModel):
+    """
+    Gözatma modu için tembel (lazy) doldurulan tablo modeli.
+    Kullanıcı aşağı kaydırdıkça sayfalar imleç (keyset) ile istenir. Bellekte en fazla
+    'max_pages' sayfa tutulur; atılan bir sayfaya geri dönülürse, saklanan başlangıç
+    imleciyle yeniden çekilir. Tablo ne kadar büyük olursa olsun bellek kullanımı sabittir.
+
+    Sayfa isteklerini 'page_requested' sinyaliyle bildirir; sonucu page_loaded ile alır.
+    """
+
+    page_requested = pyqtSignal(int, object, int)  # (sayfa_no, imleç, nesil)
+
+    def __init__(self, page_size, max_pages=5, parent=None):
+        super().__init__(parent)
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.order_columns = []
+        self.descending = False
+        self._generation = 0
+        self._reset_state()
+
+    def _reset_state(self):
+        self._columns = []
+        self._pages = OrderedDict()  # sayfa_no -> DataFrame (LRU)
+        self._page_after = {0: None}  # sayfa_no -> o sayfayı getiren imleç
+        self._pending = set()
+        self._row_count = 0
+        self._exhausted = False
+
+    def reset(self, order_columns, descending=False):
+        """Yeni bir sıralama ile baştan başlar ve ilk sayfayı ister."""
+        self.beginResetModel()
+        self._generation += 1
+        self.order_columns = list(order_columns)
+        self.descending = descending
+        self._reset_state()
+        self.endResetModel()
+        self._request_page(0)
+
+    def clear(self):
+        self.beginResetModel()
+        self._generation += 1
+        self._reset_state()
+        self._exhausted = True
+        self.endResetModel()
+
+    def _request_page(self, page_no):
+        if page_no in self._pending:
+            return
+        self._pending.add(page_no)
+        self.page_requested.emit(page_no, self._page_after[page_no], self._generation)
+
+    def page_loaded(self, page_no, generation, df):
+        """(Callback) Worker'dan gelen sayfayı modele yerleştirir; eski nesil sonuçları yok sayar."""
+        if generation != self._generation:
+            return
+        self._pending.discard(page_no)
+
+        if not self._columns:
+            if df.empty:
+                self._exhausted = True
+                return
+            self.beginResetModel()
+            self._columns = [str(c) for c in df.columns]
+            self.endResetModel()
+
+        self._pages[page_no] = df
+        self._pages.move_to_end(page_no)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+
+        if len(df) and (page_no + 1) not in self._page_after:
+            self._page_after[page_no + 1] = row_key(df, self.order_columns)
+
+        first = page_no * self.page_size
+        if first + len(df) > self._row_count:
+            # Yeni sayfa: satırları sona ekle
+            self.beginInsertRows(QModelIndex(), self._row_count, first + len(df) - 1)
+            self._row_count = first + len(df)
+            self.endInsertRows()
+            if len(df) < self.page_size:
+                self._exhausted = True
+        else:
+            # Bellekten atılıp yeniden çekilen sayfa: görünümü yenile
+            last = min(first + len(df), self._row_count) - 1
+            if last >= first:
+                self.dataChanged.emit(self.index(first, 0), self.index(last, len(self._columns) - 1))
+
+    def page_failed(self, page_no, generation):
+        if generation == self._generation:
+            self._pending.discard(page_no)
+
+    # --- Tembel yükleme ---
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return False
+        next_page = self._row_count // self.page_size
+        return next_page in self._page_after and next_page not in self._pending
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self._request_page(self._row_count // self.page_size)
+
+    # --- QAbstractTableModel arayüzü ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        page_no, offset = divmod(index.row(), self.page_size)
+        df = self._pages.get(page_no)
+        if df is None:
+            # Sayfa bellekten atılmış: yeniden iste, gelene kadar yer tutucu göster
+            self._request_page(page_no)
+            return "…"
+        self._pages.move_to_end(page_no)
+        if offset >= len(df):
+            return ""
+        value = df.iat[offset, index.column()]
+        if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+            return ""
+        return str(value)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section] if section < len(self._columns) else None
+        return str(section + 1)
+